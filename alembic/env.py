@@ -8,6 +8,7 @@ from backend.app.database.base import Base  # Ensure this imports Base from the
 from alembic import context
 from backend.app.models.entry_inventory_model import EntryInventory
 from backend.app.models.to_event_inventry_model import ToEventInventory
+from backend.app.models.inventory_commitment_model import InventoryCommitment
 
 EntryInventory=EntryInventory()
 ToEventInventory=ToEventInventory()
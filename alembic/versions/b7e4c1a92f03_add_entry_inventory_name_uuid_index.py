@@ -0,0 +1,44 @@
+"""add entry_inventory (coalesce(name, ''), uuid) index for keyset pagination
+
+Revision ID: b7e4c1a92f03
+Revises: 6d80998eb28f
+Create Date: 2026-10-17 09:12:40.118204
+
+Pages compare `(coalesce(name, ''), uuid)` row values: a NULL name would
+make the comparison NULL, dropping unnamed entries from every page after the
+first, so the index is on the same expression.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c1a92f03'
+down_revision: Union[str, None] = '6d80998eb28f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction and avoids blocking writes while the index builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_entry_inventory_name_uuid',
+            'entry_inventory',
+            [sa.text("coalesce(name, '')"), 'uuid'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_entry_inventory_name_uuid',
+            table_name='entry_inventory',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
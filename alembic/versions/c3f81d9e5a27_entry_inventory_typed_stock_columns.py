@@ -0,0 +1,136 @@
+"""entry_inventory: native integer / numeric / boolean stock columns
+
+Revision ID: c3f81d9e5a27
+Revises: b7e4c1a92f03
+Create Date: 2026-10-17 14:05:12.530917
+
+Quantities, amounts and status flags were stored as strings. A plain
+ALTER COLUMN ... TYPE rewrites the table under an ACCESS EXCLUSIVE lock, so
+the conversion runs online instead:
+
+1. add typed shadow columns (metadata only, no rewrite)
+2. a trigger keeps the shadow columns in step with concurrent writes
+3. existing rows are backfilled in short batches, each committed on its own
+4. one brief transaction drops the trigger and old columns and renames the
+   shadow columns into place
+
+Values that do not parse as numbers become NULL; flags are true only for
+"true" / "t" / "yes" / "y" / "1" (case-insensitive).
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f81d9e5a27'
+down_revision: Union[str, None] = 'b7e4c1a92f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = 'entry_inventory'
+BATCH_SIZE = 5000
+
+QUANTITY_COLUMNS = ('total_quantity', 'repair_quantity', 'issued_qty', 'balance_qty')
+AMOUNT_COLUMNS = ('purchase_amount', 'repair_cost', 'total_rent')
+FLAG_COLUMNS = ('on_rent', 'rented_inventory_returned', 'on_event', 'in_office', 'in_warehouse')
+ALL_COLUMNS = QUANTITY_COLUMNS + AMOUNT_COLUMNS + FLAG_COLUMNS
+
+# Up to 9 integer digits, so every match fits both integer and numeric(12, 2)
+_NUMBER_PATTERN = r"'^\s*[-+]?([0-9]{1,9}(\.[0-9]*)?|\.[0-9]+)\s*$'"
+
+
+def _converted(column: str, source: str) -> str:
+    """SQL expression converting the string `source.column` to its new type"""
+    value = f"{source}.{column}"
+    if column in FLAG_COLUMNS:
+        return f"coalesce(lower(trim({value})) IN ('true', 't', 'yes', 'y', '1'), false)"
+    number = f"trim({value})::numeric"
+    if column in QUANTITY_COLUMNS:
+        number = f"round({number})::integer"
+    else:
+        number = f"round({number}, 2)"
+    return f"CASE WHEN {value} ~ {_NUMBER_PATTERN} THEN {number} END"
+
+
+def upgrade() -> None:
+    # 1. Shadow columns; a constant default is metadata-only on PostgreSQL 11+
+    for column in QUANTITY_COLUMNS:
+        op.add_column(TABLE, sa.Column(f'{column}_new', sa.Integer(), nullable=True))
+    for column in AMOUNT_COLUMNS:
+        op.add_column(TABLE, sa.Column(f'{column}_new', sa.Numeric(12, 2), nullable=True))
+    for column in FLAG_COLUMNS:
+        op.add_column(
+            TABLE,
+            sa.Column(f'{column}_new', sa.Boolean(), nullable=False, server_default=sa.false())
+        )
+
+    # 2. Rows written while the backfill runs convert themselves
+    assignments = ";\n        ".join(f"NEW.{column}_new := {_converted(column, 'NEW')}" for column in ALL_COLUMNS)
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION entry_inventory_typed_columns_sync() RETURNS trigger AS $$
+    BEGIN
+        {assignments};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"""
+    CREATE TRIGGER entry_inventory_typed_columns_sync
+    BEFORE INSERT OR UPDATE ON {TABLE}
+    FOR EACH ROW EXECUTE FUNCTION entry_inventory_typed_columns_sync()
+    """)
+
+    # 3. Backfill in keyset batches, each in its own transaction so row locks stay short
+    set_clause = ", ".join(f"{column}_new = {_converted(column, 'e')}" for column in ALL_COLUMNS)
+    if context.is_offline_mode():
+        op.execute(f"UPDATE {TABLE} AS e SET {set_clause}")
+    else:
+        with op.get_context().autocommit_block():
+            connection = op.get_bind()
+            batch = sa.text(f"""
+                WITH batch AS (
+                    SELECT uuid FROM {TABLE}
+                    WHERE uuid > :after
+                    ORDER BY uuid
+                    LIMIT :batch_size
+                )
+                UPDATE {TABLE} AS e SET {set_clause}
+                FROM batch
+                WHERE e.uuid = batch.uuid
+                RETURNING e.uuid
+            """)
+            after = ''
+            while True:
+                converted = connection.execute(batch, {'after': after, 'batch_size': BATCH_SIZE}).scalars().all()
+                if not converted:
+                    break
+                after = max(converted)
+
+    # 4. Swap in one short transaction; give up instead of queueing behind long readers
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(f"DROP TRIGGER entry_inventory_typed_columns_sync ON {TABLE}")
+    op.execute("DROP FUNCTION entry_inventory_typed_columns_sync()")
+    for column in ALL_COLUMNS:
+        op.drop_column(TABLE, column)
+        op.alter_column(TABLE, f'{column}_new', new_column_name=column)
+
+
+def downgrade() -> None:
+    # Rewrites the table; only meant for rolling back a fresh deploy
+    for column in QUANTITY_COLUMNS + AMOUNT_COLUMNS:
+        op.alter_column(
+            TABLE, column,
+            type_=sa.String(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::text",
+        )
+    for column in FLAG_COLUMNS:
+        op.alter_column(TABLE, column, server_default=None)
+        op.alter_column(
+            TABLE, column,
+            type_=sa.String(),
+            existing_nullable=False,
+            postgresql_using=f"CASE WHEN {column} THEN 'true' ELSE 'false' END",
+        )
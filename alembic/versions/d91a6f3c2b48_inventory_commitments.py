@@ -0,0 +1,104 @@
+"""inventory_commitments: materialised stock commitments of event items
+
+Revision ID: d91a6f3c2b48
+Revises: c3f81d9e5a27
+Create Date: 2026-10-17 16:40:03.214655
+
+One row per dated event item matched to a stock entry by normalised name
+(same sno preferred, then lowest inventory_id), covering setup_date through
+event_date. Kept current by the application on upload and entry writes;
+backfilled here from the existing projects with the same rule.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91a6f3c2b48'
+down_revision: Union[str, None] = 'c3f81d9e5a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keep in step with RELEASED_STATUSES in backend/app/curd/availability_curd.py
+RELEASED_STATUSES = (
+    'cancelled', 'rejected', 'returned', 'withdrawn', 'expired',
+    'failed', 'inactive', 'completed', 'closed',
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'inventory_commitments',
+        sa.Column('item_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('project_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('entry_uuid', sa.String(), nullable=False),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('end_date', sa.Date(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['item_id'], ['inventory_items.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['project_id'], ['to_event_inventory.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['entry_uuid'], ['entry_inventory.uuid'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('item_id'),
+    )
+    op.create_index('ix_inventory_commitments_project_id', 'inventory_commitments', ['project_id'], unique=False)
+    op.create_index(
+        'ix_inventory_commitments_entry_dates', 'inventory_commitments',
+        ['entry_uuid', 'start_date', 'end_date'], unique=False
+    )
+
+    released = ", ".join(f"'{status}'" for status in RELEASED_STATUSES)
+    op.execute(f"""
+        INSERT INTO inventory_commitments (item_id, project_id, entry_uuid, start_date, end_date, quantity)
+        SELECT DISTINCT ON (i.id)
+            i.id, p.id, e.uuid,
+            LEAST(p.setup_date, p.event_date), GREATEST(p.setup_date, p.event_date),
+            GREATEST(COALESCE(i.quantity, 1), 0)  -- same clamp as availability_curd._quantity
+        FROM inventory_items AS i
+        JOIN to_event_inventory AS p ON p.id = i.project_id
+        JOIN entry_inventory AS e ON lower(trim(e.name)) = lower(trim(i.name))
+        WHERE COALESCE(p.setup_date, p.event_date) IS NOT NULL
+          AND trim(i.name) <> ''
+          AND lower(trim(COALESCE(i.status, ''))) NOT IN ({released})
+        ORDER BY i.id, COALESCE(e.sno = i.sno, false) DESC, e.inventory_id
+    """)
+
+    # Lookups used by the incremental refresh; CONCURRENTLY keeps item uploads unblocked
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_inventory_items_project_id',
+            'inventory_items',
+            ['project_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_inventory_items_name_key',
+            'inventory_items',
+            [sa.text('lower(trim(name))')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_inventory_items_name_key',
+            table_name='inventory_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_inventory_items_project_id',
+            table_name='inventory_items',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_index('ix_inventory_commitments_entry_dates', table_name='inventory_commitments')
+    op.drop_index('ix_inventory_commitments_project_id', table_name='inventory_commitments')
+    op.drop_table('inventory_commitments')
@@ -0,0 +1,65 @@
+"""inventory_commitments: GiST index on (entry_uuid, daterange) for overlap lookups
+
+Revision ID: e6b04d7f1c93
+Revises: d91a6f3c2b48
+Create Date: 2026-10-17 18:22:47.905118
+
+The btree on (entry_uuid, start_date, end_date) could only bound an overlap
+test by start_date, so `end_date >= :start` filtered every past commitment of
+the entry. A GiST index on the inclusive daterange answers `&&` directly.
+entry_uuid is a scalar column in a GiST index, which needs btree_gist
+(shipped with PostgreSQL contrib; creating it needs the CREATE privilege
+on the database).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b04d7f1c93'
+down_revision: Union[str, None] = 'd91a6f3c2b48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # CONCURRENTLY keeps uploads and entry writes (which refresh commitments) unblocked
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_inventory_commitments_entry_window',
+            'inventory_commitments',
+            ['entry_uuid', sa.text("daterange(start_date, end_date, '[]')")],
+            unique=False,
+            postgresql_using='gist',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_inventory_commitments_entry_dates',
+            table_name='inventory_commitments',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    # btree_gist is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_inventory_commitments_entry_dates',
+            'inventory_commitments',
+            ['entry_uuid', 'start_date', 'end_date'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_inventory_commitments_entry_window',
+            table_name='inventory_commitments',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
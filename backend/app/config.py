@@ -13,6 +13,37 @@ Base = declarative_base()
 BASE_URL = os.getenv("BASE_URL", "http://localhost:8000")
 
 
+# Largest page any list endpoint returns
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 500))
+
+# Largest number of items accepted by one bulk create request
+MAX_BULK_ITEMS = int(os.getenv("MAX_BULK_ITEMS", 1000))
+
+# In-process cache for entry lookups by inventory_id / product_id / bar_code (per worker; TTL 0 disables)
+LOOKUP_CACHE_SIZE = int(os.getenv("LOOKUP_CACHE_SIZE", 10000))
+LOOKUP_CACHE_TTL_SECONDS = float(os.getenv("LOOKUP_CACHE_TTL_SECONDS", 60))
+
+# Stock rollups are cached in Redis until the next inventory write (the TTL only bounds missed invalidations)
+STOCK_SUMMARY_CACHE_TTL_SECONDS = int(os.getenv("STOCK_SUMMARY_CACHE_TTL_SECONDS", 300))
+
+# Availability lookups: default and maximum number of days per request
+AVAILABILITY_DEFAULT_DAYS = int(os.getenv("AVAILABILITY_DEFAULT_DAYS", 30))
+AVAILABILITY_MAX_DAYS = int(os.getenv("AVAILABILITY_MAX_DAYS", 366))
+
+# Fuzzy name search: in-process index (per worker) topped up from `updated_at` and rebuilt to drop deleted rows
+FUZZY_INDEX_REFRESH_SECONDS = float(os.getenv("FUZZY_INDEX_REFRESH_SECONDS", 30))
+FUZZY_INDEX_REBUILD_SECONDS = float(os.getenv("FUZZY_INDEX_REBUILD_SECONDS", 900))
+FUZZY_SEARCH_MIN_SCORE = float(os.getenv("FUZZY_SEARCH_MIN_SCORE", 60))
+FUZZY_SEARCH_MAX_RESULTS = int(os.getenv("FUZZY_SEARCH_MAX_RESULTS", 50))
+
+# Barcode images: rendered lazily into a size-bounded LRU disk cache by a pool of render processes
+BARCODE_CACHE_DIR = os.getenv("BARCODE_CACHE_DIR", "static/barcodes/cache")
+BARCODE_CACHE_MAX_BYTES = int(os.getenv("BARCODE_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+BARCODE_RENDER_WORKERS = int(os.getenv("BARCODE_RENDER_WORKERS", 2))
+BARCODE_CACHE_MAX_AGE = int(os.getenv("BARCODE_CACHE_MAX_AGE", 31536000))  # Browser cache lifetime (seconds)
+BARCODE_DEFAULT_DPI = int(os.getenv("BARCODE_DEFAULT_DPI", 300))
+BARCODE_DPI_CHOICES = [int(dpi) for dpi in os.getenv("BARCODE_DPI_CHOICES", "150,300,600").split(",")]
+
 # Redis Configuration
 REDIS_HOST = os.getenv("REDIS_HOST", "192.168.192.3")
 REDIS_PORT = os.getenv("REDIS_PORT", "6379")
@@ -20,6 +51,15 @@ REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
 REDIS_DB = os.getenv("REDIS_DB", "1")
 REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
 
+# Rows read per server-side cursor fetch and written per Redis pipeline during `/sync/`
+REDIS_SYNC_CHUNK_SIZE = int(os.getenv("REDIS_SYNC_CHUNK_SIZE", 1000))
+
+# Projects written per INSERT ... ON CONFLICT statement when uploading staged events
+UPLOAD_BATCH_SIZE = int(os.getenv("UPLOAD_BATCH_SIZE", 500))
+
+# Seconds between retries of write-through cache updates queued while Redis was unavailable
+REDIS_OUTBOX_RETRY_SECONDS = float(os.getenv("REDIS_OUTBOX_RETRY_SECONDS", 5))
+
 # Load environment variables from .env file
 # AWS S3 Configuration
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
@@ -41,6 +81,15 @@ CONTACT_EMAIL = os.getenv("CONTACT_EMAIL", "your_email@gmail.com")
 # Server IP Configuration
 SERVER_IP = os.getenv("SERVER_IP", "localhost")
 
+# Production launcher (`python -m backend.app.server`): bind address and worker processes (defaults to one per core)
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", 8000))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+# Startup cache warmup (full inventory sync into Redis), run by one worker only
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
+WARMUP_LOCK_TTL_SECONDS = float(os.getenv("WARMUP_LOCK_TTL_SECONDS", 600))
+
 # Optional: PostgreSQL connection details for admin operations (if separate)
 POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
 POSTGRES_USER = os.getenv("POSTGRES_USER", "postgres")
@@ -50,3 +99,28 @@ POSTGRES_PORT = int(os.getenv("POSTGRES_PORT", 5432))
 SYNC_DB_URL=f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 ASYNC_DB_URL=f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
+# Run the API on the asyncpg engine only; the psycopg2 engine is never created
+DB_ASYNC_ONLY = os.getenv("DB_ASYNC_ONLY", "true").lower() == "true"
+
+# Connection pool settings (applied to both engines)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # Seconds before a connection is replaced
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# Statement caching: SQLAlchemy compiled-SQL cache and asyncpg prepared statement cache (0 disables, e.g. behind pgbouncer)
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", 500))
+DB_PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", 100))
+
+# SQL logging: full echo is for debugging only; otherwise only sampled slow queries are logged
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", 200))
+DB_SLOW_QUERY_SAMPLE_RATE = float(os.getenv("DB_SLOW_QUERY_SAMPLE_RATE", 1.0))
+
+
+# Startup / readiness dependency checks: attempts, exponential backoff bounds and per-probe timeout (seconds)
+HEALTH_CHECK_RETRIES = int(os.getenv("HEALTH_CHECK_RETRIES", 5))
+HEALTH_CHECK_BASE_DELAY = float(os.getenv("HEALTH_CHECK_BASE_DELAY", 0.5))
+HEALTH_CHECK_MAX_DELAY = float(os.getenv("HEALTH_CHECK_MAX_DELAY", 5))
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", 2))
@@ -0,0 +1,355 @@
+# backend/app/curd/availability_curd.py
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import delete, insert, func, literal_column
+from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import SQLAlchemyError
+from redis.exceptions import RedisError
+from fastapi import HTTPException
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import uuid
+from backend.app.models.entry_inventory_model import EntryInventory
+from backend.app.models.to_event_inventry_model import ToEventInventory, InventoryItem
+from backend.app.models.inventory_commitment_model import InventoryCommitment
+from backend.app.schema.availability_schema import (
+    AvailabilityDay,
+    AvailabilityOut,
+    CommitmentOut,
+    BookingCheckIn,
+    BookingCheckOut,
+    BookingItemCheck
+)
+from backend.app.interface.availability_interface import AvailabilityInterface
+from backend.app.database.redisclient import redis_client
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Item statuses (case-insensitive) whose units are no longer held for the event
+RELEASED_STATUSES = {
+    "cancelled", "rejected", "returned", "withdrawn", "expired",
+    "failed", "inactive", "completed", "closed",
+}
+
+def name_key(name: Optional[str]) -> str:
+    """Normalised name an event item and a stock entry are matched on (mirrors lower(trim(name)))"""
+    return (name or '').strip().lower()
+
+def _window(setup_date: Optional[date], event_date: Optional[date]) -> Optional[Tuple[date, date]]:
+    """Inclusive days a project holds its items: setup_date to event_date"""
+    dates = [day for day in (setup_date, event_date) if day]
+    return (min(dates), max(dates)) if dates else None
+
+def _parse_date(value: Any) -> Optional[date]:
+    if not value:
+        return None
+    return value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+
+def _quantity(value: Any) -> int:
+    """Units an event item takes; items listed without a (valid) quantity take one"""
+    try:
+        return max(int(float(value)), 0) if value not in (None, '') else 1
+    except (TypeError, ValueError):
+        return 1
+
+def _overlapping(start_date: date, end_date: date):
+    """
+    Commitments whose window shares a day with [start_date, end_date]. Spelled exactly like
+    ix_inventory_commitments_entry_window, so the GiST index answers it however long the
+    entry's booking history is.
+    """
+    inclusive = literal_column("'[]'")
+    window = func.daterange(InventoryCommitment.start_date, InventoryCommitment.end_date, inclusive)
+    return window.op('&&')(func.daterange(start_date, end_date, inclusive))
+
+def _peak(commitments: List[CommitmentOut], start_date: date, end_date: date) -> Tuple[int, Optional[date]]:
+    """Most units held at once within [start_date, end_date] and the first day it happens (sweep line)"""
+    events = []
+    for commitment in commitments:
+        events.append((max(commitment.start_date, start_date), commitment.quantity))
+        events.append((min(commitment.end_date, end_date) + timedelta(days=1), -commitment.quantity))
+    peak, peak_date, held = 0, None, 0
+    # Releases sort before same-day holds, so back-to-back windows do not stack
+    for day, change in sorted(events):
+        held += change
+        if held > peak:
+            peak, peak_date = held, day
+    return peak, peak_date
+
+async def _match_entries(db: AsyncSession, items: List[Tuple[Optional[str], Optional[str]]]) -> List[Optional[Any]]:
+    """
+    Stock entry (uuid, inventory_id, name, total_quantity) each (name, sno) event item draws on, or None.
+    Items match entries with the same normalised name; among several, the one with the
+    same `sno` wins, then the lowest inventory_id.
+    """
+    keys = {name_key(name) for name, _ in items} - {''}
+    if not keys:
+        return [None] * len(items)
+    entries = await db.execute(
+        select(EntryInventory.uuid, EntryInventory.inventory_id, EntryInventory.name, EntryInventory.sno, EntryInventory.total_quantity)
+        .where(func.lower(func.trim(EntryInventory.name)).in_(keys))
+        .order_by(EntryInventory.inventory_id)
+    )
+    by_name, by_name_sno = {}, {}
+    for entry in entries.all():
+        by_name.setdefault(name_key(entry.name), entry)
+        if entry.sno:
+            by_name_sno.setdefault((name_key(entry.name), entry.sno), entry)
+    return [by_name_sno.get((name_key(name), sno)) or by_name.get(name_key(name)) for name, sno in items]
+
+# ------------------------
+# INCREMENTAL REFRESH
+# ------------------------
+
+async def refresh_project_commitments(db: AsyncSession, project_ids: Iterable[uuid.UUID]) -> int:
+    """
+    Recompute the commitments of the given projects inside the caller's transaction.
+
+    Every dated, unreleased event item is matched to a stock entry (see `_match_entries`);
+    items without a match commit nothing. Returns the rows written.
+    """
+    project_ids = list(set(project_ids))
+    if not project_ids:
+        return 0
+
+    await db.execute(delete(InventoryCommitment).where(InventoryCommitment.project_id.in_(project_ids)))
+
+    result = await db.execute(
+        select(
+            InventoryItem.id, InventoryItem.project_id, InventoryItem.sno, InventoryItem.name,
+            InventoryItem.quantity, InventoryItem.status,
+            ToEventInventory.setup_date, ToEventInventory.event_date
+        )
+        .join(ToEventInventory, InventoryItem.project_id == ToEventInventory.id)
+        .where(InventoryItem.project_id.in_(project_ids))
+    )
+    items = []
+    for row in result.all():
+        window = _window(row.setup_date, row.event_date)
+        if window and name_key(row.name) and name_key(row.status) not in RELEASED_STATUSES:
+            items.append((row, window))
+    if not items:
+        return 0
+
+    matches = await _match_entries(db, [(row.name, row.sno) for row, _ in items])
+    rows = []
+    for (row, (start_date, end_date)), entry in zip(items, matches):
+        if entry:
+            rows.append({
+                'item_id': row.id,
+                'project_id': row.project_id,
+                'entry_uuid': entry.uuid,
+                'start_date': start_date,
+                'end_date': end_date,
+                'quantity': _quantity(row.quantity),
+            })
+    if rows:
+        await db.execute(insert(InventoryCommitment), rows)
+    return len(rows)
+
+async def refresh_entry_commitments(db: AsyncSession, names: Iterable[Optional[str]]) -> int:
+    """
+    Recompute the projects whose items may match stock entries with these names
+    (call after flushing an entry create, rename or delete, inside its transaction).
+    """
+    keys = {name_key(name) for name in names} - {''}
+    if not keys:
+        return 0
+    result = await db.execute(
+        select(InventoryItem.project_id)
+        .where(func.lower(func.trim(InventoryItem.name)).in_(keys))
+        .distinct()
+    )
+    return await refresh_project_commitments(db, result.scalars().all())
+
+# ------------------------
+# READS
+# ------------------------
+
+class AvailabilityService(AvailabilityInterface):
+    """Committed / free stock per day, read from the materialised commitments"""
+
+    async def get_availability(
+        self, db: AsyncSession, inventory_id: str, from_date: date, to_date: date
+    ) -> Optional[AvailabilityOut]:
+        try:
+            entry = (await db.execute(
+                select(EntryInventory.uuid, EntryInventory.inventory_id, EntryInventory.name, EntryInventory.total_quantity)
+                .where(EntryInventory.inventory_id == inventory_id)
+            )).one_or_none()
+            if entry is None:
+                return None
+
+            # Overlap lookup on ix_inventory_commitments_entry_window
+            result = await db.execute(
+                select(
+                    ToEventInventory.project_id, ToEventInventory.project_name,
+                    InventoryCommitment.start_date, InventoryCommitment.end_date, InventoryCommitment.quantity
+                )
+                .join(ToEventInventory, InventoryCommitment.project_id == ToEventInventory.id)
+                .where(
+                    InventoryCommitment.entry_uuid == entry.uuid,
+                    _overlapping(from_date, to_date)
+                )
+                .order_by(InventoryCommitment.start_date, ToEventInventory.project_id)
+            )
+            commitments = [CommitmentOut.model_validate(dict(row)) for row in result.mappings().all()]
+        except SQLAlchemyError as e:
+            logger.error(f"Database error reading availability of {inventory_id}: {e}")
+            raise HTTPException(status_code=500, detail="Database error")
+
+        # Sweep the commitment windows once instead of re-summing them per day
+        span = (to_date - from_date).days + 1
+        delta = [0] * (span + 1)
+        for commitment in commitments:
+            delta[max((commitment.start_date - from_date).days, 0)] += commitment.quantity
+            delta[min((commitment.end_date - from_date).days, span - 1) + 1] -= commitment.quantity
+
+        total = entry.total_quantity or 0
+        days: List[AvailabilityDay] = []
+        committed = 0
+        for offset in range(span):
+            committed += delta[offset]
+            days.append(AvailabilityDay(
+                date=from_date + timedelta(days=offset), committed=committed, free=total - committed
+            ))
+
+        return AvailabilityOut(
+            inventory_id=entry.inventory_id, name=entry.name, total_quantity=total,
+            from_date=from_date, to_date=to_date, days=days, commitments=commitments
+        )
+
+    async def check_booking(self, db: AsyncSession, candidate: BookingCheckIn) -> Optional[BookingCheckOut]:
+        stored = None
+        if candidate.project_id:
+            stored = await self._load_project(db, candidate.project_id)
+            if stored is None and candidate.inventory_items is None:
+                return None
+
+        window = _window(
+            candidate.setup_date or (stored or {}).get('setup_date'),
+            candidate.event_date or (stored or {}).get('event_date')
+        )
+        if not window:
+            raise HTTPException(status_code=400, detail="The candidate project has no setup_date or event_date")
+        start_date, end_date = window
+
+        if candidate.inventory_items is not None:
+            lines = [(item.name, item.sno, item.quantity) for item in candidate.inventory_items]
+        else:
+            lines = [
+                (item['name'], item['sno'], _quantity(item['quantity']))
+                for item in stored['items']
+                if name_key(item['status']) not in RELEASED_STATUSES
+            ]
+        lines = [line for line in lines if name_key(line[0]) and line[2] > 0]
+
+        try:
+            matches = await _match_entries(db, [(name, sno) for name, sno, _ in lines])
+
+            # Requested units per stock entry (several lines may draw on one entry) and per unknown name
+            requested: Dict[str, int] = {}
+            entries: Dict[str, Any] = {}
+            unmatched: Dict[str, Tuple[str, int]] = {}
+            for (name, _, quantity), entry in zip(lines, matches):
+                if entry:
+                    entries[entry.uuid] = entry
+                    requested[entry.uuid] = requested.get(entry.uuid, 0) + quantity
+                else:
+                    label, units = unmatched.get(name_key(name), (name.strip(), 0))
+                    unmatched[name_key(name)] = (label, units + quantity)
+
+            overlapping: Dict[str, List[CommitmentOut]] = {uuid: [] for uuid in entries}
+            if entries:
+                # ix_inventory_commitments_entry_window answers `&&` (GiST cannot take the IN list itself, so
+                # that filters the commitments overlapping the window, never the entries' past); the candidate's own
+                # commitments are left out so a re-planned project does not conflict with itself
+                query = (
+                    select(
+                        InventoryCommitment.entry_uuid,
+                        ToEventInventory.project_id, ToEventInventory.project_name,
+                        InventoryCommitment.start_date, InventoryCommitment.end_date, InventoryCommitment.quantity
+                    )
+                    .join(ToEventInventory, InventoryCommitment.project_id == ToEventInventory.id)
+                    .where(
+                        InventoryCommitment.entry_uuid.in_(list(entries)),
+                        _overlapping(start_date, end_date)
+                    )
+                    .order_by(InventoryCommitment.start_date, ToEventInventory.project_id)
+                )
+                if candidate.project_id:
+                    query = query.where(ToEventInventory.project_id.is_distinct_from(candidate.project_id))
+                for row in (await db.execute(query)).mappings().all():
+                    overlapping[row['entry_uuid']].append(CommitmentOut.model_validate(dict(row)))
+        except SQLAlchemyError as e:
+            logger.error(f"Database error checking booking {candidate.project_id or ''}: {e}")
+            raise HTTPException(status_code=500, detail="Database error")
+
+        items: List[BookingItemCheck] = []
+        for entry_uuid, entry in entries.items():
+            peak, peak_date = _peak(overlapping[entry_uuid], start_date, end_date)
+            total = entry.total_quantity or 0
+            items.append(BookingItemCheck(
+                name=entry.name, inventory_id=entry.inventory_id, requested=requested[entry_uuid],
+                total_quantity=total, peak_committed=peak, peak_date=peak_date,
+                shortfall=max(peak + requested[entry_uuid] - total, 0),
+                overlapping=overlapping[entry_uuid]
+            ))
+        for name, units in unmatched.values():
+            # Nothing in stock carries the name
+            items.append(BookingItemCheck(
+                name=name, requested=units, total_quantity=0, peak_committed=0,
+                shortfall=units, overlapping=[]
+            ))
+
+        projects = {c.project_id for commitments in overlapping.values() for c in commitments if c.project_id}
+        return BookingCheckOut(
+            project_id=candidate.project_id, start_date=start_date, end_date=end_date,
+            ok=all(item.shortfall == 0 for item in items),
+            overlapping_projects=sorted(projects), items=items
+        )
+
+    async def _load_project(self, db: AsyncSession, project_id: str) -> Optional[Dict[str, Any]]:
+        """Dates and items of a staged project from Redis, else of the uploaded one"""
+        try:
+            raw = await redis_client.get(f"to_event_inventory:{project_id}")
+        except (RedisError, OSError) as e:
+            logger.warning(f"Redis unavailable while loading project {project_id}, using the database: {e}")
+            raw = None
+        if raw:
+            project = json.loads(raw)
+            if isinstance(project, list):
+                project = project[0] if project else {}
+            return {
+                'setup_date': _parse_date(project.get('setup_date')),
+                'event_date': _parse_date(project.get('event_date')),
+                'items': [
+                    {field: item.get(field) for field in ('name', 'sno', 'quantity', 'status')}
+                    for item in project.get('inventory_items') or []
+                ],
+            }
+
+        try:
+            result = await db.execute(
+                select(ToEventInventory)
+                .options(selectinload(ToEventInventory.items))
+                .where(ToEventInventory.project_id == project_id)
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Database error loading project {project_id}: {e}")
+            raise HTTPException(status_code=500, detail="Database error")
+        row = result.scalar_one_or_none()
+        if not row:
+            return None
+        return {
+            'setup_date': row.setup_date,
+            'event_date': row.event_date,
+            'items': [
+                {'name': item.name, 'sno': item.sno, 'quantity': item.quantity, 'status': item.status}
+                for item in row.items
+            ],
+        }
@@ -0,0 +1,156 @@
+# backend/app/curd/barcode_curd.py
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from backend.app.models.entry_inventory_model import EntryInventory
+from backend.app.models.to_event_inventry_model import ToEventInventory
+from backend.app.database.redisclient import redis_client
+from backend.app.schema.barcode_schema import BarcodeImageOut
+from backend.app.interface.barcode_interface import BarcodeImageInterface
+from backend.app.curd.scan_curd import ScanService
+from backend.app.curd.availability_curd import name_key
+from backend.app.database.redis_scan_index import sign_code
+from backend.app.utils.barcode_renderer import barcode_renderer
+from backend.app import config
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+class BarcodeImageService(BarcodeImageInterface):
+    """Render label images in the process pool and resolve them for serving"""
+
+    def __init__(self, base_url: str = config.BASE_URL, renderer = barcode_renderer):
+        self.base_url = base_url
+        self.renderer = renderer
+
+    def image_url(self, bar_code: str, unique_code: str, fmt: str = "png") -> str:
+        """Lazy image URL; nothing is rendered until it is first requested"""
+        return f"{self.base_url}/api/v1/barcodes/{bar_code}_{unique_code}.{fmt}"
+
+    async def render_for_inventory_ids(self, db: AsyncSession, inventory_ids: List[str]) -> List[BarcodeImageOut]:
+        try:
+            result = await db.execute(
+                select(EntryInventory.inventory_id, EntryInventory.bar_code, EntryInventory.unique_code)
+                .where(EntryInventory.inventory_id.in_(inventory_ids))
+            )
+            codes = {row.inventory_id: (row.bar_code, row.unique_code) for row in result}
+        except SQLAlchemyError as e:
+            logger.error(f"Database error loading barcodes: {e}")
+            raise HTTPException(status_code=500, detail="Database error")
+
+        # One render per distinct image, spread across the pool
+        await self.renderer.ensure_images(set(codes.values()), dpi=config.BARCODE_DEFAULT_DPI)
+
+        return [
+            BarcodeImageOut(
+                inventory_id=inventory_id, bar_code=codes[inventory_id][0],
+                image_url=self.image_url(*codes[inventory_id])
+            )
+            if inventory_id in codes else
+            BarcodeImageOut(inventory_id=inventory_id, bar_code="", message="Inventory item not found")
+            for inventory_id in inventory_ids
+        ]
+
+    async def image_path(
+        self,
+        db: AsyncSession,
+        bar_code: str,
+        unique_code: str,
+        fmt: str = "png",
+        dpi: int = config.BARCODE_DEFAULT_DPI
+    ) -> Optional[Path]:
+        path = self.renderer.cached_path(bar_code, unique_code, fmt, dpi)
+        if path:
+            return path
+
+        # Only render images for codes that really exist, so arbitrary URLs cannot fill the disk
+        scanned = await ScanService().resolve_code(db, bar_code)
+        if not scanned or not scanned.verified:
+            return None
+        owner_uuid = scanned.data.get('uuid') or scanned.data.get('id')
+        if not owner_uuid or sign_code(bar_code, str(owner_uuid)) != unique_code:
+            return None
+        return await self.renderer.ensure_image(bar_code, unique_code, fmt, dpi)
+
+    async def label_sheet_labels(
+        self,
+        db: AsyncSession,
+        inventory_ids: Optional[List[str]] = None,
+        project_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        labels: List[Dict[str, Any]] = []
+        try:
+            if project_id:
+                project = await self._load_project(db, project_id)
+                if not project:
+                    return []
+                if project.get('project_barcode'):
+                    labels.append({
+                        'code': project['project_barcode'],
+                        'title': project.get('project_name') or project.get('name') or project_id,
+                        'lines': [project_id, project.get('client_name') or ""],
+                    })
+                # Project items carry no barcode of their own; label the inventory entries they name,
+                # matched like stock commitments are (lower(trim(name)))
+                names = {name_key(name) for name in project.get('item_names', [])} - {''}
+                if not names:
+                    return labels
+                query = select(EntryInventory).where(func.lower(func.trim(EntryInventory.name)).in_(names))
+            else:
+                query = select(EntryInventory).where(EntryInventory.inventory_id.in_(inventory_ids))
+
+            entries = (await db.execute(query.order_by(EntryInventory.name))).scalars().all()
+        except SQLAlchemyError as e:
+            logger.error(f"Database error loading labels: {e}")
+            raise HTTPException(status_code=500, detail="Database error")
+
+        if inventory_ids:
+            # Keep the caller's order for explicit item lists
+            position = {inventory_id: index for index, inventory_id in enumerate(inventory_ids)}
+            entries = sorted(entries, key=lambda entry: position.get(entry.inventory_id, len(position)))
+
+        labels.extend(
+            {
+                'code': entry.bar_code,
+                'title': entry.name,
+                'lines': [entry.inventory_id, entry.product_id or ""],
+            }
+            for entry in entries if entry.bar_code
+        )
+        return labels
+
+    async def _load_project(self, db: AsyncSession, project_id: str) -> Optional[Dict[str, Any]]:
+        """Staged project from Redis, else the uploaded one from the database"""
+        try:
+            raw = await redis_client.get(f"to_event_inventory:{project_id}")
+        except (RedisError, OSError) as e:
+            logger.warning(f"Redis unavailable while loading project {project_id}, using the database: {e}")
+            raw = None
+        if raw:
+            project = json.loads(raw)
+            project['item_names'] = [item.get('name') for item in project.get('inventory_items', [])]
+            return project
+
+        result = await db.execute(
+            select(ToEventInventory)
+            .options(selectinload(ToEventInventory.items))
+            .where(ToEventInventory.project_id == project_id)
+        )
+        row = result.scalar_one_or_none()
+        if not row:
+            return None
+        return {
+            'project_barcode': row.project_barcode,
+            'project_name': row.project_name,
+            'client_name': row.client_name,
+            'item_names': [item.name for item in row.items],
+        }
@@ -2,8 +2,12 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import tuple_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from pydantic import ValidationError
 from datetime import datetime, time, timedelta, timezone
-from backend.app.models.entry_inventory_model import EntryInventory
+from time import perf_counter
+from backend.app.models.entry_inventory_model import EntryInventory, is_barcode_collision, assign_linked_codes
 from backend.app.schema.entry_inventory_schema import (
     EntryInventoryCreate, 
     EntryInventoryUpdate,
@@ -11,19 +15,67 @@ from backend.app.schema.entry_inventory_schema import (
     EntryInventorySearch,
     InventoryRedisOut,
     StoreInventoryRedis,
-    DateRangeFilter
+    DateRangeFilter,
+    EntryInventoryBulkResult,
+    EntryInventoryBulkOut,
+    FuzzyMatchOut
 )
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from backend.app.interface.entry_inverntory_interface import EntryInventoryInterface
+from backend.app.utils.pagination import encode_cursor, decode_cursor
+from backend.app.utils.lookup_cache import inventory_lookup_cache
+from backend.app.utils.name_index import fuzzy_name_index
+from backend.app.curd.stock_curd import invalidate_stock_summaries
+from backend.app.curd.availability_curd import refresh_entry_commitments
 import logging
 from fastapi import HTTPException
-from typing import List, Optional
-from backend.app.database.redisclient import redis_client
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from backend.app.database.redisclient import redis_client, inventory_index, inventory_outbox, scan_index
+from backend.app.database.redis_scan_index import RedisScanIndex, SCAN_ITEM
+from backend.app.database.database import AsyncSessionLocal
 from backend.app import config
+import json
+import csv
+import io
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Inserts retried with a fresh uuid when the generated barcode collides with a stored one
+BARCODE_ALLOCATION_ATTEMPTS = 3
+
+# Columns never included in bulk exports (the barcode signature stays server-side)
+EXPORT_EXCLUDED_COLUMNS = {'unique_code'}
+
+# Redis key holding the highest `updated_at` copied by `/sync/` (kept outside the `inventory:*` namespace)
+INVENTORY_SYNC_WATERMARK_KEY = "sync:inventory:watermark"
+
+# Alphabetical sort key served by ix_entry_inventory_name_uuid; unnamed entries sort first instead of breaking keyset pages
+SORT_NAME = func.coalesce(EntryInventory.name, '')
+
+def _lookup_keys(entry) -> List[tuple]:
+    """In-process cache keys that may hold `entry` (a model instance or a row dict)"""
+    get = entry.get if isinstance(entry, dict) else lambda field: getattr(entry, field, None)
+    return [('inventory_id', get('inventory_id')), ('product_id', get('product_id')), ('bar_code', get('bar_code'))]
+
+def _scan_entry(entry) -> Optional[Tuple[str, str]]:
+    """(bar_code, scan index entry) registering `entry` (a model instance or a row dict) for scans"""
+    get = entry.get if isinstance(entry, dict) else lambda field: getattr(entry, field, None)
+    if not (get('bar_code') and get('unique_code') and get('uuid')):
+        return None
+    return get('bar_code'), RedisScanIndex.entry(
+        SCAN_ITEM, f"inventory:{get('inventory_id')}", str(get('uuid')), get('unique_code')
+    )
+
+def _name_record(entry) -> Dict[str, Any]:
+    """Fuzzy name index record of `entry` (a model instance or a row dict)"""
+    get = entry.get if isinstance(entry, dict) else lambda field: getattr(entry, field, None)
+    return {'inventory_id': get('inventory_id'), 'product_id': get('product_id'), 'name': get('name')}
+
+def _inventory_sort_value(key: str, raw: str) -> str:
+    """Extract the name used to order `inventory:*` keys in the Redis index"""
+    return json.loads(raw).get('name') or ''
+
 # ------------------------
 # CRUD OPERATIONS
 # ------------------------ 
@@ -39,28 +91,29 @@ class EntryInventoryService(EntryInventoryInterface):
             raise ValueError("Database session is None")
 
         try:
-            # Convert boolean fields to string "true"/"false"
-            for field in ['on_rent', 'rented_inventory_returned', 'on_event', 'in_office', 'in_warehouse']:
-                if field in entry_data:
-                    val = entry_data[field]
-                    if isinstance(val, bool):
-                        entry_data[field] = "true" if val else "false"
-                    elif isinstance(val, str):
-                        entry_data[field] = val.lower()
-                    else:
-                        entry_data[field] = "false"
-
             # Remove auto-generated fields if present
             for field in ['bar_code', 'unique_code', 'created_at', 'updated_at', 'uuid']:
                 entry_data.pop(field, None)
 
-            # Create new instance
-            new_entry = EntryInventory(**entry_data)
+            # The unique constraints are the only barcode guard: on a (rare) collision retry with a fresh uuid
+            for attempt in range(1, BARCODE_ALLOCATION_ATTEMPTS + 1):
+                new_entry = EntryInventory(**entry_data)
+                db.add(new_entry)
+                try:
+                    await db.flush()
+                    # Event items already planned under this name now draw on the new entry
+                    await refresh_entry_commitments(db, [new_entry.name])
+                    await db.commit()
+                    break
+                except IntegrityError as e:
+                    await db.rollback()
+                    if not is_barcode_collision(e) or attempt == BARCODE_ALLOCATION_ATTEMPTS:
+                        raise
+                    logger.warning(f"Barcode collision for {entry_data.get('inventory_id')}, retrying ({attempt}/{BARCODE_ALLOCATION_ATTEMPTS})")
 
-            db.add(new_entry)
-            await db.commit()
             await db.refresh(new_entry)
 
+            await self._write_through(new_entry)
             return new_entry
 
         except SQLAlchemyError as e:
@@ -71,6 +124,124 @@ class EntryInventoryService(EntryInventoryInterface):
             logger.error(f"Unexpected error: {str(e)}")
             raise HTTPException(status_code=400, detail=str(e))
 
+    #  Create many entries in one request (validated in one pass, inserted with multi-row statements)
+    async def create_entry_inventories_bulk(self, db: AsyncSession, items: List[dict]) -> EntryInventoryBulkOut:
+        """
+        Validate every item, allocate barcodes for the whole batch in memory and insert
+        the valid rows with `INSERT ... ON CONFLICT DO NOTHING RETURNING`, one statement
+        per `config.UPLOAD_BATCH_SIZE` rows. Invalid or duplicate items are reported per
+        item instead of failing the request.
+        """
+        results: List[Optional[EntryInventoryBulkResult]] = [None] * len(items)
+        pending: Dict[int, EntryInventory] = {}
+        seen_inventory_ids, seen_product_ids = set(), set()
+
+        # Validate all items in one pass
+        for index, raw in enumerate(items):
+            try:
+                entry_data = EntryInventoryCreate(**raw).model_dump()
+            except ValidationError as e:
+                message = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+                results[index] = EntryInventoryBulkResult(
+                    index=index, inventory_id=raw.get('inventory_id'), product_id=raw.get('product_id'),
+                    success=False, message=message
+                )
+                continue
+
+            if entry_data['inventory_id'] in seen_inventory_ids or entry_data['product_id'] in seen_product_ids:
+                results[index] = self._bulk_failure(index, entry_data, "Duplicate inventory_id or product_id in request")
+                continue
+            seen_inventory_ids.add(entry_data['inventory_id'])
+            seen_product_ids.add(entry_data['product_id'])
+
+            for field in ['bar_code', 'unique_code', 'created_at', 'updated_at', 'uuid']:
+                entry_data.pop(field, None)
+            pending[index] = EntryInventory(**entry_data)
+
+        try:
+            # One query for all ids that already exist
+            if pending:
+                existing = await db.execute(
+                    select(EntryInventory.inventory_id, EntryInventory.product_id).where(
+                        EntryInventory.inventory_id.in_(seen_inventory_ids) |
+                        EntryInventory.product_id.in_(seen_product_ids)
+                    )
+                )
+                taken = {value for row in existing.all() for value in row}
+                for index in [i for i, entry in pending.items() if entry.inventory_id in taken or entry.product_id in taken]:
+                    results[index] = self._bulk_failure(index, pending.pop(index), "Inventory ID or Product ID already exists")
+
+            created: List[dict] = []
+            columns = list(EntryInventory.__table__.columns)
+            for attempt in range(1, BARCODE_ALLOCATION_ATTEMPTS + 1):
+                if not pending:
+                    break
+                # Barcodes for the whole batch, unique within it; the unique constraints guard the rest
+                for entry in pending.values():
+                    entry.uuid = None
+                    entry.bar_code = entry.unique_code = None
+                assign_linked_codes(pending.values())
+
+                indexes = list(pending)
+                for offset in range(0, len(indexes), config.UPLOAD_BATCH_SIZE):
+                    chunk = indexes[offset:offset + config.UPLOAD_BATCH_SIZE]
+                    rows = []
+                    for index in chunk:
+                        entry = pending[index]
+                        entry.updated_at = entry.created_at
+                        rows.append({column.name: getattr(entry, column.key) for column in columns})
+                    inserted = await db.execute(
+                        pg_insert(EntryInventory).values(rows).on_conflict_do_nothing().returning(*columns)
+                    )
+                    by_inventory_id = {row['inventory_id']: dict(row) for row in inserted.mappings().all()}
+                    for index in chunk:
+                        row = by_inventory_id.get(pending[index].inventory_id)
+                        if row:
+                            pending.pop(index)
+                            created.append(row)
+                            results[index] = EntryInventoryBulkResult(
+                                index=index, inventory_id=row['inventory_id'], product_id=row['product_id'],
+                                success=True, message="Created", item=StoreInventoryRedis.model_validate(row)
+                            )
+
+                if pending and attempt < BARCODE_ALLOCATION_ATTEMPTS:
+                    logger.warning(f"{len(pending)} bulk items conflicted, retrying with fresh barcodes ({attempt}/{BARCODE_ALLOCATION_ATTEMPTS})")
+
+            # Whatever is left conflicted on every attempt (e.g. ids inserted concurrently)
+            for index, entry in pending.items():
+                results[index] = self._bulk_failure(index, entry, "Conflicts with an existing entry")
+
+            await refresh_entry_commitments(db, {row['name'] for row in created})
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Database error during bulk create: {str(e)}")
+            raise HTTPException(status_code=500, detail="Database operation failed")
+
+        for row in created:
+            inventory_lookup_cache.invalidate(*_lookup_keys(row))
+            fuzzy_name_index.upsert(_name_record(row))
+            inventory_outbox.enqueue_set(
+                f"inventory:{row['inventory_id']}",
+                StoreInventoryRedis.model_validate(row).model_dump_json(),
+                row['name'],
+                scan=_scan_entry(row)
+            )
+        if created:
+            await inventory_outbox.flush()
+            await invalidate_stock_summaries()
+
+        logger.info(f"Bulk create: {len(created)} created, {len(items) - len(created)} failed")
+        return EntryInventoryBulkOut(created=len(created), failed=len(items) - len(created), results=results)
+
+    @staticmethod
+    def _bulk_failure(index: int, entry, message: str) -> EntryInventoryBulkResult:
+        get = entry.get if isinstance(entry, dict) else lambda field: getattr(entry, field)
+        return EntryInventoryBulkResult(
+            index=index, inventory_id=get('inventory_id'), product_id=get('product_id'),
+            success=False, message=message
+        )
+
     #  Filter inventory by date range without any `IDs`
     async def get_by_date_range(
         self,
@@ -95,30 +266,89 @@ class EntryInventoryService(EntryInventoryInterface):
             raise HTTPException(status_code=500, detail="Database error")
 
     # READ ALL: Get all inventory entries
-    async def get_all_entries(self, db: AsyncSession, skip: int = 0) -> List[EntryInventoryOut]:
+    async def get_all_entries(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[EntryInventoryOut]:
+        """
+        Page through entries in alphabetical order.
+        With `cursor` (see `next_cursor`) the page starts right after the last
+        returned `(coalesce(name, ''), uuid)` using ix_entry_inventory_name_uuid, so every page
+        costs the same; `skip` is only honoured when no cursor is given.
+        """
+        limit = min(limit, config.MAX_PAGE_SIZE)
+        query = (
+            select(EntryInventory)
+            .order_by(SORT_NAME, EntryInventory.uuid)  # Alphabetical order
+            .limit(limit)
+        )
+        if cursor:
+            try:
+                name, entry_uuid = decode_cursor(cursor, "n", "u")
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            query = query.where(tuple_(SORT_NAME, EntryInventory.uuid) > tuple_(name or '', entry_uuid))
+        elif skip:
+            query = query.offset(skip)
+
         try:
-            result = await db.execute(
-                select(EntryInventory)
-                .order_by(EntryInventory.name)  # Alphabetical order
-                .offset(skip)
-            )
+            result = await db.execute(query)
             return result.scalars().all()
         except SQLAlchemyError as e:
             logger.error(f"Database error fetching entries: {e}")
             raise HTTPException(status_code=500, detail="Database error")
 
+    @staticmethod
+    def next_cursor(entries: List[EntryInventory], limit: int) -> Optional[str]:
+        """Cursor for the page after `entries`, or None when it was the last page"""
+        if not entries or len(entries) < min(limit, config.MAX_PAGE_SIZE):
+            return None
+        last = entries[-1]
+        return encode_cursor(n=last.name or '', u=last.uuid)
+
     # READ: Get an inventory entry by its inventry_id
     async def get_by_inventory_id(self, db: AsyncSession, inventory_id: str) -> Optional[EntryInventoryOut]:
+        cached = inventory_lookup_cache.get(('inventory_id', inventory_id))
+        if cached is not None:
+            return cached
         try:
             result = await db.execute(
                 select(EntryInventory)
                 .where(EntryInventory.inventory_id == inventory_id)
             )
-            return result.scalar_one_or_none()
+            entry = result.scalar_one_or_none()
+            if not entry:
+                return None
+            entry_out = EntryInventoryOut.from_orm(entry)
+            inventory_lookup_cache.set(('inventory_id', inventory_id), entry_out)
+            return entry_out
         except SQLAlchemyError as e:
             logger.error(f"Database error fetching entry: {e}")
             raise HTTPException(status_code=500, detail="Database error")
 
+    # READ: Get an inventory entry by its bar_code (scanner lookups)
+    async def get_by_bar_code(self, db: AsyncSession, bar_code: str) -> Optional[EntryInventoryOut]:
+        cached = inventory_lookup_cache.get(('bar_code', bar_code))
+        if cached is not None:
+            return cached
+        try:
+            result = await db.execute(
+                select(EntryInventory)
+                .where(EntryInventory.bar_code == bar_code)
+            )
+            entry = result.scalars().first()
+            if not entry:
+                return None
+            entry_out = EntryInventoryOut.from_orm(entry)
+            inventory_lookup_cache.set(('bar_code', bar_code), entry_out)
+            return entry_out
+        except SQLAlchemyError as e:
+            logger.error(f"Database error fetching entry by barcode: {e}")
+            raise HTTPException(status_code=500, detail="Database error")
+
     # UPDATE: Update an existing inventory entry {} {Inventory ID}
     async def update_entry(self, db: AsyncSession, inventory_id: str, update_data: EntryInventoryUpdate):
         try:
@@ -131,6 +361,9 @@ class EntryInventoryService(EntryInventoryInterface):
             if not entry:
                 return None
 
+            # Cached lookups under the old values (e.g. a replaced bar_code) must go too
+            stale_keys = _lookup_keys(entry)
+            stale_name = entry.name
             update_dict = update_data.model_dump(exclude_unset=True)
             IMMUTABLE_FIELDS = ['uuid', 'sno', 'inventory_id', 'product_id', 'created_at']
 
@@ -142,8 +375,16 @@ class EntryInventoryService(EntryInventoryInterface):
             # Always update timestamp
             entry.updated_at = datetime.now(timezone.utc)
 
+            # A rename moves event items between entries
+            if entry.name != stale_name:
+                await db.flush()
+                await refresh_entry_commitments(db, [stale_name, entry.name])
+
             await db.commit()
             await db.refresh(entry)
+
+            inventory_lookup_cache.invalidate(*stale_keys)
+            await self._write_through(entry)
             return entry
 
         except SQLAlchemyError as e:
@@ -162,15 +403,49 @@ class EntryInventoryService(EntryInventoryInterface):
             
             if not entry:
                 return False
-                
+
+            lookup_keys = _lookup_keys(entry)
             await db.delete(entry)
+            await db.flush()
+            # Its event items fall back to another entry with the same name, if any
+            await refresh_entry_commitments(db, [entry.name])
             await db.commit()
+
+            await self._invalidate(inventory_id, lookup_keys)
             return True
         except SQLAlchemyError as e:
             await db.rollback()
             logger.error(f"Database error deleting entry: {e}")
             raise HTTPException(status_code=500, detail="Database error")
         
+    # Keep `inventory:{inventory_id}` in Redis (plus the fuzzy name index and the stock summaries) current after a committed create/update
+    async def _write_through(self, entry: EntryInventory) -> None:
+        inventory_lookup_cache.invalidate(*_lookup_keys(entry))
+        fuzzy_name_index.upsert(_name_record(entry))
+        await invalidate_stock_summaries()
+        try:
+            inventory_outbox.enqueue_set(
+                f"inventory:{entry.inventory_id}",
+                StoreInventoryRedis.model_validate(entry, from_attributes=True).model_dump_json(),
+                entry.name,
+                scan=_scan_entry(entry)
+            )
+            await inventory_outbox.flush()
+        except Exception as e:
+            # The database write already succeeded; the next `/sync/` repairs the cache
+            logger.error(f"Write-through cache update failed for {entry.inventory_id}: {e}")
+
+    # Drop `inventory:{inventory_id}` from Redis (plus `lookup_keys` in the in-process cache, the fuzzy name index and the stock summaries) after a committed delete
+    async def _invalidate(self, inventory_id: str, lookup_keys: List[tuple] = ()) -> None:
+        inventory_lookup_cache.invalidate(('inventory_id', inventory_id), *lookup_keys)
+        fuzzy_name_index.remove(inventory_id)
+        await invalidate_stock_summaries()
+        try:
+            inventory_outbox.enqueue_delete(f"inventory:{inventory_id}")
+            await inventory_outbox.flush()
+        except Exception as e:
+            logger.error(f"Cache invalidation failed for {inventory_id}: {e}")
+
     # Search inventory items by various criteria {Product ID, Inventory ID, Project ID}
     async def search_entries(
         self, 
@@ -183,20 +458,29 @@ class EntryInventoryService(EntryInventoryInterface):
         - product_id
         - project_id
         """
+        if search_filter.inventory_id:
+            entry = await self.get_by_inventory_id(db, search_filter.inventory_id)
+            return [entry] if entry else []
+
+        if search_filter.product_id:
+            cached = inventory_lookup_cache.get(('product_id', search_filter.product_id))
+            if cached is not None:
+                return cached
+
         try:
             query = select(EntryInventory)
 
-            if search_filter.inventory_id:
-                query = query.where(EntryInventory.inventory_id == search_filter.inventory_id)
-            elif search_filter.product_id:
+            if search_filter.product_id:
                 query = query.where(EntryInventory.product_id == search_filter.product_id)
             else:  # project_id
                 query = query.where(EntryInventory.project_id == search_filter.project_id)
 
             result = await db.execute(query)
-            entries = result.scalars().all()
+            entries = [EntryInventoryOut.from_orm(entry) for entry in result.scalars().all()]
 
-            return [EntryInventoryOut.from_orm(entry) for entry in entries]
+            if search_filter.product_id and entries:
+                inventory_lookup_cache.set(('product_id', search_filter.product_id), entries)
+            return entries
 
         except SQLAlchemyError as e:
             logger.error(f"Database error searching entries: {str(e)}", exc_info=True)
@@ -205,57 +489,149 @@ class EntryInventoryService(EntryInventoryInterface):
                 detail="Database error while searching inventory items"
             )
         
+    # Typo-tolerant search by name, served from this worker's in-memory name index
+    async def fuzzy_search(self, db: AsyncSession, query: str, limit: int = 10) -> List[FuzzyMatchOut]:
+        await self._ensure_name_index(db)
+        started = perf_counter()
+        matches = fuzzy_name_index.search(query, limit, config.FUZZY_SEARCH_MIN_SCORE)
+        logger.info(f"Fuzzy search {query!r}: {len(matches)} matches in {(perf_counter() - started) * 1000:.1f}ms")
+        return [FuzzyMatchOut(**record, score=round(score, 1)) for record, score in matches]
+
+    async def _ensure_name_index(self, db: AsyncSession) -> None:
+        """
+        Load the name index on first use, then top it up with rows whose `updated_at`
+        is at or after the last one seen (writes from other workers) and rebuild it
+        periodically (rows deleted by other workers).
+        """
+        if not (fuzzy_name_index.needs_rebuild() or fuzzy_name_index.needs_refresh()):
+            return
+        if fuzzy_name_index.loaded and fuzzy_name_index.lock.locked():
+            return  # Another request is refreshing it; serve the names we already have
+        async with fuzzy_name_index.lock:
+            rebuild = fuzzy_name_index.needs_rebuild()
+            if not (rebuild or fuzzy_name_index.needs_refresh()):
+                return  # Another request refreshed it while we waited
+
+            # A rebuild fills a blank index, so searches keep the current names until it is complete
+            target = fuzzy_name_index.blank() if rebuild else fuzzy_name_index
+            watermark = None
+            try:
+                query = select(
+                    EntryInventory.inventory_id, EntryInventory.product_id,
+                    EntryInventory.name, EntryInventory.updated_at
+                )
+                if not rebuild and fuzzy_name_index.watermark is not None:
+                    query = query.where(EntryInventory.updated_at >= fuzzy_name_index.watermark)
+
+                # Streamed in chunks so a rebuild never holds the whole table in memory
+                result = await db.stream(query.execution_options(yield_per=config.REDIS_SYNC_CHUNK_SIZE))
+                async for rows in result.mappings().partitions():
+                    target.extend(_name_record(row) for row in rows)
+                    chunk_latest = max((row['updated_at'] for row in rows if row['updated_at']), default=None)
+                    if chunk_latest and (watermark is None or chunk_latest > watermark):
+                        watermark = chunk_latest
+            except SQLAlchemyError as e:
+                logger.error(f"Database error loading the fuzzy name index: {e}")
+                if not fuzzy_name_index.loaded:
+                    raise HTTPException(status_code=500, detail="Database error")
+                return  # Serve the names we already have
+
+            if rebuild:
+                fuzzy_name_index.install(target, watermark)
+            else:
+                fuzzy_name_index.refreshed(watermark)
+
 # ------------------------------------------------------------------------------------------------------------------------------------------------
 #  inventory entries directly from local databases  (no search) according in sequence alphabetical order after clicking `Show All` button
 # ------------------------------------------------------------------------------------------------------------------------------------------------
 
+    # Hit-rate counters of the in-process lookup cache (per worker)
+    async def lookup_cache_stats(self) -> Dict[str, Any]:
+        return inventory_lookup_cache.stats()
+
     #  Store all recored in Redis after clicking {sync} button
-    async def store_inventory_in_redis(self, db: AsyncSession) -> bool:
-        """Store all inventory entries in Redis"""
+    async def store_inventory_in_redis(
+        self,
+        db: AsyncSession,
+        chunk_size: int = config.REDIS_SYNC_CHUNK_SIZE,
+        incremental: bool = False
+    ) -> dict:
+        """
+        Stream inventory entries into Redis.
+        Rows are read through a server-side cursor `chunk_size` at a time and each
+        chunk is written with a single pipeline (MSET + index update), so memory
+        stays bounded by one chunk regardless of table size.
+
+        With `incremental=True` only rows whose `updated_at` is at or after the
+        stored watermark are fetched. Deletes already drop their keys on commit,
+        so only a full sync scans for (and removes) keys of rows that are gone.
+        Without a watermark an incremental sync falls back to a full sync.
+        """
         try:
-            # Get all entries from database
-            entries = await db.execute(select(EntryInventory))
-            entries = entries.scalars().all()
-            
-            # Convert to Redis storage format and store
-            for entry in entries:
-                redis_entry = StoreInventoryRedis(
-                    uuid=entry.uuid,
-                    sno=entry.sno,
-                    inventory_id=entry.inventory_id,
-                    product_id=entry.product_id,
-                    name=entry.name,
-                    material=entry.material,
-                    total_quantity=entry.total_quantity,
-                    manufacturer=entry.manufacturer,
-                    purchase_dealer=entry.purchase_dealer,
-                    purchase_date=entry.purchase_date,
-                    purchase_amount=entry.purchase_amount,
-                    repair_quantity=entry.repair_quantity,
-                    repair_cost=entry.repair_cost,
-                    on_rent=entry.on_rent,
-                    vendor_name=entry.vendor_name,
-                    total_rent=entry.total_rent,
-                    rented_inventory_returned=entry.rented_inventory_returned,
-                    on_event=entry.on_event,
-                    in_office=entry.in_office,
-                    in_warehouse=entry.in_warehouse,
-                    issued_qty=entry.issued_qty,
-                    balance_qty=entry.balance_qty,
-                    submitted_by=entry.submitted_by,
-                    bar_code=entry.bar_code,
-                    barcode_image_url=entry.barcode_image_url,
-                    created_at=entry.created_at,
-                    updated_at=entry.updated_at
+            started = perf_counter()
+            synced = 0
+            deleted = 0
+
+            watermark = await redis_client.get(INVENTORY_SYNC_WATERMARK_KEY) if incremental else None
+            since = datetime.fromisoformat(watermark) if watermark else None
+            latest = since
+
+            query = select(EntryInventory)
+            if since is not None:
+                # Served by ix_entry_inventory_updated_at; `>=` re-sends boundary rows rather than missing them
+                query = query.where(EntryInventory.updated_at >= since).order_by(EntryInventory.updated_at)
+
+            result = await db.stream(query.execution_options(yield_per=chunk_size))
+            async for chunk in result.scalars().partitions(chunk_size):
+                # Serialise the whole chunk in one pass
+                payload = {
+                    f"inventory:{entry.inventory_id}": StoreInventoryRedis.model_validate(
+                        entry, from_attributes=True
+                    ).model_dump_json()
+                    for entry in chunk
+                }
+
+                pipe = redis_client.pipeline(transaction=False)
+                pipe.mset(payload)
+                await inventory_index.add_many(
+                    [(f"inventory:{entry.inventory_id}", entry.name) for entry in chunk],
+                    pipe=pipe
                 )
-            
-                await redis_client.set(
-                    f"inventory:{entry.inventory_id}", 
-                    redis_entry.json()
+                await scan_index.add_many(dict(filter(None, map(_scan_entry, chunk))), pipe=pipe)
+                await pipe.execute()
+
+                chunk_latest = max((entry.updated_at for entry in chunk if entry.updated_at), default=None)
+                if chunk_latest and (latest is None or chunk_latest > latest):
+                    latest = chunk_latest
+
+                synced += len(payload)
+                elapsed = perf_counter() - started
+                logger.info(
+                    f"Synced {synced} entries to Redis "
+                    f"({synced / elapsed if elapsed else 0:.0f} rows/sec)"
                 )
-            
-            logger.info(f"Stored {len(entries)} entries in Redis")
-            return True
+
+            if since is None:
+                # O(table): reads every inventory_id, so incremental syncs leave it to the full ones
+                deleted = await self._prune_deleted_from_redis(db, chunk_size)
+
+            if latest is not None:
+                await redis_client.set(INVENTORY_SYNC_WATERMARK_KEY, latest.isoformat())
+
+            elapsed = perf_counter() - started
+            stats = {
+                "mode": "incremental" if since is not None else "full",
+                "synced": synced,
+                "deleted": deleted,
+                "watermark": latest.isoformat() if latest else None,
+                "duration_seconds": round(elapsed, 3),
+                "rows_per_second": round(synced / elapsed, 1) if elapsed else 0,
+            }
+            logger.info(
+                f"Stored {synced} entries in Redis ({stats['mode']} sync, "
+                f"{deleted} removed) in {stats['duration_seconds']}s"
+            )
+            return stats
         except Exception as e:
             logger.error(f"Redis storage error: {e}")
             raise HTTPException(
@@ -263,23 +639,37 @@ class EntryInventoryService(EntryInventoryInterface):
                 detail="Failed to sync with Redis"
             )
 
+    async def _prune_deleted_from_redis(self, db: AsyncSession, chunk_size: int) -> int:
+        """Delete `inventory:*` keys whose rows no longer exist in the database"""
+        await inventory_index.ensure_built(_inventory_sort_value)
+
+        # Only the inventory_id column is read, which the inventory_id index can serve
+        result = await db.stream_scalars(
+            select(EntryInventory.inventory_id).execution_options(yield_per=chunk_size)
+        )
+        live_keys = {f"inventory:{inventory_id}" async for inventory_id in result}
+
+        stale_keys = [key for key in await inventory_index.keys() if key not in live_keys]
+        if not stale_keys:
+            return 0
+
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.delete(*stale_keys)
+        await inventory_index.remove_many(stale_keys, pipe=pipe)
+        await pipe.execute()
+        logger.info(f"Removed {len(stale_keys)} deleted entries from Redis")
+        return len(stale_keys)
+
     #  Show all inventory entries directly from local Redis after clicking {Show All} button
     async def show_all_inventory_from_redis(self) -> List[InventoryRedisOut]:
         """Retrieve all inventory entries from Redis"""
         try:
-            # Get all inventory keys from Redis
-            keys = await redis_client.keys("inventory:*")
-
-            # Retrieve and parse all entries
-            entries = []
-            for key in keys:
-                data = await redis_client.get(key)
-                if data:
-                    entries.append(InventoryRedisOut.from_redis(data))
-
-            # Sort by name (alphabetical)
-            entries.sort(key=lambda x: x.name)
-            return entries
+            # Backfill the name index once if keys were stored before it existed
+            await inventory_index.ensure_built(_inventory_sort_value)
+
+            # Index is already ordered by name, so one ZRANGE + batched MGET replaces KEYS + GET per key
+            records = await inventory_index.fetch_all()
+            return [InventoryRedisOut.from_redis(data) for _, data in records if data]
 
         except Exception as e:
             logger.error(f"Redis retrieval error: {e}")
@@ -288,6 +678,46 @@ class EntryInventoryService(EntryInventoryInterface):
                 detail="Failed to load from Redis"
             )
 
+    #  Stream the entire inventory as NDJSON or CSV for bulk consumers (nightly reconciliation)
+    async def export_entries(
+        self,
+        export_format: str = "ndjson",
+        chunk_size: int = config.REDIS_SYNC_CHUNK_SIZE
+    ) -> AsyncIterator[str]:
+        """
+        Yield the inventory in (name, uuid) order, one text chunk per `chunk_size` rows.
+        Plain column rows are read through a server-side cursor, so no ORM objects
+        or Pydantic models are built and memory stays constant. The generator owns
+        its session because it keeps running after the request dependencies exit.
+        """
+        columns = [column for column in EntryInventory.__table__.columns if column.name not in EXPORT_EXCLUDED_COLUMNS]
+        fieldnames = [column.name for column in columns]
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+            writer.writeheader()
+            yield buffer.getvalue()
+
+        exported = 0
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(
+                select(*columns)
+                .order_by(SORT_NAME, EntryInventory.uuid)
+                .execution_options(yield_per=chunk_size)
+            )
+            async for rows in result.mappings().partitions(chunk_size):
+                if export_format == "csv":
+                    buffer = io.StringIO()
+                    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+                    writer.writerows(rows)
+                    yield buffer.getvalue()
+                else:
+                    yield "".join(json.dumps(dict(row), default=str) + "\n" for row in rows)
+                exported += len(rows)
+
+        logger.info(f"Exported {exported} inventory entries as {export_format}")
+
     # List all inventory entries function
     async def list_entry_inventories_curd(self, db: AsyncSession):
         try:
@@ -0,0 +1,125 @@
+# backend/app/curd/scan_curd.py
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException
+from typing import Any, Dict, List, Optional
+from backend.app.models.entry_inventory_model import EntryInventory
+from backend.app.models.to_event_inventry_model import ToEventInventory
+from backend.app.schema.entry_inventory_schema import StoreInventoryRedis
+from backend.app.schema.scan_schema import ScanResult
+from backend.app.interface.scan_interface import ScanInterface
+from backend.app.database.redisclient import to_event_index, scan_index, inventory_outbox
+from backend.app.database.redis_scan_index import RedisScanIndex, SCAN_ITEM, SCAN_PROJECT, sign_code
+from backend.app.curd.to_event_inventry_curd import _project_sort_value
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Signature fields are used for verification only and never returned to scanners
+SIGNATURE_FIELDS = ('unique_code', 'project_barcode_unique_code')
+
+# Set once this process has confirmed the scan index holds the staged projects
+_projects_indexed = False
+
+def _public(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: value for field, value in record.items() if field not in SIGNATURE_FIELDS}
+
+class ScanService(ScanInterface):
+    """Resolve scanned codes through the Redis scan index, falling back to the database"""
+
+    async def resolve_code(self, db: AsyncSession, code: str) -> Optional[ScanResult]:
+        return (await self.resolve_codes(db, [code])).get(code)
+
+    async def resolve_codes(self, db: AsyncSession, codes: List[str]) -> Dict[str, ScanResult]:
+        """
+        Resolve many codes with one HMGET + MGET against the scan index, then one
+        `IN` query per table for the codes Redis did not know.
+        Returns {code: ScanResult} for every code found; unknown codes are omitted.
+        """
+        results: Dict[str, ScanResult] = {}
+        try:
+            await self._ensure_projects_indexed()
+            resolved = await scan_index.resolve_many(codes)
+        except Exception as e:
+            # Redis trouble must not stop the loading dock; the database can still answer
+            logger.error(f"Scan index lookup failed for {len(codes)} codes: {e}")
+            resolved = {}
+
+        for code, (entity_type, key, record, verified) in resolved.items():
+            results[code] = ScanResult(
+                code=code, entity_type=entity_type, key=key,
+                verified=verified, source="redis", data=_public(record)
+            )
+
+        misses = [code for code in codes if code not in results]
+        if misses:
+            results.update(await self._resolve_from_db(db, misses))
+        return results
+
+    async def _resolve_from_db(self, db: AsyncSession, codes: List[str]) -> Dict[str, ScanResult]:
+        results: Dict[str, ScanResult] = {}
+        try:
+            result = await db.execute(select(EntryInventory).where(EntryInventory.bar_code.in_(codes)))
+            for entry in result.scalars().all():
+                payload = StoreInventoryRedis.model_validate(entry, from_attributes=True).model_dump_json()
+                key = f"inventory:{entry.inventory_id}"
+                # Re-cache the item and its code so the next scan is one Redis lookup
+                inventory_outbox.enqueue_set(
+                    key, payload, entry.name,
+                    scan=(entry.bar_code, RedisScanIndex.entry(SCAN_ITEM, key, str(entry.uuid), entry.unique_code))
+                )
+                results[entry.bar_code] = ScanResult(
+                    code=entry.bar_code, entity_type=SCAN_ITEM, key=key,
+                    verified=entry.verify_code_relationship(), source="database", data=json.loads(payload)
+                )
+            if results:
+                await inventory_outbox.flush()
+
+            remaining = [code for code in codes if code not in results]
+            if remaining:
+                result = await db.execute(
+                    select(ToEventInventory).where(ToEventInventory.project_barcode.in_(remaining))
+                )
+                for project in result.scalars().all():
+                    record = {
+                        column.name: getattr(project, column.key)
+                        for column in ToEventInventory.__table__.columns
+                    }
+                    code = project.project_barcode
+                    results[code] = ScanResult(
+                        code=code, entity_type=SCAN_PROJECT, key=str(project.id),
+                        verified=sign_code(code, str(project.id)) == project.project_barcode_unique_code,
+                        source="database", data=json.loads(json.dumps(_public(record), default=str))
+                    )
+            return results
+        except SQLAlchemyError as e:
+            logger.error(f"Database error resolving {len(codes)} scanned codes: {e}")
+            raise HTTPException(status_code=500, detail="Database error")
+
+    async def _ensure_projects_indexed(self) -> None:
+        """
+        One-off backfill of codes for projects staged in Redis before the scan index existed.
+        Items are registered by `/sync/` and the write-through path.
+        """
+        global _projects_indexed
+        if _projects_indexed:
+            return
+        if not await scan_index.is_built():
+            await to_event_index.ensure_built(_project_sort_value)
+            entries = {}
+            for key, raw in await to_event_index.fetch_all():
+                if not raw:
+                    continue
+                project = json.loads(raw)
+                if project.get('project_barcode') and project.get('project_barcode_unique_code') and project.get('uuid'):
+                    entries[project['project_barcode']] = RedisScanIndex.entry(
+                        SCAN_PROJECT, key, str(project['uuid']), project['project_barcode_unique_code']
+                    )
+            await scan_index.add_many(entries)
+            await scan_index.mark_built()
+            logger.info(f"Indexed {len(entries)} staged project barcodes for scanning")
+        _projects_indexed = True
@@ -0,0 +1,107 @@
+# backend/app/curd/stock_curd.py
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import case, func
+from sqlalchemy.exc import SQLAlchemyError
+from redis.exceptions import RedisError
+from fastapi import HTTPException
+from datetime import datetime, timezone
+from typing import Optional
+from backend.app.models.entry_inventory_model import EntryInventory
+from backend.app.schema.stock_schema import StockGrouping, StockGroup, StockTotals, StockSummaryOut
+from backend.app.interface.stock_interface import StockInterface
+from backend.app.database.redisclient import redis_client
+from backend.app import config
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Bumped on every inventory write; cached summaries are keyed by it, so a bump retires them all
+STOCK_SUMMARY_VERSION_KEY = "stock:summary:version"
+
+# An entry's units are counted in the first location its flags claim, so buckets add up to the totals
+_LOCATION = case(
+    (EntryInventory.on_event, 'on_event'),
+    (EntryInventory.on_rent, 'on_rent'),
+    (EntryInventory.in_warehouse, 'in_warehouse'),
+    (EntryInventory.in_office, 'in_office'),
+    else_='unassigned'
+)
+
+def _summary_key(version: str, group_by: str) -> str:
+    return f"stock:summary:{version}:{group_by}"
+
+async def invalidate_stock_summaries() -> None:
+    """Retire every cached stock summary (call after committing an inventory write)"""
+    try:
+        await redis_client.incr(STOCK_SUMMARY_VERSION_KEY)
+    except (RedisError, OSError) as e:
+        # Cached summaries then expire after STOCK_SUMMARY_CACHE_TTL_SECONDS at the latest
+        logger.warning(f"Stock summary invalidation failed: {e}")
+
+class StockService(StockInterface):
+    """Stock rollups computed with SQL GROUP BY and cached in Redis"""
+
+    async def get_summary(self, db: AsyncSession, group_by: StockGrouping) -> StockSummaryOut:
+        version: Optional[str] = None
+        try:
+            version = await redis_client.get(STOCK_SUMMARY_VERSION_KEY) or "0"
+            cached = await redis_client.get(_summary_key(version, group_by))
+            if cached:
+                return StockSummaryOut.model_validate_json(cached).model_copy(update={'cached': True})
+        except (RedisError, OSError) as e:
+            logger.warning(f"Stock summary cache unavailable, aggregating in the database: {e}")
+
+        summary = await self._aggregate(db, group_by)
+
+        if version is not None:
+            try:
+                # Stored under the version read before aggregating: a write committed meanwhile
+                # has bumped the version, so a stale summary is never served
+                await redis_client.set(
+                    _summary_key(version, group_by), summary.model_dump_json(),
+                    ex=config.STOCK_SUMMARY_CACHE_TTL_SECONDS
+                )
+            except (RedisError, OSError) as e:
+                logger.warning(f"Failed to cache stock summary: {e}")
+        return summary
+
+    async def _aggregate(self, db: AsyncSession, group_by: StockGrouping) -> StockSummaryOut:
+        bucket = _LOCATION if group_by == 'location' else func.coalesce(EntryInventory.name, '')
+        # Bucket in a subquery so GROUP BY refers to a plain column rather than repeating the expression
+        rows = select(
+            bucket.label('key'),
+            EntryInventory.total_quantity,
+            EntryInventory.issued_qty,
+            EntryInventory.balance_qty
+        ).subquery()
+        query = (
+            select(
+                rows.c.key,
+                func.count().label('items'),
+                func.coalesce(func.sum(rows.c.total_quantity), 0).label('total_quantity'),
+                func.coalesce(func.sum(rows.c.issued_qty), 0).label('issued_qty'),
+                func.coalesce(func.sum(rows.c.balance_qty), 0).label('balance_qty')
+            )
+            .group_by(rows.c.key)
+            .order_by(rows.c.key)
+        )
+        try:
+            result = await db.execute(query)
+            groups = [StockGroup.model_validate(dict(row)) for row in result.mappings().all()]
+        except SQLAlchemyError as e:
+            logger.error(f"Database error aggregating stock by {group_by}: {e}")
+            raise HTTPException(status_code=500, detail="Database error")
+
+        totals = StockTotals(
+            items=sum(group.items for group in groups),
+            total_quantity=sum(group.total_quantity for group in groups),
+            issued_qty=sum(group.issued_qty for group in groups),
+            balance_qty=sum(group.balance_qty for group in groups)
+        )
+        return StockSummaryOut(
+            group_by=group_by, totals=totals, groups=groups,
+            generated_at=datetime.now(timezone.utc)
+        )
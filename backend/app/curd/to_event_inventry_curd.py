@@ -22,14 +22,17 @@ from backend.app.schema.to_event_inventry_schma import (
     RedisInventoryItem,
     ToEventRedis,
     ToEventRedisOut,
+    ToEventRedisPage,
 )
 from sqlalchemy.exc import SQLAlchemyError
 from backend.app.models.to_event_inventry_model import InventoryItem, ToEventInventory
 from backend.app.interface.to_event_interface import ToEventInventoryInterface
+from backend.app.curd.availability_curd import refresh_project_commitments
 import logging
 from fastapi import HTTPException
 from typing import List, Optional, Dict, Any
-from backend.app.database.redisclient import redis_client
+from backend.app.database.redisclient import redis_client, to_event_index, inventory_item_index, scan_index
+from backend.app.database.redis_scan_index import RedisScanIndex, SCAN_PROJECT
 from backend.app import config
 import uuid
 import redis.asyncio as redis
@@ -38,12 +41,24 @@ from fastapi import HTTPException
 from pydantic import ValidationError
 import json
 from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from backend.app.utils.barcode_generator import BarcodeGenerator  # Import the BarcodeGenerator class
+from backend.app.utils.pagination import encode_cursor, decode_cursor
 
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Signed with the project's `id`, so they never move to another row's id on upsert
+PROJECT_BARCODE_COLUMNS = ('project_barcode', 'project_barcode_unique_code', 'project_barcode_image_url')
+
+def _project_sort_value(key: str, raw: str) -> float:
+    """Extract the `updated_at` score used to order `to_event_inventory:*` keys in the Redis index"""
+    updated_at = json.loads(raw).get('updated_at')
+    if not updated_at:
+        return 0.0
+    return datetime.fromisoformat(str(updated_at)).timestamp()
+
 # ------------------------
 # CRUD OPERATIONS
 # ------------------------ 
@@ -56,222 +71,249 @@ class ToEventInventoryService(ToEventInventoryInterface):
 
 # upload all to_event_inventory entries from local Redis to the database after click on upload data button
     async def upload_to_event_inventory(self, db: AsyncSession) -> List[ToEventUploadResponse]:
+        """
+        Copy staged projects and items from Redis to the database in bulk.
+        - Staged keys come from the Redis indexes and are fetched with batched MGET
+        - Every record is validated up front; invalid ones are reported, not uploaded
+        - Projects and items are written with INSERT ... ON CONFLICT DO UPDATE,
+          `config.UPLOAD_BATCH_SIZE` projects per statement, each batch in its own
+          savepoint; a failing batch is retried one project at a time, so only the
+          projects that actually fail are reported as failed
+        - Stock commitments of every uploaded project are refreshed in the same savepoint
+        """
         try:
-            # Start with fresh transaction
             await db.rollback()
-            
-            # Get both types of Redis keys
-            inventory_keys = await redis_client.keys("to_event_inventory:*")
-            item_keys = await redis_client.keys("inventory_item:*")
-            
-            logger.info(f"Starting upload with {len(inventory_keys)} inventory keys and {len(item_keys)} item keys")
-            
-            if not inventory_keys and not item_keys:
+
+            # Fetch every staged project and item (one ZRANGE + MGET per batch each)
+            await to_event_index.ensure_built(_project_sort_value)
+            await inventory_item_index.ensure_built(lambda key, raw: 0)
+            project_records = await to_event_index.fetch_all()
+            item_records = await inventory_item_index.fetch_all()
+
+            logger.info(f"Starting upload with {len(project_records)} inventory keys and {len(item_records)} item keys")
+
+            if not project_records and not item_records:
                 logger.info("No Redis keys found to upload")
                 return []
 
-            uploaded_entries = []
-            success_count = 0
-            error_count = 0
-            processed_projects = set()
+            responses: Dict[str, ToEventUploadResponse] = {}
 
-            # Process main inventory entries
-            for key in inventory_keys:
+            # Validate all projects in one pass
+            projects: Dict[str, ToEventUploadSchema] = {}
+            for key, raw in project_records:
+                if not raw:
+                    continue
                 try:
-                    # Ensure fresh transaction for each key
-                    await db.rollback()
-                    
-                    redis_data = await redis_client.get(key)
-                    if not redis_data:
-                        logger.debug(f"Empty data for key {key}")
-                        continue
-
-                    try:
-                        data = json.loads(redis_data)
-                        entries = [ToEventUploadSchema(**item) for item in data] if isinstance(data, list) else [ToEventUploadSchema(**data)]
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Schema validation failed for {key}: {str(e)}")
-                        await db.rollback()
-                        continue
-
-                    for entry in entries:
-                        try:
-                            if not entry.project_id:
-                                logger.warning(f"Empty project_id in entry from key {key}")
-                                continue
-                            
-                            # Skip if we've already processed this project
-                            if entry.project_id in processed_projects:
-                                logger.debug(f"Skipping already processed project {entry.project_id}")
-                                continue
-                                
-                            processed_projects.add(entry.project_id)
-                            logger.info(f"Processing project {entry.project_id}")
-
-                            # Check if exists in the database
-                            existing = await db.execute(
-                                select(ToEventInventory)
-                                .where(ToEventInventory.project_id == entry.project_id)
-                            )
-                            existing = existing.scalar_one_or_none()
-
-                            entry_dict = entry.model_dump(exclude={'inventory_items'})
-
-                            if existing:
-                                # If the project already exists, delete the old entry
-                                await db.execute(
-                                    delete(ToEventInventory).where(ToEventInventory.project_id == entry.project_id)
-                                )
-                                logger.info(f"Deleted existing project with project_id: {entry.project_id}")
-                                
-                            # Create new entry (whether it existed or not)
-                            new_entry = ToEventInventory(**entry_dict)
-                            db.add(new_entry)
-                            await db.flush()
-                            parent_id = new_entry.id
-
-                            # Process inventory items from main entry
-                            if entry.inventory_items:
-                                for item in entry.inventory_items:
-                                    # Check if item already exists
-                                    existing_item = await db.execute(
-                                        select(InventoryItem)
-                                        .where(InventoryItem.id == item.id)
-                                    )
-                                    existing_item = existing_item.scalar_one_or_none()
-
-                                    item_data = item.model_dump(exclude={'project_id'})
-
-                                    if existing_item:
-                                        # Update existing item if necessary
-                                        for field, value in item_data.items():
-                                            if hasattr(existing_item, field) and getattr(existing_item, field) != value:
-                                                setattr(existing_item, field, value)
-                                    else:
-                                        # Add new item
-                                        new_item = InventoryItem(
-                                            project_id=parent_id,
-                                            **item_data
-                                        )
-                                        db.add(new_item)
-
-                            # Commit after each successful project
-                            await db.commit()
-                            
-                            # Prepare success response
-                            response = ToEventUploadResponse(
-                                success=True,
-                                message="Copied to database successfully",
-                                project_id=entry.project_id,
-                                inventory_items_count=len(entry.inventory_items),
-                                created_at=entry.created_at or datetime.now(timezone.utc)
-                            )
-                            uploaded_entries.append(response)
-                            success_count += 1
-                            logger.info(f"Successfully processed project {entry.project_id}")
-
-                        except Exception as e:
-                            await db.rollback()
-                            error_count += 1
-                            logger.error(f"Error processing entry {entry.project_id if entry else 'unknown'}: {str(e)}")
-                            continue
-
+                    data = json.loads(raw)
+                    entries = [ToEventUploadSchema(**item) for item in data] if isinstance(data, list) else [ToEventUploadSchema(**data)]
                 except Exception as e:
-                    await db.rollback()
-                    error_count += 1
-                    logger.error(f"Error processing key {key}: {str(e)}")
+                    logger.error(f"Schema validation failed for {key}: {str(e)}")
+                    project_id = key.split(":", 1)[-1]
+                    if re.fullmatch(r"PRJ\d+", project_id):
+                        responses[project_id] = self._upload_response(project_id, False, f"Validation failed: {e}")
+                    continue
+                for entry in entries:
+                    # Same project staged under several keys is uploaded once
+                    projects.setdefault(entry.project_id, entry)
+
+            # Validate standalone item keys in one pass
+            loose_items: Dict[str, RedisInventoryItem] = {}
+            for key, raw in item_records:
+                if not raw:
                     continue
-
-            # Process individual inventory items
-            for key in item_keys:
                 try:
-                    # Fresh transaction for each item
-                    await db.rollback()
-                    
-                    redis_data = await redis_client.get(key)
-                    if not redis_data:
-                        continue
-
-                    try:
-                        item_data = json.loads(redis_data)
-                        item = RedisInventoryItem(**item_data)
-                    except Exception as e:
-                        logger.error(f"Schema validation failed for {key}: {str(e)}")
-                        error_count += 1
-                        continue
-
-                    if not item.project_id:
-                        continue
-
-                    # Find the parent project in the database
-                    parent = await db.execute(
-                        select(ToEventInventory)
-                        .where(ToEventInventory.project_id == item.project_id)
-                    )
-                    parent = parent.scalar_one_or_none()
+                    item = RedisInventoryItem(**json.loads(raw))
+                except Exception as e:
+                    logger.error(f"Schema validation failed for {key}: {str(e)}")
+                    continue
+                if item.project_id:
+                    loose_items[item.id or key.split(":", 1)[-1]] = item
 
-                    if not parent:
-                        logger.warning(f"No parent project found for item {item.id}")
-                        continue
+            # Upsert projects together with their embedded items
+            project_ids = list(projects)
+            for offset in range(0, len(project_ids), config.UPLOAD_BATCH_SIZE):
+                batch = [projects[project_id] for project_id in project_ids[offset:offset + config.UPLOAD_BATCH_SIZE]]
+                await self._upload_project_batch(db, batch, responses)
 
-                    # Check if item already exists
-                    existing_item = await db.execute(
-                        select(InventoryItem)
-                        .where(InventoryItem.id == item.id)
-                    )
-                    existing_item = existing_item.scalar_one_or_none()
-
-                    item_data = item.model_dump(exclude={'project_id'})
-
-                    if existing_item:
-                        # Update existing item
-                        for field, value in item_data.items():
-                            if hasattr(existing_item, field) and getattr(existing_item, field) != value:
-                                setattr(existing_item, field, value)
-                    else:
-                        # Add new item
-                        new_item = InventoryItem(
-                            project_id=parent.id,
-                            **item_data
-                        )
-                        db.add(new_item)
-                    
-                    # Commit after each item
-                    await db.commit()
-
-                    # Update count in response if project was already processed
-                    for entry in uploaded_entries:
-                        if entry.project_id == item.project_id:
-                            entry.inventory_items_count += 1
-                            break
-                    else:
-                        # If project wasn't processed yet, create a new response entry
-                        response = ToEventUploadResponse(
-                            success=True,
-                            message="Copied item to database",
-                            project_id=item.project_id,
-                            inventory_items_count=1,
-                            created_at=datetime.now(timezone.utc)
-                        )
-                        uploaded_entries.append(response)
-
-                    success_count += 1
+            # Upsert standalone items under their (already stored) parent projects;
+            # projects staged in this run are authoritative for their own items
+            item_list = [item for item in loose_items.values() if item.project_id not in responses]
+            for offset in range(0, len(item_list), config.UPLOAD_BATCH_SIZE):
+                batch = item_list[offset:offset + config.UPLOAD_BATCH_SIZE]
+                await self._upload_item_batch(db, batch, responses)
 
-                except Exception as e:
-                    await db.rollback()
-                    error_count += 1
-                    logger.error(f"Error processing item {item.id if hasattr(item, 'id') else 'unknown'}: {str(e)}")
-                    continue
+            await db.commit()
 
-            logger.info(f"Copy completed: {success_count} items processed, {error_count} errors")
-            return uploaded_entries
+            succeeded = sum(1 for response in responses.values() if response.success)
+            logger.info(f"Copy completed: {succeeded} projects uploaded, {len(responses) - succeeded} failed")
+            return list(responses.values())
 
         except Exception as e:
             await db.rollback()
             logger.error(f"Copy operation failed: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=str(e))    
 
+    async def _upload_project_batch(
+        self,
+        db: AsyncSession,
+        batch: List[ToEventUploadSchema],
+        responses: Dict[str, ToEventUploadResponse]
+    ) -> None:
+        """Upsert a batch of projects and their items in one savepoint, splitting it up if it fails"""
+        try:
+            async with db.begin_nested():
+                parent_ids = await self._upsert_projects(db, batch)
+                counts = await self._upsert_items(
+                    db,
+                    [(parent_ids[entry.project_id], item) for entry in batch for item in entry.inventory_items],
+                    replace_projects=list(parent_ids.values())
+                )
+                await refresh_project_commitments(db, parent_ids.values())
+        except (SQLAlchemyError, ValueError) as e:
+            if len(batch) > 1:
+                logger.warning(f"Batch upload failed for {len(batch)} projects, retrying one by one: {str(e)}")
+                for entry in batch:
+                    await self._upload_project_batch(db, [entry], responses)
+                return
+            logger.error(f"Upload failed for project {batch[0].project_id}: {str(e)}")
+            responses[batch[0].project_id] = self._upload_response(batch[0].project_id, False, f"Upload failed: {e}")
+            return
+
+        for entry in batch:
+            responses[entry.project_id] = self._upload_response(
+                entry.project_id, True, "Copied to database successfully",
+                counts.get(parent_ids[entry.project_id], 0), entry.created_at
+            )
+
+    async def _upload_item_batch(
+        self,
+        db: AsyncSession,
+        batch: List[RedisInventoryItem],
+        responses: Dict[str, ToEventUploadResponse]
+    ) -> None:
+        """
+        Upsert a batch of standalone items in one savepoint. Every project_id in the
+        batch gets a response: items without a stored parent project fail, and a
+        failing batch is retried one project at a time.
+        """
+        try:
+            async with db.begin_nested():
+                parents = await db.execute(
+                    select(ToEventInventory.project_id, ToEventInventory.id)
+                    .where(ToEventInventory.project_id.in_({item.project_id for item in batch}))
+                )
+                parent_ids = dict(parents.all())
+                await self._upsert_items(
+                    db,
+                    [(parent_ids[item.project_id], item) for item in batch if item.project_id in parent_ids]
+                )
+                await refresh_project_commitments(db, parent_ids.values())
+        except (SQLAlchemyError, ValueError) as e:
+            by_project: Dict[str, List[RedisInventoryItem]] = {}
+            for item in batch:
+                by_project.setdefault(item.project_id, []).append(item)
+            if len(by_project) > 1:
+                logger.warning(f"Batch item upload failed for {len(batch)} items, retrying per project: {str(e)}")
+                for items in by_project.values():
+                    await self._upload_item_batch(db, items, responses)
+                return
+            project_id = batch[0].project_id
+            logger.error(f"Item upload failed for project {project_id}: {str(e)}")
+            responses[project_id] = self._upload_response(project_id, False, f"Upload failed: {e}")
+            return
+
+        counts: Dict[str, int] = {}
+        for item in batch:
+            counts[item.project_id] = counts.get(item.project_id, 0) + 1
+        for project_id, count in counts.items():
+            if project_id in parent_ids:
+                responses[project_id] = self._upload_response(project_id, True, "Copied item to database", count)
+            else:
+                logger.warning(f"No parent project found for {count} staged items of {project_id}")
+                responses[project_id] = self._upload_response(project_id, False, "Parent project not found in database")
+
+    async def _upsert_projects(self, db: AsyncSession, entries: List[ToEventUploadSchema]) -> Dict[str, uuid.UUID]:
+        """
+        Insert or update projects in one statement; returns project_id -> primary key.
+        An existing project keeps its `id` and therefore its barcode columns, which are signed with that id.
+        """
+        now = datetime.now(timezone.utc)
+        rows = []
+        for entry in entries:
+            row = entry.model_dump(exclude={'inventory_items'})
+            row['id'] = uuid.UUID(str(entry.id)) if entry.id else uuid.uuid4()
+            row['created_at'] = entry.created_at or now
+            row['updated_at'] = entry.updated_at or now
+            rows.append(row)
+
+        stmt = pg_insert(ToEventInventory).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ToEventInventory.project_id],
+            set_={
+                column: stmt.excluded[column]
+                for column in rows[0]
+                if column not in ('id', 'project_id', 'created_at', *PROJECT_BARCODE_COLUMNS)
+            }
+        ).returning(ToEventInventory.project_id, ToEventInventory.id)
+        result = await db.execute(stmt)
+        return dict(result.all())
+
+    async def _upsert_items(
+        self,
+        db: AsyncSession,
+        items: List[tuple],
+        replace_projects: Optional[List[uuid.UUID]] = None
+    ) -> Dict[uuid.UUID, int]:
+        """
+        Insert or update `(parent_id, RedisInventoryItem)` pairs in one statement.
+        Items of `replace_projects` that are no longer staged are deleted, so the
+        stored project mirrors Redis. Returns the number of items per parent.
+        """
+        rows: Dict[uuid.UUID, dict] = {}
+        for parent_id, item in items:
+            row = item.model_dump(exclude={'id', 'project_id'})
+            # Every column except quantity is a string column
+            row = {field: (str(value) if value is not None and field != 'quantity' else value) for field, value in row.items()}
+            row['id'] = uuid.UUID(str(item.id)) if item.id else uuid.uuid4()
+            row['project_id'] = parent_id
+            rows[row['id']] = row
+
+        if replace_projects:
+            await db.execute(
+                delete(InventoryItem)
+                .where(InventoryItem.project_id.in_(replace_projects))
+                .where(InventoryItem.id.not_in(list(rows)))
+            )
+
+        if rows:
+            stmt = pg_insert(InventoryItem).values(list(rows.values()))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[InventoryItem.id],
+                set_={column: stmt.excluded[column] for column in next(iter(rows.values())) if column != 'id'}
+            )
+            await db.execute(stmt)
+
+        counts: Dict[uuid.UUID, int] = {}
+        for row in rows.values():
+            counts[row['project_id']] = counts.get(row['project_id'], 0) + 1
+        return counts
+
+    @staticmethod
+    def _upload_response(
+        project_id: str,
+        success: bool,
+        message: str,
+        inventory_items_count: int = 0,
+        created_at: Optional[datetime] = None
+    ) -> ToEventUploadResponse:
+        return ToEventUploadResponse(
+            success=success,
+            message=message,
+            project_id=project_id,
+            inventory_items_count=inventory_items_count,
+            created_at=created_at or datetime.now(timezone.utc)
+        )
+
 # ------------------------------------------------------------------------------------------------
     #  Create new entry of inventory for to_event which is directly stored in redis
     async def create_to_event_inventory(self, item: ToEventInventoryCreate) -> ToEventRedisOut:
@@ -320,18 +362,22 @@ class ToEventInventoryService(ToEventInventoryInterface):
                 'inventory_items': inventory_items
             }
     
-            # Store main inventory in Redis
-            await redis_client.set(
-                f"to_event_inventory:{inventory_data['project_id']}",
-                json.dumps(redis_data, default=str)
-            )
-    
-            # Store individual items with their own keys (still without timestamps)
-            for item in inventory_items:
-                await redis_client.set(
-                    f"inventory_item:{item['id']}",
-                    json.dumps(item, default=str)
-                )
+            # Store main inventory and its individual items (still without timestamps) in one pipeline
+            project_key = f"to_event_inventory:{inventory_data['project_id']}"
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.set(project_key, json.dumps(redis_data, default=str))
+            await to_event_index.add(project_key, current_time, pipe=pipe)
+            if inventory_data.get('project_barcode_unique_code'):
+                await scan_index.add_many({
+                    inventory_data['project_barcode']: RedisScanIndex.entry(
+                        SCAN_PROJECT, project_key, inventory_data['uuid'], inventory_data['project_barcode_unique_code']
+                    )
+                }, pipe=pipe)
+            if inventory_items:
+                item_keys = {f"inventory_item:{item['id']}": json.dumps(item, default=str) for item in inventory_items}
+                pipe.mset(item_keys)
+                await inventory_item_index.add_many([(key, 0) for key in item_keys], pipe=pipe)
+            await pipe.execute()
     
             return ToEventRedisOut(**redis_data)
     
@@ -343,37 +389,71 @@ class ToEventInventoryService(ToEventInventoryInterface):
             )
     
     #  show all project directly from local Redis in `submitted Forms` directly after submitting the form
-    async def load_submitted_project_from_redis(self, skip: int = 0) -> List[ToEventRedisOut]:
+    async def load_submitted_project_from_redis(self, skip: int = 0, limit: int = 10) -> List[ToEventRedisOut]:
         try:
-            # Get all keys matching your project pattern
-            keys = await self.redis.keys("to_event_inventory:*")
-            
-            projects = []
-            for key in keys:
-                data = await self.redis.get(key)
-                if data:
-                    try:
-                        project_data = json.loads(data)
-                        # Handle the 'cretaed_at' typo if present
-                        if 'cretaed_at' in project_data and 'created_at' not in project_data:
-                            project_data['created_at'] = project_data['cretaed_at']
-                        # Validate the data against your schema
-                        validated_project = ToEventRedisOut.model_validate(project_data)
-                        projects.append(validated_project)
-                    except ValidationError as ve:
-                        logger.warning(f"Validation error for project {key}: {ve}")
-                        continue
-            
-            # Sort by updated_at (descending)
-            projects.sort(key=lambda x: x.updated_at, reverse=True)
-            
-            # Apply pagination
-            paginated_projects = projects[skip:skip+10]  # Assuming page size of 10
-            
-            return paginated_projects
+            # Backfill the updated_at index once if projects were stored before it existed
+            await to_event_index.ensure_built(_project_sort_value)
+
+            # Index is ordered by updated_at, so only the requested page is fetched (one MGET)
+            keys = await to_event_index.keys(skip, skip + limit - 1, desc=True)
+            values = await to_event_index.fetch(keys)
+            return self._parse_projects(zip(keys, values))
         except Exception as e:
             logger.error(f"Redis error fetching entries: {e}")
             raise HTTPException(status_code=500, detail="Redis error")
+
+    #  Page through submitted projects in local Redis with an opaque cursor, ordered by `updated_at`
+    async def load_submitted_project_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        order: str = "desc"
+    ) -> ToEventRedisPage:
+        try:
+            after = decode_cursor(cursor, "s", "k") if cursor else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        try:
+            await to_event_index.ensure_built(_project_sort_value)
+
+            page = await to_event_index.page(limit, after=after, desc=(order == "desc"))
+            values = await to_event_index.fetch([key for key, _ in page])
+            total = await to_event_index.count()
+
+            next_cursor = None
+            if len(page) == limit:
+                last_key, last_score = page[-1]
+                next_cursor = encode_cursor(s=last_score, k=last_key)
+
+            return ToEventRedisPage(
+                items=self._parse_projects((key, data) for (key, _), data in zip(page, values)),
+                next_cursor=next_cursor,
+                total=total,
+                limit=limit,
+                order=order
+            )
+        except Exception as e:
+            logger.error(f"Redis error fetching project page: {e}")
+            raise HTTPException(status_code=500, detail="Redis error")
+
+    @staticmethod
+    def _parse_projects(records) -> List[ToEventRedisOut]:
+        """Validate raw (key, json) project records, skipping missing or invalid ones"""
+        projects = []
+        for key, data in records:
+            if data:
+                try:
+                    project_data = json.loads(data)
+                    # Handle the 'cretaed_at' typo if present
+                    if 'cretaed_at' in project_data and 'created_at' not in project_data:
+                        project_data['created_at'] = project_data['cretaed_at']
+                    # Validate the data against your schema
+                    projects.append(ToEventRedisOut.model_validate(project_data))
+                except ValidationError as ve:
+                    logger.warning(f"Validation error for project {key}: {ve}")
+                    continue
+        return projects
+
     
     #  search project data via `project_id` directly in local Redis
     async def get_project_data(self, project_id: str) -> ToEventRedisOut:
@@ -483,6 +563,7 @@ class ToEventInventoryService(ToEventInventoryInterface):
                 redis_key,
                 validated_data.model_dump_json()
             )
+            await to_event_index.add(redis_key, validated_data.updated_at)
 
             return validated_data
 
@@ -5,9 +5,12 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy import event
+from backend.app import config
 from backend.app.config import SYNC_DB_URL, ASYNC_DB_URL
 from sqlalchemy.exc import SQLAlchemyError
 import asyncio
+import random
 import time
 import logging
 
@@ -19,15 +22,56 @@ formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 console_handler.setFormatter(formatter)
 logger.addHandler(console_handler)
 
+# Pool and cache settings shared by both engines
+ENGINE_OPTIONS = {
+    "future": True,
+    "echo": config.DB_ECHO,
+    "pool_size": config.DB_POOL_SIZE,
+    "max_overflow": config.DB_MAX_OVERFLOW,
+    "pool_timeout": config.DB_POOL_TIMEOUT,
+    "pool_recycle": config.DB_POOL_RECYCLE,
+    "pool_pre_ping": config.DB_POOL_PRE_PING,
+    "query_cache_size": config.DB_QUERY_CACHE_SIZE,
+}
+
+def install_slow_query_logging(engine) -> None:
+    """Log statements slower than DB_SLOW_QUERY_MS, sampled at DB_SLOW_QUERY_SAMPLE_RATE"""
+    if config.DB_ECHO or config.DB_SLOW_QUERY_MS <= 0:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        if elapsed_ms >= config.DB_SLOW_QUERY_MS and random.random() < config.DB_SLOW_QUERY_SAMPLE_RATE:
+            logger.warning(f"Slow query ({elapsed_ms:.1f} ms): {statement}")
+
 # Sync Database Setup
-sync_engine = create_engine(SYNC_DB_URL, future=True, echo=True)
-SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+# The psycopg2 engine is only created on first use, and never when DB_ASYNC_ONLY is set,
+# so the API process runs on asyncpg alone
+sync_engine = None
+SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+def get_sync_engine():
+    """Return the synchronous engine, creating it on first use."""
+    global sync_engine
+    if config.DB_ASYNC_ONLY:
+        raise RuntimeError("Synchronous database engine is disabled (DB_ASYNC_ONLY=true)")
+    if sync_engine is None:
+        sync_engine = create_engine(SYNC_DB_URL, **ENGINE_OPTIONS)
+        install_slow_query_logging(sync_engine)
+        SyncSessionLocal.configure(bind=sync_engine)
+    return sync_engine
 
 # Base class for declarative models
 Base = declarative_base()
 
 def get_sync_db():
     """Create a new synchronous database session."""
+    get_sync_engine()
     db = SyncSessionLocal()
     try:
         yield db
@@ -35,7 +79,12 @@ def get_sync_db():
         db.close()
 
 # Async Database Setup
-async_engine = create_async_engine(ASYNC_DB_URL, echo=True, future=True)
+async_engine = create_async_engine(
+    ASYNC_DB_URL,
+    connect_args={"prepared_statement_cache_size": config.DB_PREPARED_STATEMENT_CACHE_SIZE},
+    **ENGINE_OPTIONS
+)
+install_slow_query_logging(async_engine.sync_engine)
 AsyncSessionLocal = sessionmaker(
     async_engine,
     class_=AsyncSession,
@@ -54,78 +103,78 @@ def check_sync_db_connectivity():
     """Check the connectivity to the synchronous database."""
     try:
         logger.info("Checking synchronous database connectivity...")
-        with sync_engine.connect() as connection:
+        with get_sync_engine().connect() as connection:
             result = connection.execute(text("SELECT 1"))
             if result.fetchone():
                 logger.info("Sync database is connected.")
                 return True
-    except SQLAlchemyError as e:
+    except (SQLAlchemyError, OSError) as e:
         logger.error(f"Sync database connection failed: {e}")
-        return False
+    return False
 
 # Check Async Database Connectivity
+async def _select_one():
+    async with async_engine.connect() as connection:
+        result = await connection.execute(text("SELECT 1"))
+        return result.fetchone() is not None
+
 async def check_async_db_connectivity():
     """Check the connectivity to the asynchronous database."""
     try:
-        logger.info("Checking asynchronous database connectivity...")
-        async with async_engine.connect() as connection:
-            result = await connection.execute(text("SELECT 1"))
-            if result.fetchone():
-                logger.info("Async database is connected.")
-                return True
-    except SQLAlchemyError as e:
+        logger.debug("Checking asynchronous database connectivity...")
+        # The timeout covers acquiring the connection too, so a dead host fails fast
+        if await asyncio.wait_for(_select_one(), timeout=config.HEALTH_CHECK_TIMEOUT):
+            logger.debug("Async database is connected.")
+            return True
+    except (SQLAlchemyError, OSError, asyncio.TimeoutError) as e:
         logger.error(f"Async database connection failed: {e}")
-        return False
+    return False
+
+def _backoff_delay(attempt, delay):
+    """Exponential backoff for connectivity retries, capped at HEALTH_CHECK_MAX_DELAY"""
+    return min(config.HEALTH_CHECK_MAX_DELAY, delay * 2 ** attempt)
 
 # Run Connectivity Checks (Sync and Async)
 def check_db_connectivity():
     """Check both sync and async database connectivity."""
-    logger.info("Starting synchronous database connectivity check...")
-    if check_sync_db_connectivity():
-        logger.info("Sync DB check passed.")
+    if config.DB_ASYNC_ONLY:
+        logger.info("Skipping synchronous database check (DB_ASYNC_ONLY=true)")
     else:
-        logger.error("Sync DB check failed.")
+        logger.info("Starting synchronous database connectivity check...")
+        if check_sync_db_connectivity():
+            logger.info("Sync DB check passed.")
+        else:
+            logger.error("Sync DB check failed.")
     
     logger.info("Starting asynchronous database connectivity check...")
     loop = asyncio.get_event_loop()
     loop.run_until_complete(check_async_db_connectivity())
 
 # Optional: Retry mechanism for sync database connectivity check
-def check_sync_db_connectivity_with_retry(retries=3, delay=5):
-    """Check the connectivity to the synchronous database with retries."""
-    attempt = 0
-    while attempt < retries:
-        try:
-            logger.info(f"Attempting sync DB connectivity... (Attempt {attempt + 1}/{retries})")
-            with sync_engine.connect() as connection:
-                result = connection.execute(text("SELECT 1"))
-                if result.fetchone():
-                    logger.info("Sync database is connected.")
-                    return True
-        except SQLAlchemyError as e:
-            logger.error(f"Sync database connection failed on attempt {attempt + 1}: {e}")
-            attempt += 1
-            logger.info(f"Retrying... ({attempt}/{retries})")
-            time.sleep(delay)
+def check_sync_db_connectivity_with_retry(retries=config.HEALTH_CHECK_RETRIES, delay=config.HEALTH_CHECK_BASE_DELAY):
+    """Check the connectivity to the synchronous database with retries (blocking; run it in a thread)."""
+    for attempt in range(retries):
+        logger.info(f"Attempting sync DB connectivity... (Attempt {attempt + 1}/{retries})")
+        if check_sync_db_connectivity():
+            return True
+        if attempt + 1 < retries:
+            wait = _backoff_delay(attempt, delay)
+            logger.info(f"Retrying in {wait:.1f} seconds... ({attempt + 1}/{retries})")
+            time.sleep(wait)
     logger.error("Sync database connection failed after retries.")
     return False
 
 # Optional: Retry mechanism for async database connectivity check
-async def check_async_db_connectivity_with_retry(retries=3, delay=5):
-    """Check the connectivity to the asynchronous database with retries."""
-    attempt = 0
-    while attempt < retries:
-        try:
-            logger.info(f"Attempting async DB connectivity... (Attempt {attempt + 1}/{retries})")
-            async with async_engine.connect() as connection:
-                result = await connection.execute(text("SELECT 1"))
-                if result.fetchone():
-                    logger.info("Async database is connected.")
-                    return True
-        except SQLAlchemyError as e:
-            logger.error(f"Async database connection failed on attempt {attempt + 1}: {e}")
-            attempt += 1
-            logger.info(f"Retrying in {delay} seconds... ({attempt}/{retries})")
-            await asyncio.sleep(delay)
+async def check_async_db_connectivity_with_retry(retries=config.HEALTH_CHECK_RETRIES, delay=config.HEALTH_CHECK_BASE_DELAY):
+    """Check the connectivity to the asynchronous database with retries and exponential backoff."""
+    for attempt in range(retries):
+        logger.info(f"Attempting async DB connectivity... (Attempt {attempt + 1}/{retries})")
+        if await check_async_db_connectivity():
+            logger.info("Async database is connected.")
+            return True
+        if attempt + 1 < retries:
+            wait = _backoff_delay(attempt, delay)
+            logger.info(f"Retrying in {wait:.1f} seconds... ({attempt + 1}/{retries})")
+            await asyncio.sleep(wait)
     logger.error("Async database connection failed after retries.")
     return False
@@ -0,0 +1,236 @@
+# backend/app/database/redis_index.py
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Number of keys fetched per MGET / written per pipeline round trip
+REDIS_BATCH_SIZE = 500
+
+# Separator between the sort value and the Redis key inside a lexical index member
+_LEX_SEPARATOR = "\x00"
+
+
+class RedisKeyIndex:
+    """
+    Sorted-set index over the keys of one Redis namespace (e.g. `inventory:*`).
+
+    Replaces `KEYS pattern` + one `GET` per key with `ZRANGE` + batched `MGET`.
+    The index lives outside the namespace it covers (`index:{namespace}`) so
+    pattern scans over the namespace never pick it up.
+
+    Two orderings are supported:
+    - lexical=True:  members are `"{sort_value}\\x00{key}"` with score 0, giving
+      alphabetical order (used for inventory names). A companion hash
+      `index:{namespace}:members` maps key -> member so renames can be replaced.
+    - lexical=False: members are the keys themselves, scored by a number
+      (used for `updated_at` timestamps).
+    """
+
+    def __init__(self, redis_client, namespace: str, lexical: bool = False):
+        self.redis = redis_client
+        self.namespace = namespace
+        self.lexical = lexical
+        self.index_key = f"index:{namespace}"
+        self.members_key = f"index:{namespace}:members"
+        self.ready_key = f"index:{namespace}:ready"
+
+    def key_for(self, identifier: str) -> str:
+        """Build the namespaced Redis key for an identifier"""
+        return f"{self.namespace}:{identifier}"
+
+    # ------------------------
+    # WRITE OPERATIONS
+    # ------------------------
+
+    async def add(self, key: str, sort_value: Any, pipe=None) -> None:
+        """Add or move a single key in the index"""
+        await self.add_many([(key, sort_value)], pipe=pipe)
+
+    async def add_many(self, items: Sequence[Tuple[str, Any]], pipe=None) -> None:
+        """
+        Add or move many keys in the index.
+        When `pipe` is given the commands are queued on it and the caller executes;
+        otherwise they are sent in a single pipeline here.
+        """
+        if not items:
+            return
+
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+
+        if self.lexical:
+            keys = [key for key, _ in items]
+            # One round trip to find members that must be replaced (renamed items)
+            previous = await self.redis.hmget(self.members_key, keys)
+            stale = [old for old in previous if old]
+            if stale:
+                pipe.zrem(self.index_key, *stale)
+            members = {self._lex_member(key, value): 0 for key, value in items}
+            pipe.zadd(self.index_key, members)
+            pipe.hset(self.members_key, mapping={key: self._lex_member(key, value) for key, value in items})
+        else:
+            pipe.zadd(self.index_key, {key: self._score(value) for key, value in items})
+
+        if own_pipe:
+            await pipe.execute()
+
+    async def remove(self, key: str, pipe=None) -> None:
+        """Remove a single key from the index"""
+        await self.remove_many([key], pipe=pipe)
+
+    async def remove_many(self, keys: Sequence[str], pipe=None) -> None:
+        """Remove many keys from the index"""
+        if not keys:
+            return
+
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+
+        if self.lexical:
+            previous = await self.redis.hmget(self.members_key, list(keys))
+            stale = [old for old in previous if old]
+            if stale:
+                pipe.zrem(self.index_key, *stale)
+            pipe.hdel(self.members_key, *keys)
+        else:
+            pipe.zrem(self.index_key, *keys)
+
+        if own_pipe:
+            await pipe.execute()
+
+    async def clear(self) -> None:
+        """Drop the index entirely (the indexed keys are left untouched)"""
+        await self.redis.delete(self.index_key, self.members_key, self.ready_key)
+
+    # ------------------------
+    # READ OPERATIONS
+    # ------------------------
+
+    async def count(self) -> int:
+        """Number of keys in the index"""
+        return await self.redis.zcard(self.index_key)
+
+    async def keys(self, start: int = 0, stop: int = -1, desc: bool = False) -> List[str]:
+        """Return indexed keys in index order for the inclusive rank range [start, stop]"""
+        if desc:
+            members = await self.redis.zrevrange(self.index_key, start, stop)
+        else:
+            members = await self.redis.zrange(self.index_key, start, stop)
+        if self.lexical:
+            return [member.rsplit(_LEX_SEPARATOR, 1)[-1] for member in members]
+        return list(members)
+
+    async def page(
+        self,
+        limit: int,
+        after: Optional[Tuple[float, str]] = None,
+        desc: bool = False
+    ) -> List[Tuple[str, float]]:
+        """
+        Keyset page of (key, score) pairs for a scored index.
+        `after` is the (score, key) of the last item on the previous page; the page
+        continues strictly after it, so results stay stable while keys are added.
+        Costs O(log n + limit) regardless of page depth.
+        """
+        if self.lexical:
+            raise ValueError("Keyset paging is only supported on scored indexes")
+
+        if after is None:
+            if desc:
+                return await self.redis.zrevrange(self.index_key, 0, limit - 1, withscores=True)
+            return await self.redis.zrange(self.index_key, 0, limit - 1, withscores=True)
+
+        score, key = after
+        # Keys sharing the cursor's score are ordered by key; keep those past the cursor
+        ties = await self.redis.zrangebyscore(self.index_key, score, score, withscores=True)
+        if desc:
+            ties = [(member, s) for member, s in reversed(ties) if member < key]
+            rest = await self.redis.zrevrangebyscore(
+                self.index_key, f"({score}", "-inf", start=0, num=limit, withscores=True
+            )
+        else:
+            ties = [(member, s) for member, s in ties if member > key]
+            rest = await self.redis.zrangebyscore(
+                self.index_key, f"({score}", "+inf", start=0, num=limit, withscores=True
+            )
+        return (ties + list(rest))[:limit]
+
+    async def fetch(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """Fetch values for keys with one MGET per REDIS_BATCH_SIZE keys, preserving order"""
+        values: List[Optional[str]] = []
+        for offset in range(0, len(keys), REDIS_BATCH_SIZE):
+            values.extend(await self.redis.mget(keys[offset:offset + REDIS_BATCH_SIZE]))
+        return values
+
+    async def fetch_all(self, desc: bool = False) -> List[Tuple[str, Optional[str]]]:
+        """Return (key, value) pairs for every indexed key in index order"""
+        keys = await self.keys(desc=desc)
+        values = await self.fetch(keys)
+
+        # Keys that expired or were deleted outside the index are pruned lazily
+        missing = [key for key, value in zip(keys, values) if value is None]
+        if missing:
+            logger.warning(f"Pruning {len(missing)} dangling keys from {self.index_key}")
+            await self.remove_many(missing)
+
+        return list(zip(keys, values))
+
+    # ------------------------
+    # BACKFILL
+    # ------------------------
+
+    async def ensure_built(self, sort_value: Callable[[str, str], Any]) -> None:
+        """
+        Backfill the index once from the existing keyspace.
+        Uses SCAN (non-blocking, cursor based) rather than KEYS, and only runs
+        until the ready marker is set, so steady-state reads never scan.
+        `sort_value(key, raw_value)` extracts the sort value from a stored record.
+        """
+        if await self.redis.exists(self.ready_key):
+            return
+
+        logger.info(f"Building Redis index {self.index_key} from existing keys")
+        batch: List[str] = []
+        total = 0
+        async for key in self.redis.scan_iter(match=f"{self.namespace}:*", count=REDIS_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= REDIS_BATCH_SIZE:
+                total += await self._index_batch(batch, sort_value)
+                batch = []
+        if batch:
+            total += await self._index_batch(batch, sort_value)
+
+        await self.redis.set(self.ready_key, "1")
+        logger.info(f"Indexed {total} keys into {self.index_key}")
+
+    async def _index_batch(self, keys: List[str], sort_value: Callable[[str, str], Any]) -> int:
+        values = await self.redis.mget(keys)
+        items = []
+        for key, raw in zip(keys, values):
+            if raw is None:
+                continue
+            try:
+                items.append((key, sort_value(key, raw)))
+            except Exception as e:
+                logger.warning(f"Skipping unindexable key {key}: {e}")
+        await self.add_many(items)
+        return len(items)
+
+    # ------------------------
+    # HELPERS
+    # ------------------------
+
+    def _lex_member(self, key: str, value: Any) -> str:
+        return f"{str(value or '').casefold()}{_LEX_SEPARATOR}{key}"
+
+    @staticmethod
+    def _score(value: Any) -> float:
+        if value is None:
+            return 0.0
+        if hasattr(value, "timestamp"):
+            return value.timestamp()
+        return float(value)
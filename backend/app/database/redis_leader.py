@@ -0,0 +1,41 @@
+# backend/app/database/redis_leader.py
+from typing import Awaitable, Callable
+from redis.exceptions import RedisError
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+async def run_as_leader(redis_client, name: str, ttl: float, job: Callable[[], Awaitable[object]]) -> bool:
+    """
+    Run `job` in exactly one of the worker processes sharing `redis_client`.
+
+    The first worker to take the lock `lock:{name}` (SET NX with a token, expiring
+    after `ttl` seconds) runs the job; the others return immediately.
+    On success the lock is left to expire, so workers that boot later in the same
+    rollout (or restart) within `ttl` skip the job too. On failure it is released
+    so the next worker to start can retry.
+
+    Returns True if this worker ran the job successfully.
+    """
+    lock = redis_client.lock(f"lock:{name}", timeout=ttl, blocking=False)
+    try:
+        if not await lock.acquire():
+            logger.info(f"Skipping {name}: another worker holds the lock")
+            return False
+    except (RedisError, OSError) as e:
+        logger.warning(f"Could not take lock for {name}, skipping: {e}")
+        return False
+
+    logger.info(f"Acquired lock for {name}, running it in this worker")
+    try:
+        await job()
+        return True
+    except Exception as e:
+        logger.error(f"{name} failed: {e}")
+        try:
+            await lock.release()
+        except (RedisError, OSError) as release_error:
+            logger.warning(f"Could not release lock for {name}: {release_error}")
+        return False
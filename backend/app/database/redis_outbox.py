@@ -0,0 +1,105 @@
+# backend/app/database/redis_outbox.py
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from redis.exceptions import RedisError
+from backend.app.database.redis_index import RedisKeyIndex
+from backend.app.database.redis_scan_index import RedisScanIndex
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+_SET = "set"
+_DELETE = "delete"
+
+
+class RedisWriteOutbox:
+    """
+    Outbox for write-through cache updates of one indexed Redis namespace.
+
+    Writers enqueue the latest state of a key (set or delete) and call `flush()`.
+    Operations are coalesced per key, so only the newest state is ever sent.
+    If Redis is briefly unavailable the operations stay queued and are retried
+    by `run_forever()` (started on application startup) or the next flush.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        index: RedisKeyIndex,
+        scan_index: Optional[RedisScanIndex] = None,
+        retry_interval: float = 5.0,
+        max_pending: int = 10000
+    ):
+        self.redis = redis_client
+        self.index = index
+        self.scan_index = scan_index
+        self.retry_interval = retry_interval
+        self.max_pending = max_pending
+        self._pending: "OrderedDict[str, Tuple[str, Optional[str], Any, Optional[Tuple[str, str]]]]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Number of keys waiting to be written to Redis"""
+        return len(self._pending)
+
+    def enqueue_set(self, key: str, value: str, sort_value: Any, scan: Optional[Tuple[str, str]] = None) -> None:
+        """
+        Queue `SET key value` and index the key under `sort_value`.
+        `scan` is an optional (code, scan index entry) pair registering the key's barcode.
+        """
+        self._enqueue(key, (_SET, value, sort_value, scan))
+
+    def enqueue_delete(self, key: str) -> None:
+        """Queue `DEL key` and removal from the index"""
+        self._enqueue(key, (_DELETE, None, None, None))
+
+    def _enqueue(self, key: str, op: Tuple[str, Optional[str], Any, Optional[Tuple[str, str]]]) -> None:
+        self._pending.pop(key, None)
+        self._pending[key] = op
+        if len(self._pending) > self.max_pending:
+            # Oldest entries are dropped; the next `/sync/` repairs them
+            dropped, _ = self._pending.popitem(last=False)
+            logger.warning(f"Redis outbox full, dropped pending write for {dropped}")
+
+    async def flush(self) -> bool:
+        """Send all queued operations in one pipeline. Returns False if Redis is unavailable."""
+        async with self._lock:
+            if not self._pending:
+                return True
+
+            batch = dict(self._pending)
+            sets = {key: op for key, op in batch.items() if op[0] == _SET}
+            deletes = [key for key, op in batch.items() if op[0] == _DELETE]
+
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                if sets:
+                    pipe.mset({key: op[1] for key, op in sets.items()})
+                    await self.index.add_many([(key, op[2]) for key, op in sets.items()], pipe=pipe)
+                    scans = dict(op[3] for op in sets.values() if op[3])
+                    if scans and self.scan_index:
+                        await self.scan_index.add_many(scans, pipe=pipe)
+                if deletes:
+                    pipe.delete(*deletes)
+                    await self.index.remove_many(deletes, pipe=pipe)
+                await pipe.execute()
+            except (RedisError, OSError) as e:
+                logger.warning(f"Redis unavailable, {len(batch)} cache writes kept in outbox: {e}")
+                return False
+
+            # Drop flushed operations unless a newer one was queued meanwhile
+            for key, op in batch.items():
+                if self._pending.get(key) is op:
+                    del self._pending[key]
+            return True
+
+    async def run_forever(self) -> None:
+        """Retry queued operations every `retry_interval` seconds"""
+        while True:
+            await asyncio.sleep(self.retry_interval)
+            if self._pending:
+                if await self.flush():
+                    logger.info("Redis outbox drained")
@@ -0,0 +1,104 @@
+# backend/app/database/redis_scan_index.py
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Entity types a scanned code can resolve to
+SCAN_ITEM = "item"
+SCAN_PROJECT = "project"
+
+
+def sign_code(code: str, uuid: str) -> str:
+    """blake2b signature linking a barcode to the uuid it was generated for"""
+    return hashlib.blake2b(code.encode(), key=uuid.encode(), digest_size=8).hexdigest().upper()
+
+
+class RedisScanIndex:
+    """
+    Redis hash resolving scanned codes to the Redis key of the entity they label.
+
+    Fields are item `bar_code`s and project `project_barcode`s; values hold the
+    entity type and key plus the uuid and signature needed to verify the code, so
+    a scan is one HGET (or one HMGET for a batch) followed by a GET of the entity.
+
+    Entries are never removed eagerly: `resolve_many` drops an entry once its key
+    is gone or no longer carries the scanned code (deleted or re-coded entities).
+    """
+
+    def __init__(self, redis_client, hash_key: str = "index:scan"):
+        self.redis = redis_client
+        self.hash_key = hash_key
+        self.ready_key = f"{hash_key}:ready"
+
+    @staticmethod
+    def entry(entity_type: str, key: str, uuid: str, signature: str) -> str:
+        """Encode the hash value stored for one code"""
+        return json.dumps({"t": entity_type, "k": key, "u": uuid, "s": signature})
+
+    # ------------------------
+    # WRITE OPERATIONS
+    # ------------------------
+
+    async def add_many(self, entries: Mapping[str, str], pipe=None) -> None:
+        """Map codes to encoded entries (see `entry`); queued on `pipe` when given"""
+        if not entries:
+            return
+        if pipe is not None:
+            pipe.hset(self.hash_key, mapping=dict(entries))
+        else:
+            await self.redis.hset(self.hash_key, mapping=dict(entries))
+
+    async def remove_many(self, codes: Sequence[str]) -> None:
+        if codes:
+            await self.redis.hdel(self.hash_key, *codes)
+
+    async def is_built(self) -> bool:
+        return bool(await self.redis.exists(self.ready_key))
+
+    async def mark_built(self) -> None:
+        await self.redis.set(self.ready_key, "1")
+
+    # ------------------------
+    # READ OPERATIONS
+    # ------------------------
+
+    async def resolve_many(self, codes: Sequence[str]) -> Dict[str, Tuple[str, str, Optional[Dict[str, Any]], bool]]:
+        """
+        Resolve codes with one HMGET and one MGET.
+        Returns {code: (entity_type, key, record, verified)} for every code found;
+        `verified` is False when the stored signature does not match the code.
+        """
+        if not codes:
+            return {}
+
+        raw_entries = await self.redis.hmget(self.hash_key, list(codes))
+        found: Dict[str, Dict[str, str]] = {}
+        for code, raw in zip(codes, raw_entries):
+            if raw:
+                try:
+                    found[code] = json.loads(raw)
+                except ValueError:
+                    logger.warning(f"Ignoring malformed scan index entry for {code}")
+        if not found:
+            return {}
+
+        records = await self.redis.mget([entry["k"] for entry in found.values()])
+        resolved: Dict[str, Tuple[str, str, Optional[Dict[str, Any]], bool]] = {}
+        stale: List[str] = []
+        for (code, entry), raw in zip(found.items(), records):
+            record = json.loads(raw) if raw else None
+            code_field = "bar_code" if entry["t"] == SCAN_ITEM else "project_barcode"
+            if record is None or record.get(code_field) != code:
+                stale.append(code)
+                continue
+            verified = sign_code(code, entry["u"]) == entry["s"] and str(record.get("uuid")) == entry["u"]
+            resolved[code] = (entry["t"], entry["k"], record, verified)
+
+        if stale:
+            logger.info(f"Dropping {len(stale)} stale codes from {self.hash_key}")
+            await self.remove_many(stale)
+        return resolved
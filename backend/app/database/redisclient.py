@@ -1,8 +1,15 @@
 # backend/app/database/redisclient.py
 import redis
-from backend.app.config import REDIS_URL  # Import REDIS_URL from config
+from backend.app.config import (  # Import REDIS_URL from config
+    REDIS_URL,
+    REDIS_OUTBOX_RETRY_SECONDS,
+    HEALTH_CHECK_TIMEOUT,
+    HEALTH_CHECK_MAX_DELAY,
+    HEALTH_CHECK_RETRIES,
+    HEALTH_CHECK_BASE_DELAY
+)
 from redis.exceptions import RedisError
-import time
+import asyncio
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -12,6 +19,9 @@ from backend.app.schema.entry_inventory_schema import (
     StoreInventoryRedis
 )
 from redis import asyncio as aioredis
+from backend.app.database.redis_index import RedisKeyIndex
+from backend.app.database.redis_outbox import RedisWriteOutbox
+from backend.app.database.redis_scan_index import RedisScanIndex
 import json
 import os
 
@@ -38,40 +48,52 @@ except Exception as e:
     logger.error(f"Failed to initialize Redis client: {e}")
     raise
 
+# Sorted-set indexes over the Redis namespaces read by the UI and the upload
+# `inventory:*` is ordered by item name, `to_event_inventory:*` by `updated_at`
+inventory_index = RedisKeyIndex(redis_client, "inventory", lexical=True)
+to_event_index = RedisKeyIndex(redis_client, "to_event_inventory")
+inventory_item_index = RedisKeyIndex(redis_client, "inventory_item")
+
+# Scanned `bar_code` / `project_barcode` -> key of the item or project it labels
+scan_index = RedisScanIndex(redis_client)
+
+# Write-through updates of `inventory:*` from create/update/delete, retried while Redis is down
+inventory_outbox = RedisWriteOutbox(
+    redis_client,
+    inventory_index,
+    scan_index=scan_index,
+    retry_interval=REDIS_OUTBOX_RETRY_SECONDS
+)
+
 def get_redis_client():
     """Returns the Redis client instance."""
     logger.debug("Returning Redis client instance.")
     return redis_client
 
 # Check Redis Connectivity
-def check_redis_connectivity():
+async def check_redis_connectivity():
     """Check Redis connectivity asynchronously."""
     try:
-        logger.info("Pinging Redis server to check connectivity...")
+        logger.debug("Pinging Redis server to check connectivity...")
         # Ping the Redis server to check if it's available
-        if redis_client.ping():
-            logger.info("Redis is connected.")
+        if await asyncio.wait_for(redis_client.ping(), timeout=HEALTH_CHECK_TIMEOUT):
+            logger.debug("Redis is connected.")
             return True
-    except RedisError as e:
+    except (RedisError, OSError, asyncio.TimeoutError) as e:
         logger.error(f"Redis connection failed: {e}")
-        return False
+    return False
 
 # Optional: Retry mechanism for Redis connectivity check
-def check_redis_connectivity_with_retry(retries=3, delay=5):
-    """Check Redis connectivity with retries."""
-    attempt = 0
-    while attempt < retries:
-        try:
-            logger.info(f"Attempting to ping Redis server... (Attempt {attempt + 1}/{retries})")
-            # Ping the Redis server to check if it's available
-            if redis_client.ping():
-                logger.info("Redis is connected.")
-                return True
-        except RedisError as e:
-            logger.error(f"Redis connection failed on attempt {attempt + 1}: {e}")
-            attempt += 1
-            logger.info(f"Retrying in {delay} seconds... ({attempt}/{retries})")
-            time.sleep(delay)
+async def check_redis_connectivity_with_retry(retries=HEALTH_CHECK_RETRIES, delay=HEALTH_CHECK_BASE_DELAY):
+    """Check Redis connectivity with retries and exponential backoff."""
+    for attempt in range(retries):
+        logger.info(f"Attempting to ping Redis server... (Attempt {attempt + 1}/{retries})")
+        if await check_redis_connectivity():
+            logger.info("Redis is connected.")
+            return True
+        if attempt + 1 < retries:
+            wait = min(HEALTH_CHECK_MAX_DELAY, delay * 2 ** attempt)
+            logger.info(f"Retrying in {wait:.1f} seconds... ({attempt + 1}/{retries})")
+            await asyncio.sleep(wait)
     logger.error("Redis connection failed after all retries.")
     return False
-
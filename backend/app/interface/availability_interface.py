@@ -0,0 +1,27 @@
+# backend/app/interface/availability_interface.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from typing import Optional
+from backend.app.schema.availability_schema import AvailabilityOut, BookingCheckIn, BookingCheckOut
+
+class AvailabilityInterface:
+    """Interface for stock availability against event commitments."""
+
+    async def get_availability(
+        self, db: AsyncSession, inventory_id: str, from_date: date, to_date: date
+    ) -> Optional[AvailabilityOut]:
+        """
+        Committed and free units of one stock entry for every day in [from_date, to_date],
+        read from the materialised `inventory_commitments` table.
+        Returns None if the entry does not exist.
+        """
+        raise NotImplementedError
+
+    async def check_booking(self, db: AsyncSession, candidate: BookingCheckIn) -> Optional[BookingCheckOut]:
+        """
+        Check a candidate project's items against every other project whose
+        setup_date..event_date window overlaps its own.
+        Reports the overlapping projects and the shortfall per stock entry.
+        Returns None if `candidate.project_id` names no staged or uploaded project.
+        """
+        raise NotImplementedError
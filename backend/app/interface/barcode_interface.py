@@ -0,0 +1,41 @@
+# backend/app/interface/barcode_interface.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from backend.app.schema.barcode_schema import BarcodeImageOut
+
+class BarcodeImageInterface:
+    """Interface for rendering and serving barcode label images."""
+
+    async def render_for_inventory_ids(self, db: AsyncSession, inventory_ids: List[str]) -> List[BarcodeImageOut]:
+        """
+        Pre-render the PNG label images of the given items that are not cached yet, in the process pool.
+        Returns one BarcodeImageOut per requested inventory_id, in request order.
+        """
+        raise NotImplementedError
+
+    async def image_path(
+        self,
+        db: AsyncSession,
+        bar_code: str,
+        unique_code: str,
+        fmt: str = "png",
+        dpi: int = 300
+    ) -> Optional[Path]:
+        """
+        Cached PNG/SVG image for a genuine (bar_code, unique_code) pair, rendered on first request.
+        Returns None if no item or project carries that pair.
+        """
+        raise NotImplementedError
+
+    async def label_sheet_labels(
+        self,
+        db: AsyncSession,
+        inventory_ids: Optional[List[str]] = None,
+        project_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Labels (code, title, detail lines) for the given items, or for a project:
+        the project's own label followed by the inventory entries named in its items.
+        """
+        raise NotImplementedError
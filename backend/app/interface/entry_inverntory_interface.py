@@ -2,7 +2,7 @@
 
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession 
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from backend.app.models.entry_inventory_model import EntryInventory
 from backend.app.schema.entry_inventory_schema import (
     EntryInventoryCreate,
@@ -13,6 +13,9 @@ from backend.app.schema.entry_inventory_schema import (
     EntryInventorySearch,
     DateRangeFilter,
     DateRangeFilterOut,
+    EntryInventoryBulkOut,
+    EntryInventoryOut,
+    FuzzyMatchOut,
 )
 from pydantic import BaseModel
 from datetime import date
@@ -28,9 +31,23 @@ class EntryInventoryInterface:
         """
         pass
     
-    async def get_all_entries(self, db: AsyncSession, skip: int = 0) -> List[EntryInventoryUpdateOut]:
+    async def create_entry_inventories_bulk(self, db: AsyncSession, items: List[dict]) -> EntryInventoryBulkOut:
         """
-        Retrieve all EntryInventory entries.
+        Create many EntryInventory entries in one call.
+        Each item is validated independently; returns a per-item result list.
+        """
+        pass
+    
+    async def get_all_entries(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[EntryInventoryUpdateOut]:
+        """
+        Retrieve one page of EntryInventory entries ordered by (name, uuid).
+        `cursor` continues after the last entry of the previous page.
         This method will return a list of EntryInventoryOut schema instances.
         """
         pass
@@ -45,6 +62,23 @@ class EntryInventoryInterface:
         Returns single EntryInventoryUpdateOut instance or None if not found.
         """
         pass
+
+    async def get_by_bar_code(
+        self,
+        db: AsyncSession,
+        bar_code: str
+    ) -> Optional[EntryInventoryOut]:
+        """
+        Get inventory entry by its scanned bar_code.
+        Served from the in-process lookup cache when possible.
+        """
+        pass
+
+    async def lookup_cache_stats(self) -> Dict[str, Any]:
+        """
+        Size and hit/miss counters of this worker's in-process lookup cache.
+        """
+        pass
     
     async def update_entry(
         self,
@@ -81,6 +115,18 @@ class EntryInventoryInterface:
         """
         pass
 
+    async def fuzzy_search(
+        self,
+        db: AsyncSession,
+        query: str,
+        limit: int = 10
+    ) -> List[FuzzyMatchOut]:
+        """
+        Typo-tolerant search by item name, best matches first.
+        Served from this worker's in-memory name index.
+        """
+        pass
+
     async def get_by_date_range(
         self,
         db: AsyncSession,
@@ -94,11 +140,26 @@ class EntryInventoryInterface:
 
     async def store_inventory_in_redis(
         self, 
-        db: AsyncSession
-    ) -> List[StoreInventoryRedis]:
+        db: AsyncSession,
+        chunk_size: int = 1000,
+        incremental: bool = False
+    ) -> dict:
+        """
+        Stream inventory entries into Redis in chunks of `chunk_size`.
+        With `incremental`, only rows changed since the last sync are copied;
+        a full sync also removes keys of rows deleted behind the write-through cache.
+        Returns sync statistics (mode, rows synced/deleted, watermark, rows/sec).
+        """
+        pass
+
+    async def export_entries(
+        self,
+        export_format: str = "ndjson",
+        chunk_size: int = 1000
+    ) -> AsyncIterator[str]:
         """
-        Store all inventory entries in Redis.
-        Returns complete list of StoreInventoryRedis instances.
+        Stream every inventory entry as NDJSON lines or CSV rows.
+        Yields text chunks of `chunk_size` rows each.
         """
         pass
 
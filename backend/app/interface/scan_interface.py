@@ -0,0 +1,23 @@
+# backend/app/interface/scan_interface.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional
+from backend.app.schema.scan_schema import ScanResult
+
+class ScanInterface:
+    """Interface for resolving scanned item and project barcodes."""
+
+    async def resolve_code(self, db: AsyncSession, code: str) -> Optional[ScanResult]:
+        """
+        Resolve a scanned `bar_code` or `project_barcode` to the item or project it labels.
+        Uses the Redis scan index first and falls back to the database.
+        Returns None if no entity carries the code.
+        """
+        raise NotImplementedError
+
+    async def resolve_codes(self, db: AsyncSession, codes: List[str]) -> Dict[str, ScanResult]:
+        """
+        Resolve many scanned codes with one pipelined Redis lookup and, for the
+        codes Redis does not know, one `IN` query per table.
+        Returns {code: ScanResult} for every code found.
+        """
+        raise NotImplementedError
@@ -0,0 +1,13 @@
+# backend/app/interface/stock_interface.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.app.schema.stock_schema import StockGrouping, StockSummaryOut
+
+class StockInterface:
+    """Interface for server-side stock rollups."""
+
+    async def get_summary(self, db: AsyncSession, group_by: StockGrouping) -> StockSummaryOut:
+        """
+        Sum total_quantity / issued_qty / balance_qty per location bucket or product
+        with one GROUP BY query. Results are cached in Redis until the next inventory write.
+        """
+        raise NotImplementedError
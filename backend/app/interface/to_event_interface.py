@@ -11,7 +11,8 @@ from backend.app.schema.to_event_inventry_schma import (
     ToEventRedis,
     ToEventRedisOut,
     ToEventRedisUpdateOut,
-    ToEventRedisUpdateIn
+    ToEventRedisUpdateIn,
+    ToEventRedisPage
 )
 from pydantic import BaseModel
 from datetime import date
@@ -45,6 +46,19 @@ class ToEventInventoryInterface:
         pass
 
 
+    async def load_submitted_project_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        order: str = "desc"
+    ) -> ToEventRedisPage:
+        """
+        Retrieve one page of submitted projects from local Redis ordered by updated_at.
+        `cursor` is the `next_cursor` returned with the previous page.
+        """
+        pass
+
+
     async def search_entries_by_project_id(
         self,
         db: AsyncSession,
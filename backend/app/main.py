@@ -5,9 +5,13 @@ import logging
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import JSONResponse
-from backend.app.database.database import check_db_connectivity, check_sync_db_connectivity_with_retry, check_async_db_connectivity_with_retry
-from backend.app.database.redisclient import check_redis_connectivity_with_retry
-from backend.app.routers import entry_inventory_routes, to_event_routes  # Import the router for entry inventory
+from backend.app.database.database import AsyncSessionLocal, check_sync_db_connectivity_with_retry, check_async_db_connectivity_with_retry
+from backend.app.database.redisclient import check_redis_connectivity_with_retry, inventory_outbox, redis_client
+from backend.app.database.redis_leader import run_as_leader
+from backend.app.curd.entry_inverntory_curd import EntryInventoryService
+from backend.app.utils.barcode_renderer import barcode_renderer
+from backend.app.routers import entry_inventory_routes, to_event_routes, health_routes, scan_routes, barcode_routes, stock_routes, availability_routes  # Import the router for entry inventory
+from backend.app import config
 from fastapi.staticfiles import StaticFiles
 
 # Set up logging for the main script
@@ -33,35 +37,53 @@ async def index():
     """
     logger.info("Root endpoint accessed.")
     return {"message": "Ticket Management System"}
+async def wait_for_dependencies():
+    """
+    Probe Redis and the database(s) concurrently, each retrying with exponential backoff.
+    Failures are logged only; `/health/ready` keeps reporting 503 until they recover.
+    """
+    logger.info("Checking Redis and database connectivity...")
+    checks = {
+        "Redis": check_redis_connectivity_with_retry(),
+        "Async database": check_async_db_connectivity_with_retry(),
+    }
+    # Sync DB Check (only when the sync engine is enabled; runs in a thread so it never blocks the loop)
+    if not config.DB_ASYNC_ONLY:
+        checks["Sync database"] = asyncio.to_thread(check_sync_db_connectivity_with_retry)
+
+    results = await asyncio.gather(*checks.values())
+    for name, ok in zip(checks, results):
+        if ok:
+            logger.info(f"{name} connection successful.")
+        else:
+            logger.error(f"{name} connectivity check failed during startup.")
+    return all(results)
+
+async def warm_inventory_cache():
+    """Full inventory sync into Redis, so the first `/show-all/` reads are served from cache."""
+    async with AsyncSessionLocal() as db:
+        stats = await EntryInventoryService().store_inventory_in_redis(db)
+    logger.info(f"Inventory cache warmed: {stats}")
+
+async def startup_tasks():
+    """Wait for dependencies, then let a single worker (Redis lock) warm the caches."""
+    if await wait_for_dependencies() and config.WARMUP_ON_STARTUP:
+        await run_as_leader(redis_client, "warmup:inventory", config.WARMUP_LOCK_TTL_SECONDS, warm_inventory_cache)
+
 @app.on_event("startup")
 async def startup_event():
     """
     Event handler that runs on application startup.
-    - Ensures DB, Redis, and Razorpay connections are established.
+    - Starts the dependency checks (and the one-worker cache warmup) in the background
+      so the server accepts `/health/live` immediately; readiness is reported by `/health/ready`.
     """
     logger.info("Application started.")
     logger.info("Running setup tasks...")
 
-    # Checking Redis connectivity
-    logger.info("Checking Redis connectivity...")
-    if not check_redis_connectivity_with_retry(retries=3, delay=5):
-        logger.error("Redis connectivity check failed during startup.")
-        raise HTTPException(status_code=500, detail="Redis connection failed")
-
-    logger.info("Redis connection successful.")
+    app.state.startup_task = asyncio.create_task(startup_tasks())
 
-    # Checking database connectivity (sync and async)
-    logger.info("Checking database connectivity...")
-
-    # Sync DB Check
-    if not check_sync_db_connectivity_with_retry(retries=3, delay=5):
-        logger.error("Sync database connectivity check failed during startup.")
-        raise HTTPException(status_code=500, detail="Sync database connection failed")
-
-    # Async DB Check
-    await check_async_db_connectivity_with_retry(retries=3, delay=5)
-
-    logger.info("Database connection successful.")
+    # Retry write-through cache updates that were queued while Redis was unavailable
+    app.state.outbox_task = asyncio.create_task(inventory_outbox.run_forever())
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -70,6 +92,13 @@ async def shutdown_event():
     """
     logger.info("Application shutdown...")
 
+    for task_name in ("startup_task", "outbox_task"):
+        task = getattr(app.state, task_name, None)
+        if task:
+            task.cancel()
+    await inventory_outbox.flush()
+    barcode_renderer.shutdown()
+
 # Exception Handler for HTTPException
 @app.exception_handler(HTTPException)
 async def custom_http_exception_handler(request, exc: HTTPException):
@@ -90,7 +119,12 @@ async def custom_http_exception_handler(request, exc: HTTPException):
 # Include the entry inventory routes with a versioned prefix
 app.include_router(entry_inventory_routes.router, prefix="/api/v1", tags=["Entry Inventory"])
 app.include_router(to_event_routes.router, prefix="/api/v1", tags=["To Event Inventory"])
+app.include_router(scan_routes.router, prefix="/api/v1", tags=["Scan"])
+app.include_router(barcode_routes.router, prefix="/api/v1", tags=["Barcodes"])
+app.include_router(stock_routes.router, prefix="/api/v1", tags=["Stock"])
+app.include_router(availability_routes.router, prefix="/api/v1", tags=["Availability"])
+app.include_router(health_routes.router, tags=["Health"])
 
 if __name__ == "__main__":
-    # Running the FastAPI app with Uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # Running the FastAPI app with Uvicorn (development; use `python -m backend.app.server` in production)
+    uvicorn.run("backend.app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,15 +1,16 @@
 # backend/app/models/entry_inventory_model.py
 import uuid
-from sqlalchemy import Column, String, Date, DateTime, Index
+from sqlalchemy import Column, String, Date, DateTime, Index, Integer, Numeric, Boolean, false, text
 from sqlalchemy.sql import func
 from backend.app.database.base import Base
 from datetime import datetime, timezone
 from barcode import Code128
 from barcode.writer import ImageWriter
 from sqlalchemy import event, select
+from sqlalchemy.exc import IntegrityError
 import os
 import hashlib
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,23 +25,23 @@ class EntryInventory(Base):
     inventory_id = Column(String, index=True, nullable=False, unique=True)
     name = Column(String, nullable=True)
     material = Column(String, nullable=True)
-    total_quantity = Column(String, nullable=True)
+    total_quantity = Column(Integer, nullable=True)
     manufacturer = Column(String, nullable=True)
     purchase_dealer = Column(String, nullable=True)
     purchase_date = Column(Date)
-    purchase_amount = Column(String, nullable=True)
-    repair_quantity = Column(String, nullable=True)
-    repair_cost = Column(String, nullable=True)
-    on_rent = Column(String, nullable=False, default="false")
+    purchase_amount = Column(Numeric(12, 2, asdecimal=False), nullable=True)
+    repair_quantity = Column(Integer, nullable=True)
+    repair_cost = Column(Numeric(12, 2, asdecimal=False), nullable=True)
+    on_rent = Column(Boolean, nullable=False, default=False, server_default=false())
     vendor_name = Column(String, nullable=True)
-    total_rent = Column(String, nullable=True)
-    rented_inventory_returned = Column(String, nullable=False, default="false")
+    total_rent = Column(Numeric(12, 2, asdecimal=False), nullable=True)
+    rented_inventory_returned = Column(Boolean, nullable=False, default=False, server_default=false())
     returned_date = Column(Date)
-    on_event = Column(String, nullable=False, default="false")
-    in_office = Column(String, nullable=False, default="false")
-    in_warehouse = Column(String, nullable=False, default="false")
-    issued_qty = Column(String, nullable=True)
-    balance_qty = Column(String, nullable=True)
+    on_event = Column(Boolean, nullable=False, default=False, server_default=false())
+    in_office = Column(Boolean, nullable=False, default=False, server_default=false())
+    in_warehouse = Column(Boolean, nullable=False, default=False, server_default=false())
+    issued_qty = Column(Integer, nullable=True)
+    balance_qty = Column(Integer, nullable=True)
     submitted_by = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -53,6 +54,8 @@ class EntryInventory(Base):
         Index('ix_entry_inventory_updated_at', 'updated_at'),
         Index('ix_entry_inventory_product_id', 'product_id'),
         Index('ix_entry_inventory_inventory_id', 'inventory_id'),
+        # Keyset pagination sorts unnamed entries as '' (a NULL name never compares in a row comparison)
+        Index('ix_entry_inventory_name_uuid', text("coalesce(name, '')"), 'uuid'),
     )
 
     def __init__(self, **kwargs) -> None:
@@ -99,7 +102,7 @@ class EntryInventory(Base):
             'inventory_id': self.inventory_id,
             'manufacturer': self.manufacturer,
             'purchase_date': str(self.purchase_date) if self.purchase_date else None,
-            'status': 'Available' if not bool(self.on_rent) else 'On Rent',
+            'status': 'On Rent' if self.on_rent else 'Available',
             'contact': 'inventory@tagglabs.com'
         }
 
@@ -148,21 +151,32 @@ class EntryInventory(Base):
     def __repr__(self) -> str:
         return f"<EntryInventory(uuid={self.uuid}, name={self.name}, product_id={self.product_id})>"
 
+def assign_linked_codes(entries: Iterable[EntryInventory]) -> None:
+    """
+    Allocate bar_code/unique_code for a batch of new entries without touching the database.
+    Codes are unique within the batch; uniqueness against stored rows is guarded by the
+    unique constraints alone (a 12-digit code space makes collisions rare enough to retry).
+    """
+    seen_bar_codes, seen_unique_codes = set(), set()
+    for entry in entries:
+        bar_code, unique_code = entry.generate_linked_codes()
+        while bar_code in seen_bar_codes or unique_code in seen_unique_codes:
+            entry.uuid = str(uuid.uuid4())
+            bar_code, unique_code = entry.generate_linked_codes()
+        seen_bar_codes.add(bar_code)
+        seen_unique_codes.add(unique_code)
+        entry.bar_code = bar_code
+        entry.unique_code = unique_code
+
+def is_barcode_collision(error: IntegrityError) -> bool:
+    """True if an IntegrityError was raised by the bar_code/unique_code unique constraints"""
+    message = str(getattr(error, 'orig', error))
+    return 'bar_code' in message or 'unique_code' in message
+
 @event.listens_for(EntryInventory, 'before_insert')
 def generate_linked_codes(mapper, connection, target):
-    # Generate linked codes using instance method
-    bar_code, unique_code = target.generate_linked_codes()
-    
-    # Ensure uniqueness
-    while connection.execute(
-        select(EntryInventory).where(
-            (EntryInventory.bar_code == bar_code) |
-            (EntryInventory.unique_code == unique_code)
-        )
-    ).first():
-        target.uuid = str(uuid.uuid4())
-        bar_code, unique_code = target.generate_linked_codes()
-    
-    # Assign codes
-    target.bar_code = bar_code
-    target.unique_code = unique_code
\ No newline at end of file
+    # Codes pre-allocated by `assign_linked_codes` are kept. No SQL runs here, so the
+    # flush never blocks the event loop; collisions surface as IntegrityError instead
+    if target.bar_code and target.unique_code:
+        return
+    target.bar_code, target.unique_code = target.generate_linked_codes()
\ No newline at end of file
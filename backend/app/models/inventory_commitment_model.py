@@ -0,0 +1,43 @@
+#  backend/app/models/inventory_commitment_model.py
+
+from sqlalchemy import Column, String, Date, Integer, Index, ForeignKey, text
+from sqlalchemy.dialects.postgresql import UUID
+from backend.app.database.base import Base
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+class InventoryCommitment(Base):
+    """
+    Materialised match of one event item (`inventory_items`) to the stock entry
+    (`entry_inventory`) it draws on, with the dates the units are away.
+    Maintained by `backend.app.curd.availability_curd`; never edited by hand.
+    """
+    __tablename__ = "inventory_commitments"
+
+    # One commitment per event item
+    item_id = Column(UUID(as_uuid=True), ForeignKey('inventory_items.id', ondelete='CASCADE'), primary_key=True)
+    project_id = Column(UUID(as_uuid=True), ForeignKey('to_event_inventory.id', ondelete='CASCADE'), nullable=False)
+    entry_uuid = Column(String, ForeignKey('entry_inventory.uuid', ondelete='CASCADE'), nullable=False)
+
+    # Inclusive window from setup_date to event_date
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    quantity = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index('ix_inventory_commitments_project_id', 'project_id'),
+        # Overlap (`&&`) lookups per entry on the inclusive window; entry_uuid in a GiST index needs btree_gist
+        Index(
+            'ix_inventory_commitments_entry_window',
+            'entry_uuid', text("daterange(start_date, end_date, '[]')"),
+            postgresql_using='gist'
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<InventoryCommitment(item_id={self.item_id}, entry_uuid={self.entry_uuid}, "
+            f"{self.start_date}..{self.end_date}, quantity={self.quantity})>"
+        )
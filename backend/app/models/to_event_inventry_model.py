@@ -1,7 +1,7 @@
 #  backend/app/models/to_event_inventry_model.py
 
 import uuid
-from sqlalchemy import Column, String, Date, DateTime, Index, Integer, ForeignKey
+from sqlalchemy import Column, String, Date, DateTime, Index, Integer, ForeignKey, text
 from sqlalchemy.sql import func
 from backend.app.database.base import Base
 from datetime import datetime, timezone
@@ -78,6 +78,12 @@ class InventoryItem(Base):
     # Relationship back to project
     project = relationship("ToEventInventory", back_populates="items")
 
+    # Availability refreshes look items up by project and by the normalised name they share with stock entries
+    __table_args__ = (
+        Index('ix_inventory_items_project_id', 'project_id'),
+        Index('ix_inventory_items_name_key', text('lower(trim(name))')),
+    )
+
     def __init__(self, **kwargs: Dict[str, Any]) -> None:
         super().__init__(**kwargs)
 
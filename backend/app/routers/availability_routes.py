@@ -0,0 +1,66 @@
+# backend/app/routers/availability_routes.py
+import logging
+from datetime import date, timedelta
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.app.database.database import get_async_db
+from backend.app.schema.availability_schema import AvailabilityOut, BookingCheckIn, BookingCheckOut
+from backend.app.curd.availability_curd import AvailabilityService
+from backend.app import config
+
+# Dependency to get the availability service
+def get_availability_service() -> AvailabilityService:
+    return AvailabilityService()
+
+# Set up the router
+router = APIRouter()
+
+# Setup logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Check a candidate project against every overlapping project before confirming it
+@router.post("/availability/check",
+             response_model=BookingCheckOut,
+             status_code=200,
+             summary="Check a booking for stock conflicts",
+             description="Matches the candidate project's items (a staged/uploaded project_id and/or explicit items and dates) to stock entries and reports, per entry, the projects whose setup_date..event_date windows overlap, the peak units they hold and the shortfall. `ok` is true when every item fits.",
+)
+async def check_booking(
+    payload: BookingCheckIn,
+    db: AsyncSession = Depends(get_async_db),
+    service: AvailabilityService = Depends(get_availability_service)
+):
+    result = await service.check_booking(db, payload)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Project {payload.project_id} not found")
+    if not result.ok:
+        logger.info(f"Booking check for {payload.project_id or 'ad-hoc project'} found shortfalls on {sum(1 for item in result.items if item.shortfall)} items")
+    return result
+
+# Committed and free units of one stock entry per day, for planners booking events
+@router.get("/availability/{inventory_id}",
+            response_model=AvailabilityOut,
+            status_code=200,
+            summary="Day-by-day availability of an inventory entry",
+            description="Returns the units of an entry committed to events (setup_date through event_date) and still free on every day of the range, with the commitments behind them. Defaults to the next AVAILABILITY_DEFAULT_DAYS days.",
+)
+async def get_availability(
+    inventory_id: str,
+    from_date: Optional[date] = Query(None, description="First day (default: today)"),
+    to_date: Optional[date] = Query(None, description="Last day, inclusive"),
+    db: AsyncSession = Depends(get_async_db),
+    service: AvailabilityService = Depends(get_availability_service)
+):
+    from_date = from_date or date.today()
+    to_date = to_date or from_date + timedelta(days=config.AVAILABILITY_DEFAULT_DAYS - 1)
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="to_date must not be before from_date")
+    if (to_date - from_date).days + 1 > config.AVAILABILITY_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"At most {config.AVAILABILITY_MAX_DAYS} days per request")
+
+    availability = await service.get_availability(db, inventory_id, from_date, to_date)
+    if availability is None:
+        raise HTTPException(status_code=404, detail=f"Inventory entry {inventory_id} not found")
+    return availability
@@ -0,0 +1,114 @@
+# backend/app/routers/barcode_routes.py
+import logging
+import re
+from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.app.database.database import get_async_db
+from backend.app.schema.barcode_schema import BarcodeRenderIn, BarcodeImageOut, LabelSheetIn
+from backend.app.curd.barcode_curd import BarcodeImageService
+from backend.app.utils.barcode_renderer import MEDIA_TYPES
+from backend.app.utils.label_sheet import paginate, render_label_page_png, render_label_page_raw, stream_pdf
+from backend.app import config
+
+# Dependency to get the barcode image service
+def get_barcode_image_service() -> BarcodeImageService:
+    return BarcodeImageService()
+
+# Set up the router
+router = APIRouter()
+
+# Setup logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+_IMAGE_NAME = re.compile(r"^([A-Za-z0-9-]+)_([A-Za-z0-9-]+)\.(png|svg)$")
+
+# Render label images for many items ahead of printing
+@router.post("/barcodes/render",
+             response_model=List[BarcodeImageOut],
+             status_code=200,
+             summary="Render barcode label images",
+             description="Renders the missing PNG label images of the given items into the image cache using a process pool (the API keeps serving meanwhile) and returns their URLs.",
+)
+async def render_barcodes(
+    payload: BarcodeRenderIn,
+    db: AsyncSession = Depends(get_async_db),
+    service: BarcodeImageService = Depends(get_barcode_image_service)
+):
+    if len(payload.inventory_ids) > config.MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {config.MAX_BULK_ITEMS} items per request")
+    try:
+        return await service.render_for_inventory_ids(db, payload.inventory_ids)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Barcode rendering failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Barcode rendering failed")
+
+# Printable label sheet for many items or a whole project
+@router.post("/barcodes/labels",
+             response_class=StreamingResponse,
+             status_code=200,
+             summary="Generate a printable label sheet",
+             description="Composes A4 sheets of labels (barcode, name, IDs) for a list of inventory_ids or a project_id. Pages are rendered in parallel in the render pool; a PDF is streamed page by page as soon as each page is ready, a PNG returns the requested page. The page count is returned in the X-Total-Pages header.",
+)
+async def label_sheet(
+    payload: LabelSheetIn,
+    db: AsyncSession = Depends(get_async_db),
+    service: BarcodeImageService = Depends(get_barcode_image_service)
+):
+    if payload.inventory_ids and len(payload.inventory_ids) > config.MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {config.MAX_BULK_ITEMS} items per sheet")
+
+    # Labels are loaded before streaming starts; the DB session is not used while pages render
+    labels = await service.label_sheet_labels(db, payload.inventory_ids, payload.project_id)
+    if not labels:
+        raise HTTPException(status_code=404, detail="No labels found")
+
+    pages = paginate(labels)
+    headers = {"X-Total-Pages": str(len(pages))}
+    name = re.sub(r"[^A-Za-z0-9_-]", "_", payload.project_id or "inventory")
+
+    if payload.format == "png":
+        if payload.page > len(pages):
+            raise HTTPException(status_code=404, detail=f"Page {payload.page} of {len(pages)} does not exist")
+        image = await service.renderer.run(render_label_page_png, pages[payload.page - 1])
+        return Response(content=image, media_type="image/png", headers=headers)
+
+    # Every page is submitted up front so the whole pool works on the sheet
+    rendering = [service.renderer.run(render_label_page_raw, page) for page in pages]
+    headers["Content-Disposition"] = f'attachment; filename="labels_{name}.pdf"'
+    return StreamingResponse(stream_pdf(rendering), media_type="application/pdf", headers=headers)
+
+# Serve a label image `{bar_code}_{unique_code}.{png|svg}`, rendering it on first request
+@router.get("/barcodes/{filename}",
+            response_class=FileResponse,
+            status_code=200,
+            summary="Get a barcode label image",
+            description="Serves `{bar_code}_{unique_code}.png` or `.svg`, rendering it into the LRU disk cache the first time it is requested. Images never change for a given name and dpi, so they are sent with a long-lived immutable Cache-Control header.",
+)
+async def get_barcode_image(
+    filename: str,
+    dpi: int = Query(config.BARCODE_DEFAULT_DPI, description=f"PNG resolution, one of {config.BARCODE_DPI_CHOICES} (ignored for SVG)"),
+    db: AsyncSession = Depends(get_async_db),
+    service: BarcodeImageService = Depends(get_barcode_image_service)
+):
+    match = _IMAGE_NAME.match(filename)
+    if not match:
+        raise HTTPException(status_code=404, detail="Barcode image not found")
+
+    if dpi not in config.BARCODE_DPI_CHOICES:
+        raise HTTPException(status_code=400, detail=f"dpi must be one of {config.BARCODE_DPI_CHOICES}")
+
+    bar_code, unique_code, fmt = match.groups()
+    path = await service.image_path(db, bar_code, unique_code, fmt, dpi)
+    if not path:
+        raise HTTPException(status_code=404, detail="Barcode image not found")
+
+    return FileResponse(
+        path,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Cache-Control": f"public, max-age={config.BARCODE_CACHE_MAX_AGE}, immutable"}
+    )
@@ -1,7 +1,8 @@
 # backend/app/routers/entry_inventory_routes.py
 import logging
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Optional, List, Dict, Any
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, Body
+from fastapi.responses import StreamingResponse
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, HTTPException, Depends
@@ -13,10 +14,13 @@ from backend.app.schema.entry_inventory_schema import (
     EntryInventoryOut,
     InventoryRedisOut,
     EntryInventorySearch,
-    DateRangeFilter
+    DateRangeFilter,
+    EntryInventoryBulkOut,
+    FuzzyMatchOut
 )
 from backend.app.curd.entry_inverntory_curd import EntryInventoryService
 from backend.app.interface.entry_inverntory_interface import EntryInventoryInterface
+from backend.app import config
 
 # Dependency to get the entry inventory service
 def get_entry_inventory_service() -> EntryInventoryService:
@@ -94,6 +98,8 @@ async def get_inventory_by_date_range(
     }
 )
 async def sync_redis(
+    chunk_size: int = Query(config.REDIS_SYNC_CHUNK_SIZE, ge=1, le=10000, description="Rows streamed and written to Redis per batch"),
+    incremental: bool = Query(False, description="Only copy rows changed since the last sync (a full sync also drops keys of deleted rows)"),
     service: EntryInventoryService = Depends(get_entry_inventory_service),
     db: AsyncSession = Depends(get_async_db)
 ):
@@ -101,20 +107,24 @@ async def sync_redis(
     Synchronize all inventory data from database to Redis cache.
     
     This endpoint will:
-    1. Fetch all inventory entries from the database
-    2. Store them in Redis with proper serialization
-    3. Return success/failure status
+    1. Stream inventory entries (all, or only those changed since the last sync) from the database in chunks
+    2. Store each chunk in Redis with a single pipeline
+    3. Return success/failure status with throughput statistics
     """
     try:
         logger.info("Starting Redis sync operation")
-        success = await service.store_inventory_in_redis(db)
+        stats = await service.store_inventory_in_redis(db, chunk_size=chunk_size, incremental=incremental)
         
-        if not success:
+        if not stats:
             logger.warning("Redis sync completed with warnings")
             return {"status": "completed with warnings"}
             
         logger.info("Redis sync completed successfully")
-        return {"status": "success", "message": "All inventory entries synced to Redis"}
+        message = (
+            "Changed inventory entries synced to Redis" if stats.get("mode") == "incremental"
+            else "All inventory entries synced to Redis"
+        )
+        return {"status": "success", "message": message, **stats}
         
     except HTTPException:
         # Re-raise HTTPExceptions (they're intentional)
@@ -219,6 +229,26 @@ async def create_inventory_item_route(
     except Exception as e:
         logger.error(f"Error creating inventory item: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+
+# CREATE: Add many entries to the inventory in one request
+@router.post("/create-items/bulk",
+    response_model=EntryInventoryBulkOut,
+    status_code=200,
+    summary="Create many entries in the inventory",
+    description="Creates up to MAX_BULK_ITEMS entries in one request. Every item is validated on its own and the response reports success or failure per item.",
+)
+async def create_inventory_items_bulk_route(
+    items: List[Dict[str, Any]] = Body(..., description="Items in the same format as /create-item/"),
+    db: AsyncSession = Depends(get_async_db),
+    service: EntryInventoryService = Depends(get_entry_inventory_service)
+):
+    if not items:
+        raise HTTPException(status_code=400, detail="No items provided")
+    if len(items) > config.MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {config.MAX_BULK_ITEMS} items can be created per request")
+
+    logger.info(f"Bulk create request with {len(items)} items")
+    return await service.create_entry_inventories_bulk(db, items)
 # ________________________________________________________________________________________
 
 # READ: Get an inventory which is match from inventry ID
@@ -239,6 +269,35 @@ async def get_inventory_item(
         raise HTTPException(status_code=404, detail="EntryInventory not found")
     return entry_inventory
 
+# READ: Get an entry by its scanned bar_code
+@router.get("/fetch-by-barcode/{bar_code}",
+            response_model=EntryInventoryOut,
+            status_code=200,
+            summary="Get an entry from the inventory by its bar_code",
+            description="This endpoint is used by barcode scanners. It takes a bar_code as a parameter and returns the matching entry; repeated scans are served from an in-process cache.",
+            response_model_exclude_unset=True,
+)
+async def get_inventory_item_by_barcode(
+    bar_code: str,
+    db: AsyncSession = Depends(get_async_db),
+    service: EntryInventoryService = Depends(get_entry_inventory_service)
+):
+    entry_inventory = await service.get_by_bar_code(db, bar_code)
+    if not entry_inventory:
+        raise HTTPException(status_code=404, detail="EntryInventory not found")
+    return entry_inventory
+
+# Hit-rate counters of the in-process lookup cache (per worker process)
+@router.get("/lookup-cache/stats",
+            status_code=200,
+            summary="In-process lookup cache statistics",
+            description="Returns size, hits, misses and hit rate of this worker's cache for inventory_id, product_id and bar_code lookups.",
+)
+async def get_lookup_cache_stats(
+    service: EntryInventoryService = Depends(get_entry_inventory_service)
+) -> Dict[str, Any]:
+    return await service.lookup_cache_stats()
+
 # READ ALL: Get entire inventory entries direct from database (no search) according in sequence alphabetical order
 @router.get("/getlist",
             response_model=list[EntryInventoryOut],
@@ -248,16 +307,23 @@ async def get_inventory_item(
             response_model_exclude_unset=True,
 )
 async def get_all_entire_inventory(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0, description="Offset, only used when no cursor is given"),
+    limit: int = Query(100, ge=1, le=config.MAX_PAGE_SIZE, description="Number of items per page"),
+    cursor: Optional[str] = Query(None, description="Value of the X-Next-Cursor header from the previous page"),
     db: AsyncSession = Depends(get_async_db),
     service: EntryInventoryService = Depends(get_entry_inventory_service)
 ):
-    """Get all inventory items"""
+    """Get one page of inventory items; the next page's cursor is returned in the X-Next-Cursor header"""
     try:
-        items = await service.get_all_entries(db, skip, limit)
+        items = await service.get_all_entries(db, skip=skip, limit=limit, cursor=cursor)
+        next_cursor = service.next_cursor(items, limit)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         logger.info(f"Retrieved {len(items)} inventory items")
         return items
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching inventory items: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -316,6 +382,22 @@ async def search_inventory(
         logger.error(f"Search failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error during search")
     
+
+#  Typo-tolerant search by item name (e.g. "lde par cn" finds "LED Par Can")
+@router.get(
+    "/search/fuzzy",
+    response_model=List[FuzzyMatchOut],
+    status_code=200,
+    summary="Fuzzy search inventory items by name",
+    description="Ranks item names by similarity to `q` (RapidFuzz WRatio, 0-100) and returns the best matches; an empty list when nothing is close enough.",
+)
+async def fuzzy_search_inventory(
+    q: str = Query(..., min_length=1, max_length=200, description="Item name, typos allowed"),
+    limit: int = Query(10, ge=1, le=config.FUZZY_SEARCH_MAX_RESULTS, description="Maximum number of matches"),
+    db: AsyncSession = Depends(get_async_db),
+    service: EntryInventoryService = Depends(get_entry_inventory_service)
+):
+    return await service.fuzzy_search(db, q, limit)
     
 # UPDATE: Update an existing inventory entry
 @router.put("/update/{inventory_id}",
@@ -374,6 +456,27 @@ async def delete_inventory_item(
         logger.error(f"Error deleting inventory item {inventory_id}: {e}")
         raise HTTPException(status_code=400, detail=str(e))
     
+# EXPORT: Stream the entire inventory as NDJSON or CSV
+@router.get("/export",
+            status_code=200,
+            summary="Stream the full inventory",
+            description="Streams every inventory entry as NDJSON (one JSON object per line) or CSV with constant server memory.",
+            response_class=StreamingResponse,
+)
+async def export_inventory(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Output format: ndjson or csv"),
+    chunk_size: int = Query(config.REDIS_SYNC_CHUNK_SIZE, ge=1, le=10000, description="Rows fetched per database round trip"),
+    service: EntryInventoryService = Depends(get_entry_inventory_service)
+):
+    """Stream all EntryInventory rows without materialising them in memory."""
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    logger.info(f"Starting inventory export as {format}")
+    return StreamingResponse(
+        service.export_entries(format, chunk_size),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=entry_inventory.{format}"}
+    )
+
 # READ ALL: Get all inventory entries
 @router.get("/entries",
             response_model=list[EntryInventoryOut],
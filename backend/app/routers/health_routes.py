@@ -0,0 +1,44 @@
+# backend/app/routers/health_routes.py
+import asyncio
+import logging
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from backend.app.database.database import check_async_db_connectivity
+from backend.app.database.redisclient import check_redis_connectivity
+
+# Set up the router
+router = APIRouter()
+
+# Set up logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Liveness probe: the process is up and the event loop is responsive
+@router.get("/health/live", include_in_schema=True)
+async def health_live():
+    """
+    Liveness probe. Never touches Redis or Postgres, so a dependency outage
+    does not get the process restarted.
+    """
+    return {"status": "alive"}
+
+# Readiness probe: Redis and Postgres are reachable
+@router.get("/health/ready", include_in_schema=True)
+async def health_ready():
+    """
+    Readiness probe. Pings Redis and runs `SELECT 1` concurrently, each bounded by
+    HEALTH_CHECK_TIMEOUT. Returns 503 until every dependency answers.
+    """
+    redis_ok, database_ok = await asyncio.gather(
+        check_redis_connectivity(),
+        check_async_db_connectivity()
+    )
+    checks = {
+        "redis": "ok" if redis_ok else "unavailable",
+        "database": "ok" if database_ok else "unavailable",
+    }
+    if redis_ok and database_ok:
+        return {"status": "ready", "checks": checks}
+
+    logger.warning(f"Readiness check failed: {checks}")
+    return JSONResponse(status_code=503, content={"status": "not ready", "checks": checks})
@@ -0,0 +1,64 @@
+# backend/app/routers/scan_routes.py
+import logging
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.app.database.database import get_async_db
+from backend.app.schema.scan_schema import ScanResult, ScanBatchIn, ScanBatchOut
+from backend.app import config
+from backend.app.curd.scan_curd import ScanService
+
+# Dependency to get the scan service
+def get_scan_service() -> ScanService:
+    return ScanService()
+
+# Set up the router
+router = APIRouter()
+
+# Setup logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Resolve every code scanned from a pallet or crate in one request
+@router.post("/scan/batch",
+             response_model=ScanBatchOut,
+             status_code=200,
+             summary="Resolve a batch of scanned barcodes",
+             description="Resolves up to MAX_BULK_ITEMS item/project codes with one pipelined Redis lookup (one IN query per table for the rest), verifies every signature and returns the found, missing and tampered codes.",
+)
+async def scan_batch(
+    payload: ScanBatchIn,
+    db: AsyncSession = Depends(get_async_db),
+    service: ScanService = Depends(get_scan_service)
+):
+    # Duplicate scans of the same label are resolved once
+    codes = list(dict.fromkeys(code.strip() for code in payload.codes if code.strip()))
+    if len(codes) > config.MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {config.MAX_BULK_ITEMS} codes per batch")
+
+    results = await service.resolve_codes(db, codes)
+    found = [results[code] for code in codes if code in results and results[code].verified]
+    tampered = [code for code in codes if code in results and not results[code].verified]
+    missing = [code for code in codes if code not in results]
+    if tampered:
+        logger.warning(f"Batch scan rejected {len(tampered)} codes with invalid signatures")
+    return ScanBatchOut(found=found, missing=missing, tampered=tampered)
+
+# Resolve a scanned item `bar_code` or project `project_barcode`
+@router.get("/scan/{code}",
+            response_model=ScanResult,
+            status_code=200,
+            summary="Resolve a scanned barcode",
+            description="Resolves an item bar_code or a project project_barcode with one Redis hash lookup (database fallback) and verifies its blake2b signature. Returns 400 if the signature does not match.",
+)
+async def scan_code(
+    code: str,
+    db: AsyncSession = Depends(get_async_db),
+    service: ScanService = Depends(get_scan_service)
+):
+    result = await service.resolve_code(db, code)
+    if not result:
+        raise HTTPException(status_code=404, detail="Item not found")
+    if not result.verified:
+        logger.warning(f"Rejected scan of {code}: signature mismatch on {result.key}")
+        raise HTTPException(status_code=400, detail="Invalid barcode signature")
+    return result
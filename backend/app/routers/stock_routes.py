@@ -0,0 +1,32 @@
+# backend/app/routers/stock_routes.py
+import logging
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.app.database.database import get_async_db
+from backend.app.schema.stock_schema import StockGrouping, StockSummaryOut
+from backend.app.curd.stock_curd import StockService
+
+# Dependency to get the stock service
+def get_stock_service() -> StockService:
+    return StockService()
+
+# Set up the router
+router = APIRouter()
+
+# Setup logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Stock rollup for dashboards: units on event / on rent / in warehouse / in office, or per product
+@router.get("/stock/summary",
+            response_model=StockSummaryOut,
+            status_code=200,
+            summary="Stock totals by location or product",
+            description="Sums total_quantity, issued_qty and balance_qty per location bucket (on_event, on_rent, in_warehouse, in_office, unassigned) or per product name with one GROUP BY query. Results are cached in Redis until the next inventory write.",
+)
+async def stock_summary(
+    group_by: StockGrouping = Query("location", description="location or product"),
+    db: AsyncSession = Depends(get_async_db),
+    service: StockService = Depends(get_stock_service)
+):
+    return await service.get_summary(db, group_by)
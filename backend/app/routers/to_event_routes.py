@@ -19,7 +19,8 @@ from backend.app.schema.to_event_inventry_schma import (
     ToEventRedis,
     ToEventRedisOut,
     ToEventRedisUpdateOut,
-    ToEventRedisUpdateIn
+    ToEventRedisUpdateIn,
+    ToEventRedisPage
 )
 from backend.app.curd.to_event_inventry_curd import ToEventInventoryService
 from backend.app.interface.to_event_interface import ToEventInventoryInterface
@@ -55,33 +56,13 @@ async def upload_to_event_data(
     try:
         logger.info("Starting Redis to database upload process")
         
-        # Get data from service
-        inventory_items = await service.upload_to_event_inventory(db)
-        
-        # Prepare response
-        results = []
-        for item in inventory_items:
-            # Ensure we have proper timestamps
-            created_at = item.created_at if hasattr(item, 'created_at') else datetime.now(timezone.utc)
-            updated_at = item.updated_at if hasattr(item, 'updated_at') else datetime.now(timezone.utc)
-            
-            # Handle both ToEventRedisOut and direct database models
-            project_id = getattr(item, 'project_id', None)
-            if not project_id and hasattr(item, 'id'):
-                project_id = item.id
-                
-            results.append({
-                "success": True,
-                "message": "Upload successful",
-                "project_id": project_id,
-                "inventory_items_count": len(getattr(item, 'inventory_items', [])),
-                "created_at": created_at,
-                "updated_at": updated_at,
-                # Explicitly omit cretaed_at unless present in data
-                **({'cretaed_at': item.cretaed_at} if hasattr(item, 'cretaed_at') else {})
-            })
-            
-        logger.info(f"Successfully processed {len(results)} items")
+        # Service reports success or failure per project
+        results = await service.upload_to_event_inventory(db)
+
+        failed = [result.project_id for result in results if not result.success]
+        if failed:
+            logger.warning(f"Upload failed for {len(failed)} projects: {failed}")
+        logger.info(f"Successfully processed {len(results) - len(failed)} items")
         return results
         
     except ValidationError as ve:
@@ -134,12 +115,13 @@ async def create_inventory_item_route(
     response_model_exclude_unset=True,
 )
 async def load_submitted_project_from_redis(
-    skip: int = Query(0, description="Number of items to skip for pagination"),
+    skip: int = Query(0, ge=0, description="Number of items to skip for pagination"),
+    limit: int = Query(10, ge=1, le=100, description="Number of items to return"),
     service: ToEventInventoryService = Depends(get_to_event_service)
 ):
     try:
-        logger.info(f"Loading submitted projects from Redis, skip={skip}")
-        projects = await service.load_submitted_project_from_redis(skip)
+        logger.info(f"Loading submitted projects from Redis, skip={skip}, limit={limit}")
+        projects = await service.load_submitted_project_from_redis(skip, limit)
         return projects
     except HTTPException:
         raise
@@ -147,6 +129,29 @@ async def load_submitted_project_from_redis(
         logger.error(f"Error loading projects from Redis: {e}")
         raise HTTPException(status_code=400, detail=str(e))
     
+# Page through submitted projects in local Redis with cursor tokens
+@router.get("/to_event-submitted-projects-redis/",
+    response_model=ToEventRedisPage,
+    status_code=200,
+    summary="Paginate submitted projects in Redis",
+    description="Returns one page of submitted projects ordered by updated_at. Pass `next_cursor` from the previous page as `cursor` to continue.",
+    response_model_exclude_unset=True,
+)
+async def list_submitted_projects_page(
+    limit: int = Query(10, ge=1, le=100, description="Number of projects per page"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="Sort by updated_at ascending or descending"),
+    service: ToEventInventoryService = Depends(get_to_event_service)
+):
+    try:
+        logger.info(f"Loading submitted project page from Redis, limit={limit}, order={order}")
+        return await service.load_submitted_project_page(limit=limit, cursor=cursor, order=order)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error paginating projects from Redis: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
 # Search project data project directly in local Redis  via `project_id`
 @router.get("/to_event-search-entries-by-project-id/{project_id}/",
     response_model=ToEventRedisOut,  # Changed from List[ToEventRedisOut]
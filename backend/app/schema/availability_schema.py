@@ -0,0 +1,74 @@
+# backend/app/schema/availability_schema.py
+from pydantic import BaseModel, Field, model_validator
+from datetime import date
+from typing import List, Optional
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Units of one stock entry committed to / free for events on one day
+class AvailabilityDay(BaseModel):
+    date: date
+    committed: int
+    free: int = Field(..., description="total_quantity minus committed units; negative when overbooked")
+
+# One event item drawing on the stock entry
+class CommitmentOut(BaseModel):
+    project_id: Optional[str] = None
+    project_name: Optional[str] = None
+    start_date: date
+    end_date: date
+    quantity: int
+
+# Day-by-day availability of one stock entry
+class AvailabilityOut(BaseModel):
+    inventory_id: str
+    name: Optional[str] = None
+    total_quantity: int
+    from_date: date
+    to_date: date
+    days: List[AvailabilityDay]
+    commitments: List[CommitmentOut]
+
+# One line of a candidate booking
+class BookingItemIn(BaseModel):
+    name: str
+    sno: Optional[str] = None
+    quantity: int = Field(1, ge=1)
+
+# Candidate project to check: a project staged/uploaded under `project_id`, explicit items, or both
+# (explicit items and dates replace the stored ones, e.g. when re-planning a project)
+class BookingCheckIn(BaseModel):
+    project_id: Optional[str] = None
+    setup_date: Optional[date] = None
+    event_date: Optional[date] = None
+    inventory_items: Optional[List[BookingItemIn]] = None
+
+    @model_validator(mode='after')
+    def check_candidate(self):
+        if not self.project_id and self.inventory_items is None:
+            raise ValueError("Provide a project_id or inventory_items")
+        if not self.project_id and not (self.setup_date or self.event_date):
+            raise ValueError("Provide setup_date and/or event_date for inventory_items")
+        return self
+
+# Requested vs. available units of one stock entry over the candidate window
+class BookingItemCheck(BaseModel):
+    name: str
+    inventory_id: Optional[str] = Field(None, description="Matched stock entry; None when no entry carries the name")
+    requested: int
+    total_quantity: int
+    peak_committed: int = Field(..., description="Most units other projects hold on any one day of the window")
+    peak_date: Optional[date] = None
+    shortfall: int = Field(..., description="Units missing on the peak day (0 when the booking fits)")
+    overlapping: List[CommitmentOut]
+
+# Outcome of a booking conflict check
+class BookingCheckOut(BaseModel):
+    project_id: Optional[str] = None
+    start_date: date
+    end_date: date
+    ok: bool
+    overlapping_projects: List[str]
+    items: List[BookingItemCheck]
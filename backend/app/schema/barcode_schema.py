@@ -0,0 +1,31 @@
+# backend/app/schema/barcode_schema.py
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Literal, Optional
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Items whose label images should be rendered ahead of printing
+class BarcodeRenderIn(BaseModel):
+    inventory_ids: List[str] = Field(..., min_length=1)
+
+# Rendered (or already present) label image of one item
+class BarcodeImageOut(BaseModel):
+    inventory_id: str
+    bar_code: str
+    image_url: Optional[str] = None
+    message: Optional[str] = None
+
+# Label sheet request: either explicit items or every item of a project
+class LabelSheetIn(BaseModel):
+    inventory_ids: Optional[List[str]] = None
+    project_id: Optional[str] = None
+    format: Literal["pdf", "png"] = "pdf"
+    page: int = Field(1, ge=1, description="Page returned when format is png")
+
+    @model_validator(mode='after')
+    def exactly_one_source(self):
+        if bool(self.inventory_ids) == bool(self.project_id):
+            raise ValueError("Provide either inventory_ids or project_id")
+        return self
@@ -1,34 +1,58 @@
 #  backend/app/schema/entry_inventory_schema.py
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationError, field_validator
 from datetime import datetime, date, timezone
-from typing import Optional
+from typing import Optional, List
 import re
 from pydantic import validator
 import json
- 
-class EntryInventoryBase(BaseModel):
+
+# Typed stock columns: counts are integers, money amounts are numeric, status flags are booleans
+QUANTITY_FIELDS = ('total_quantity', 'repair_quantity', 'issued_qty', 'balance_qty')
+AMOUNT_FIELDS = ('purchase_amount', 'repair_cost', 'total_rent')
+FLAG_FIELDS = ('on_rent', 'rented_inventory_returned', 'on_event', 'in_office', 'in_warehouse')
+
+class StockFieldsModel(BaseModel):
+    """
+    Coerces spreadsheet / legacy input for the typed stock columns.
+    "12", "12.0" and "true"/"yes"/"1" are parsed by Pydantic itself; blank
+    numbers become None and missing flags False.
+    """
+
+    @field_validator(*QUANTITY_FIELDS, *AMOUNT_FIELDS, mode='before', check_fields=False)
+    def blank_number_to_none(cls, v):
+        if isinstance(v, str) and not v.strip():
+            return None
+        return v
+
+    @field_validator(*FLAG_FIELDS, mode='before', check_fields=False)
+    def missing_flag_to_false(cls, v):
+        if v is None or (isinstance(v, str) and not v.strip()):
+            return False
+        return v
+
+class EntryInventoryBase(StockFieldsModel):
     product_id: str  
     inventory_id: str  
     sno: Optional[str] = None
     name: str
     material: Optional[str] = None
-    total_quantity: str
+    total_quantity: Optional[int] = None  # NULL for legacy values that were not numbers
     manufacturer: Optional[str] = None
     purchase_dealer: Optional[str] = None
     purchase_date: Optional[date] = None
-    purchase_amount: Optional[str] = None
-    repair_quantity: Optional[str] = None
-    repair_cost: Optional[str] = None
-    on_rent: str = "false"  # Changed to non-optional with default
+    purchase_amount: Optional[float] = None
+    repair_quantity: Optional[int] = None
+    repair_cost: Optional[float] = None
+    on_rent: bool = False
     vendor_name: Optional[str] = None
-    total_rent: Optional[str] = None
-    rented_inventory_returned: str = "false"  # Changed to non-optional with default
+    total_rent: Optional[float] = None
+    rented_inventory_returned: bool = False
     returned_date: Optional[date] = None  # Added this missing field
-    on_event: str = "false"  # Changed to non-optional with default
-    in_office: str = "false"  # Changed to non-optional with default
-    in_warehouse: str = "false"  # Changed to non-optional with default
-    issued_qty: Optional[str] = None
-    balance_qty: Optional[str] = None
+    on_event: bool = False
+    in_office: bool = False
+    in_warehouse: bool = False
+    issued_qty: Optional[int] = None
+    balance_qty: Optional[int] = None
     submitted_by: str
 
     # These should NOT be in the create schema
@@ -68,17 +92,11 @@ class EntryInventoryBase(BaseModel):
     
 # Schema for creating or updating EntryInventory (without UUID and timestamps)
 class EntryInventoryCreate(EntryInventoryBase):
+    total_quantity: int  # Required for new entries; only legacy rows may lack it
+
     # Remove fields that should be auto-generated
     class Config:
         exclude = {'created_at', 'updated_at', 'uuid', 'bar_code'}
-        
-    @validator('on_rent', 'rented_inventory_returned', 'on_event', 'in_office', 'in_warehouse', pre=True)
-    def validate_booleans(cls, v):
-        if isinstance(v, bool):
-            return "true" if v else "false"
-        if isinstance(v, str):
-            return v.lower()
-        return "false"
 
 # Schema for reading EntryInventory (includes inventory_id and timestamp fields)
 class EntryInventoryOut(EntryInventoryBase):
@@ -88,22 +106,22 @@ class EntryInventoryOut(EntryInventoryBase):
     sno: Optional[str] = None
     name: str
     material: Optional[str] = None
-    total_quantity: str
+    total_quantity: Optional[int] = None  # NULL for legacy values that were not numbers
     manufacturer: Optional[str] = None
     purchase_dealer: Optional[str] = None
     purchase_date: Optional[date] = None
-    purchase_amount: Optional[str] = None
-    repair_quantity: Optional[str] = None
-    repair_cost: Optional[str] = None
-    on_rent: Optional[str] = "false"  # Default value
+    purchase_amount: Optional[float] = None
+    repair_quantity: Optional[int] = None
+    repair_cost: Optional[float] = None
+    on_rent: bool = False
     vendor_name: Optional[str] = None
-    total_rent: Optional[str] = None
-    rented_inventory_returned: Optional[str] = "false"  # Default value
-    on_event: Optional[str] = "false"  # Default value
-    in_office: Optional[str] = "false"  # Default value
-    in_warehouse: Optional[str] = "false"  # Default value
-    issued_qty: Optional[str] = None
-    balance_qty: Optional[str] = None
+    total_rent: Optional[float] = None
+    rented_inventory_returned: bool = False
+    on_event: bool = False
+    in_office: bool = False
+    in_warehouse: bool = False
+    issued_qty: Optional[int] = None
+    balance_qty: Optional[int] = None
     submitted_by: str
     created_at: datetime
     updated_at: datetime
@@ -121,25 +139,25 @@ class EntryInventoryOut(EntryInventoryBase):
             date: lambda v: v.isoformat()  # For pure date fields
         } # For Pydantic v2 compatibility
    
-class EntryInventoryUpdate(BaseModel):
+class EntryInventoryUpdate(StockFieldsModel):
     name: str
     material: Optional[str] = None
-    total_quantity: str
+    total_quantity: Optional[int] = None  # NULL for legacy values that were not numbers
     manufacturer: Optional[str] = None
     purchase_dealer: Optional[str] = None
     purchase_date: Optional[date] = None
-    purchase_amount: Optional[str] = None
-    repair_quantity: Optional[str] = None
-    repair_cost: Optional[str] = None
-    on_rent: Optional[str] = "false"  # Default value
+    purchase_amount: Optional[float] = None
+    repair_quantity: Optional[int] = None
+    repair_cost: Optional[float] = None
+    on_rent: bool = False
     vendor_name: Optional[str] = None
-    total_rent: Optional[str] = None
-    rented_inventory_returned: Optional[str] = "false"  # Default value
-    on_event: Optional[str] = "false"  # Default value
-    in_office: Optional[str] = "false"  # Default value
-    in_warehouse: Optional[str] = "false"  # Default value
-    issued_qty: Optional[str] = None
-    balance_qty: Optional[str] = None
+    total_rent: Optional[float] = None
+    rented_inventory_returned: bool = False
+    on_event: bool = False
+    in_office: bool = False
+    in_warehouse: bool = False
+    issued_qty: Optional[int] = None
+    balance_qty: Optional[int] = None
     submitted_by: str
     submitted_by: str
     updated_at: datetime
@@ -164,22 +182,22 @@ class EntryInventoryOut(EntryInventoryBase):
     sno: Optional[str] = None
     name: str
     material: Optional[str] = None
-    total_quantity: str
+    total_quantity: Optional[int] = None  # NULL for legacy values that were not numbers
     manufacturer: Optional[str] = None
     purchase_dealer: Optional[str] = None
     purchase_date: Optional[date] = None
-    purchase_amount: Optional[str] = None
-    repair_quantity: Optional[str] = None
-    repair_cost: Optional[str] = None
-    on_rent: Optional[str] = "false"
+    purchase_amount: Optional[float] = None
+    repair_quantity: Optional[int] = None
+    repair_cost: Optional[float] = None
+    on_rent: bool = False
     vendor_name: Optional[str] = None
-    total_rent: Optional[str] = None
-    rented_inventory_returned: Optional[str] = "false"
-    on_event: Optional[str] = "false"
-    in_office: Optional[str] = "false"
-    in_warehouse: Optional[str] = "false"
-    issued_qty: Optional[str] = None
-    balance_qty: Optional[str] = None
+    total_rent: Optional[float] = None
+    rented_inventory_returned: bool = False
+    on_event: bool = False
+    in_office: bool = False
+    in_warehouse: bool = False
+    issued_qty: Optional[int] = None
+    balance_qty: Optional[int] = None
     submitted_by: str
     created_at: datetime
     updated_at: datetime
@@ -234,7 +252,7 @@ class SyncInventoryOut(EntryInventoryBase):
     pass
 
 # Schema for Store record in Redis after clicking {sync} button
-class StoreInventoryRedis(BaseModel):
+class StoreInventoryRedis(StockFieldsModel):
     """Schema for storing inventory in Redis"""
     uuid: str
     sno: Optional[str] = None  # Changed to properly optional
@@ -242,22 +260,22 @@ class StoreInventoryRedis(BaseModel):
     product_id: str
     name: str
     material: Optional[str] = None
-    total_quantity: str
+    total_quantity: Optional[int] = None  # NULL for legacy values that were not numbers
     manufacturer: Optional[str] = None
     purchase_dealer: Optional[str] = None
     purchase_date: Optional[date] = None
-    purchase_amount: Optional[str] = None
-    repair_quantity: Optional[str] = None
-    repair_cost: Optional[str] = None
-    on_rent: Optional[str] = "false"  # Default value
+    purchase_amount: Optional[float] = None
+    repair_quantity: Optional[int] = None
+    repair_cost: Optional[float] = None
+    on_rent: bool = False
     vendor_name: Optional[str] = None
-    total_rent: Optional[str] = None
-    rented_inventory_returned: Optional[str] = "false"  # Default value
-    on_event: Optional[str] = "false"  # Default value
-    in_office: Optional[str] = "false"  # Default value
-    in_warehouse: Optional[str] = "false"  # Default value
-    issued_qty: Optional[str] = None
-    balance_qty: Optional[str] = None
+    total_rent: Optional[float] = None
+    rented_inventory_returned: bool = False
+    on_event: bool = False
+    in_office: bool = False
+    in_warehouse: bool = False
+    issued_qty: Optional[int] = None
+    balance_qty: Optional[int] = None
     submitted_by: str
     created_at: datetime
     updated_at: datetime
@@ -270,7 +288,7 @@ class StoreInventoryRedis(BaseModel):
         }
 
 # Schema to Show record from Redis after clicking {Show All} button
-class InventoryRedisOut(BaseModel):
+class InventoryRedisOut(StockFieldsModel):
     """Schema for retrieving inventory from Redis"""
 
     uuid: str
@@ -279,28 +297,57 @@ class InventoryRedisOut(BaseModel):
     product_id: str
     name: str
     material: Optional[str] = None
-    total_quantity: str
+    total_quantity: Optional[int] = None  # NULL for legacy values that were not numbers
     manufacturer: Optional[str] = None
     purchase_dealer: Optional[str] = None
     purchase_date: Optional[date] = None
-    purchase_amount: Optional[str] = None
-    repair_quantity: Optional[str] = None
-    repair_cost: Optional[str] = None
-    on_rent: Optional[str] = "false"  # Default value
+    purchase_amount: Optional[float] = None
+    repair_quantity: Optional[int] = None
+    repair_cost: Optional[float] = None
+    on_rent: bool = False
     vendor_name: Optional[str] = None
-    total_rent: Optional[str] = None
-    rented_inventory_returned: Optional[str] = "false"  # Default value
-    on_event: Optional[str] = "false"  # Default value
-    in_office: Optional[str] = "false"  # Default value
-    in_warehouse: Optional[str] = "false"  # Default value
-    issued_qty: Optional[str] = None
-    balance_qty: Optional[str] = None
+    total_rent: Optional[float] = None
+    rented_inventory_returned: bool = False
+    on_event: bool = False
+    in_office: bool = False
+    in_warehouse: bool = False
+    issued_qty: Optional[int] = None
+    balance_qty: Optional[int] = None
     submitted_by: str
     created_at: datetime
     updated_at: datetime
     barcode_image_url: Optional[str] = None  # Add this new field
 
+    @field_validator(*QUANTITY_FIELDS, *AMOUNT_FIELDS, mode='wrap')
+    def drop_unparseable_number(cls, v, handler):
+        # Records cached before the typed columns may hold free text such as "N/A"
+        try:
+            return handler(v)
+        except ValidationError:
+            return None
+
     @classmethod
     def from_redis(cls, redis_data: str):
         data = json.loads(redis_data)
-        return cls(**data)
\ No newline at end of file
+        return cls(**data)
+# Schema for the per-item outcome of a bulk create
+class EntryInventoryBulkResult(BaseModel):
+    index: int  # Position of the item in the request body
+    inventory_id: Optional[str] = None
+    product_id: Optional[str] = None
+    success: bool
+    message: str
+    item: Optional[StoreInventoryRedis] = None
+
+# Schema for the response of a bulk create
+class EntryInventoryBulkOut(BaseModel):
+    created: int
+    failed: int
+    results: List[EntryInventoryBulkResult]
+
+# Schema for one ranked hit of the fuzzy name search
+class FuzzyMatchOut(BaseModel):
+    inventory_id: str
+    product_id: Optional[str] = None
+    name: str
+    score: float  # RapidFuzz WRatio, 0-100
@@ -0,0 +1,26 @@
+# backend/app/schema/scan_schema.py
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Result of resolving one scanned item `bar_code` or project `project_barcode`
+class ScanResult(BaseModel):
+    code: str
+    entity_type: Literal["item", "project"]
+    key: str = Field(..., description="Redis key (inventory:{inventory_id} / to_event_inventory:{project_id}) or database id of the entity")
+    verified: bool = Field(..., description="The blake2b signature stored with the entity matches the scanned code")
+    source: Literal["redis", "database"]
+    data: Dict[str, Any]
+
+# Codes scanned from one pallet or crate
+class ScanBatchIn(BaseModel):
+    codes: List[str] = Field(..., min_length=1, description="Scanned item bar_codes and/or project_barcodes")
+
+# Outcome of a batch scan: verified entities, unknown codes and codes whose signature does not match
+class ScanBatchOut(BaseModel):
+    found: List[ScanResult]
+    missing: List[str]
+    tampered: List[str]
@@ -0,0 +1,31 @@
+# backend/app/schema/stock_schema.py
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Literal
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# `location` buckets entries by where their units are (on_event, on_rent, in_warehouse, in_office, unassigned);
+# `product` groups them by item name
+StockGrouping = Literal["location", "product"]
+
+# Summed stock columns of a set of inventory entries
+class StockTotals(BaseModel):
+    items: int = Field(..., description="Number of inventory entries")
+    total_quantity: int
+    issued_qty: int
+    balance_qty: int
+
+# Rollup of one location bucket or product name
+class StockGroup(StockTotals):
+    key: str
+
+# Stock rollup served to dashboards
+class StockSummaryOut(BaseModel):
+    group_by: StockGrouping
+    totals: StockTotals
+    groups: List[StockGroup]
+    generated_at: datetime
+    cached: bool = Field(False, description="Served from the Redis summary cache")
@@ -397,6 +397,14 @@ class ToEventRedisOut(ToEventInventoryOut):
             values['updated_at'] = datetime.now(timezone.utc)
             
         return values
+
+class ToEventRedisPage(BaseModel):
+    """One page of submitted projects read from Redis"""
+    items: List[ToEventRedisOut]
+    next_cursor: Optional[str] = None  # Opaque token for the following page, None on the last page
+    total: int
+    limit: int
+    order: str
     
 # ......................................................................................................
 class RedisInventoryItem(BaseModel):
@@ -0,0 +1,46 @@
+# backend/app/server.py
+"""
+Production launcher.
+
+    python -m backend.app.server
+
+Runs WEB_CONCURRENCY uvicorn worker processes (one per core by default) on
+uvloop + httptools when they are installed. Use `uvicorn backend.app.main:app --reload`
+for development instead.
+"""
+import importlib.util
+import logging
+import uvicorn
+from backend.app import config
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+console_handler = logging.StreamHandler()
+formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+console_handler.setFormatter(formatter)
+logger.addHandler(console_handler)
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def main() -> None:
+    loop = "uvloop" if _available("uvloop") else "asyncio"
+    http = "httptools" if _available("httptools") else "h11"
+    workers = max(1, config.WEB_CONCURRENCY)
+
+    logger.info(f"Starting {workers} worker(s) on {config.SERVER_HOST}:{config.SERVER_PORT} (loop={loop}, http={http})")
+    uvicorn.run(
+        "backend.app.main:app",
+        host=config.SERVER_HOST,
+        port=config.SERVER_PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# backend/app/utils/barcode_renderer.py
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
+import re
+import tempfile
+import time
+from backend.app import config
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# python-barcode writer options used for every label image (dpi only applies to PNG)
+BARCODE_WRITER_OPTIONS = {
+    "module_width": 0.2,
+    "module_height": 10.0,
+    "quiet_zone": 4.0,
+    "font_size": 8,
+    "text_distance": 4.0,
+}
+
+# Bump when BARCODE_WRITER_OPTIONS change so cached images are re-rendered under new names
+RENDER_VERSION = 1
+
+MEDIA_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+# Codes are digits / upper-case hex; anything else never reaches the filesystem
+_SAFE_CODE = re.compile(r"^[A-Za-z0-9-]{1,64}$")
+
+# Cached files are named by content hash; anything else in the directory is never evicted
+_CACHE_FILE = re.compile(r"^[0-9a-f]{32}\.(png|svg)$")
+
+
+def render_barcode(code: str, fmt: str = "png", dpi: int = 300) -> bytes:
+    """
+    Render a Code128 image for `code` as PNG (at `dpi`) or SVG.
+    Runs inside the worker processes, so it only imports what it needs.
+    """
+    from barcode import Code128
+    from barcode.writer import ImageWriter, SVGWriter
+
+    buffer = io.BytesIO()
+    if fmt == "svg":
+        Code128(code, writer=SVGWriter()).write(buffer, options=BARCODE_WRITER_OPTIONS)
+    else:
+        Code128(code, writer=ImageWriter()).write(buffer, options={**BARCODE_WRITER_OPTIONS, "dpi": dpi})
+    return buffer.getvalue()
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write to a temporary file in the same directory and rename it into place"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class BarcodeRenderer:
+    """
+    Renders barcode images lazily into a size-bounded, content-addressed disk cache.
+
+    - Images are keyed by (bar_code, unique_code, format, dpi) and only rendered
+      the first time they are requested
+    - Pillow rendering runs in a process pool (`max_workers` processes, started on first use)
+    - Concurrent requests for the same image share one render
+    - Files are written atomically, so a half-written image is never served
+    - Reads refresh a file's mtime; once the cache exceeds `max_bytes` the least
+      recently used files are deleted until it is back under 90% of the budget
+    """
+
+    def __init__(self, directory: str, max_workers: int, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_workers = max(1, max_workers)
+        self.max_bytes = max_bytes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._size: Optional[int] = None
+        self._evicting = False
+
+    @staticmethod
+    def filename(bar_code: str, unique_code: str, fmt: str = "png", dpi: int = 300) -> str:
+        """Content-addressed cache file name of one rendering"""
+        if not (_SAFE_CODE.match(bar_code or "") and _SAFE_CODE.match(unique_code or "")):
+            raise ValueError("Invalid barcode")
+        if fmt not in MEDIA_TYPES:
+            raise ValueError(f"Unsupported image format: {fmt}")
+        if fmt == "svg":
+            dpi = 0  # vector output does not depend on dpi
+        digest = hashlib.sha256(f"{RENDER_VERSION}|{bar_code}|{unique_code}|{fmt}|{dpi}".encode()).hexdigest()
+        return f"{digest[:32]}.{fmt}"
+
+    def path_for(self, bar_code: str, unique_code: str, fmt: str = "png", dpi: int = 300) -> Path:
+        return self.directory / self.filename(bar_code, unique_code, fmt, dpi)
+
+    def cached_path(self, bar_code: str, unique_code: str, fmt: str = "png", dpi: int = 300) -> Optional[Path]:
+        """Path of an already rendered image (marked as recently used), or None"""
+        path = self.path_for(bar_code, unique_code, fmt, dpi)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    async def ensure_image(self, bar_code: str, unique_code: str, fmt: str = "png", dpi: int = 300) -> Path:
+        """Return the image path for a code, rendering it first if it is not cached"""
+        path = self.cached_path(bar_code, unique_code, fmt, dpi)
+        if path:
+            return path
+
+        path = self.path_for(bar_code, unique_code, fmt, dpi)
+        inflight = self._inflight.get(path.name)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._render_to(path, bar_code, fmt, dpi))
+            self._inflight[path.name] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(path.name, None))
+        # Shielded so one cancelled request does not cancel the render others wait on
+        return await asyncio.shield(inflight)
+
+    async def ensure_images(self, codes: Iterable[Tuple[str, str]], fmt: str = "png", dpi: int = 300) -> List[Path]:
+        """Render many (bar_code, unique_code) pairs concurrently across the pool"""
+        return list(await asyncio.gather(*(
+            self.ensure_image(bar_code, unique_code, fmt, dpi) for bar_code, unique_code in codes
+        )))
+
+    async def render(self, code: str, fmt: str = "png", dpi: int = 300) -> bytes:
+        """Render image bytes for a code in the process pool without caching them"""
+        return await self.run(render_barcode, code, fmt, dpi)
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> "asyncio.Future[Any]":
+        """Run a picklable, module-level function in the render pool"""
+        return asyncio.get_running_loop().run_in_executor(self._get_pool(), fn, *args)
+
+    async def _render_to(self, path: Path, bar_code: str, fmt: str, dpi: int) -> Path:
+        data = await self.render(bar_code, fmt, dpi)
+        await asyncio.to_thread(self._store, path, data)
+        logger.info(f"Rendered barcode image {path.name} ({bar_code}, {fmt}, {dpi} dpi)")
+        if self._size is not None and self._size > self.max_bytes and not self._evicting:
+            self._evicting = True
+            try:
+                await asyncio.to_thread(self._evict)
+            finally:
+                self._evicting = False
+        return path
+
+    def _store(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._cache_files())
+        write_atomic(path, data)
+        self._size += len(data)
+
+    def _cache_files(self) -> List[Tuple[float, Path, int]]:
+        files = []
+        for entry in os.scandir(self.directory):
+            if _CACHE_FILE.match(entry.name):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, Path(entry.path), stat.st_size))
+        return files
+
+    def _evict(self) -> None:
+        """Delete least recently used images until the cache is under 90% of max_bytes"""
+        started = time.perf_counter()
+        files = sorted(self._cache_files())
+        # Re-measure: other workers share the directory
+        total = sum(size for _, _, size in files)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, path, size in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        self._size = total
+        logger.info(f"Evicted {removed} barcode images in {time.perf_counter() - started:.2f}s, cache now {total} bytes")
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: workers must not inherit the server's event loop, sockets or DB pools
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Shared by the barcode routes; the pool starts on the first render and stops on shutdown
+barcode_renderer = BarcodeRenderer(
+    config.BARCODE_CACHE_DIR,
+    config.BARCODE_RENDER_WORKERS,
+    config.BARCODE_CACHE_MAX_BYTES
+)
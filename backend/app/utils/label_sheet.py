@@ -0,0 +1,109 @@
+# backend/app/utils/label_sheet.py
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
+import asyncio
+import io
+import zlib
+from backend.app.utils.barcode_renderer import render_barcode
+
+# A4 at 300 dpi, 3 x 8 labels per page
+PAGE_DPI = 300
+PAGE_SIZE = (2480, 3508)
+PAGE_MARGIN = 90
+LABEL_COLUMNS = 3
+LABEL_ROWS = 8
+LABELS_PER_PAGE = LABEL_COLUMNS * LABEL_ROWS
+
+# PDF user space is 72 points per inch
+_PAGE_POINTS = tuple(round(pixels * 72 / PAGE_DPI, 2) for pixels in PAGE_SIZE)
+
+
+def _draw_page(labels: Sequence[Dict[str, Any]]):
+    """Compose one grayscale page of labels (barcode, title, detail lines)"""
+    from PIL import Image, ImageDraw, ImageFont
+
+    page = Image.new("L", PAGE_SIZE, 255)
+    draw = ImageDraw.Draw(page)
+    title_font = ImageFont.load_default(size=34)
+    line_font = ImageFont.load_default(size=28)
+
+    cell_width = (PAGE_SIZE[0] - 2 * PAGE_MARGIN) // LABEL_COLUMNS
+    cell_height = (PAGE_SIZE[1] - 2 * PAGE_MARGIN) // LABEL_ROWS
+    for position, label in enumerate(labels):
+        left = PAGE_MARGIN + (position % LABEL_COLUMNS) * cell_width
+        top = PAGE_MARGIN + (position // LABEL_COLUMNS) * cell_height
+        draw.rectangle((left + 8, top + 8, left + cell_width - 8, top + cell_height - 8), outline=200, width=2)
+
+        barcode = Image.open(io.BytesIO(render_barcode(label["code"], "png", PAGE_DPI))).convert("L")
+        # Only ever shrink, with NEAREST so bars stay sharp
+        barcode.thumbnail((cell_width - 40, cell_height - 150), Image.NEAREST)
+        page.paste(barcode, (left + (cell_width - barcode.width) // 2, top + 20))
+
+        text_top = top + 30 + barcode.height
+        draw.text((left + 24, text_top), str(label.get("title") or "")[:32], fill=0, font=title_font)
+        for offset, line in enumerate(label.get("lines", [])[:2]):
+            draw.text((left + 24, text_top + 42 + offset * 34), str(line)[:40], fill=60, font=line_font)
+    return page
+
+
+def render_label_page_png(labels: Sequence[Dict[str, Any]]) -> bytes:
+    """PNG of one label page (runs in the render process pool)"""
+    buffer = io.BytesIO()
+    _draw_page(labels).save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def render_label_page_raw(labels: Sequence[Dict[str, Any]]) -> Tuple[int, int, bytes]:
+    """(width, height, zlib-compressed 8-bit gray pixels) of one page, ready to embed in a PDF"""
+    page = _draw_page(labels)
+    return page.width, page.height, zlib.compress(page.tobytes(), 6)
+
+
+def paginate(labels: Sequence[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    return [list(labels[offset:offset + LABELS_PER_PAGE]) for offset in range(0, len(labels), LABELS_PER_PAGE)]
+
+
+async def stream_pdf(pages: Sequence[Any]) -> AsyncIterator[bytes]:
+    """
+    Stream a PDF whose pages are the awaited results of `pages` (render_label_page_raw output).
+    Every page is emitted as soon as it and all pages before it are rendered, so the
+    response starts while later pages are still rendering.
+    """
+    offsets: Dict[int, int] = {}
+    written = 0
+
+    def emit(obj_number: int, body: bytes) -> bytes:
+        nonlocal written
+        offsets[obj_number] = written
+        chunk = f"{obj_number} 0 obj\n".encode() + body + b"\nendobj\n"
+        written += len(chunk)
+        return chunk
+
+    header = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+    written = len(header)
+    yield header + emit(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    kids = []
+    for index, page in enumerate(pages):
+        width, height, pixels = await page
+        image_obj, content_obj, page_obj = 3 + index * 3, 4 + index * 3, 5 + index * 3
+        content = f"q {_PAGE_POINTS[0]} 0 0 {_PAGE_POINTS[1]} 0 0 cm /Im0 Do Q".encode()
+        chunk = emit(image_obj, (
+            f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+            f"/ColorSpace /DeviceGray /BitsPerComponent 8 /Filter /FlateDecode /Length {len(pixels)} >>\nstream\n"
+        ).encode() + pixels + b"\nendstream")
+        chunk += emit(content_obj, f"<< /Length {len(content)} >>\nstream\n".encode() + content + b"\nendstream")
+        chunk += emit(page_obj, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {_PAGE_POINTS[0]} {_PAGE_POINTS[1]}] "
+            f"/Resources << /XObject << /Im0 {image_obj} 0 R >> >> /Contents {content_obj} 0 R >>"
+        ).encode())
+        kids.append(f"{page_obj} 0 R")
+        yield chunk
+
+    tail = emit(2, f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode())
+    xref_offset = written
+    count = max(offsets) + 1
+    xref = [f"xref\n0 {count}\n", "0000000000 65535 f \n"]
+    xref += [f"{offsets[number]:010d} 00000 n \n" for number in range(1, count)]
+    tail += "".join(xref).encode()
+    tail += f"trailer\n<< /Size {count} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    yield tail
@@ -0,0 +1,65 @@
+# backend/app/utils/lookup_cache.py
+from typing import Any, Dict, Hashable, Optional
+from cachetools import TTLCache
+from backend.app import config
+import logging
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class LookupCache:
+    """
+    Bounded in-process cache (LRU eviction + per-entry TTL) for hot point lookups.
+
+    Each worker process has its own copy: writes made in this process invalidate it
+    immediately, writes made by other workers become visible once the TTL expires.
+    A TTL of 0 disables caching.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = maxsize > 0 and ttl > 0
+        self._cache = TTLCache(maxsize=max(maxsize, 1), ttl=max(ttl, 0.001))
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for `key`, or None on a miss"""
+        if not self.enabled:
+            return None
+        value = self._cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.enabled and value is not None:
+            self._cache[key] = value
+
+    def invalidate(self, *keys: Hashable) -> None:
+        for key in keys:
+            self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit-rate counters since process start"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._cache),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Entry inventory lookups, keyed by (field, value): ("inventory_id", ...), ("product_id", ...), ("bar_code", ...)
+inventory_lookup_cache = LookupCache(config.LOOKUP_CACHE_SIZE, config.LOOKUP_CACHE_TTL_SECONDS)
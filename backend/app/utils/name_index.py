@@ -0,0 +1,182 @@
+# backend/app/utils/name_index.py
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+from backend.app import config
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Most names scored per search; larger indexes first keep the names sharing the most trigrams with the query
+MAX_SCORED_NAMES = 1000
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Character trigrams of an already normalised name, padded so word edges count"""
+    padded = f" {text} "
+    return {padded[offset:offset + 3] for offset in range(len(padded) - 2)}
+
+
+class FuzzyNameIndex:
+    """
+    In-process, typo-tolerant index over inventory names.
+
+    - Normalised names live in one flat choices array scored with RapidFuzz
+      `process.extract` (WRatio); freed slots hold None, which RapidFuzz skips
+    - Once the index holds more than MAX_SCORED_NAMES names, trigram postings
+      pick the candidates sharing the most trigrams with the query before scoring
+    - Writes made in this worker are applied at once with `upsert` / `remove`;
+      rows written by other workers are picked up by the caller's periodic
+      `updated_at` refresh, and deletes by the periodic full rebuild
+    """
+
+    def __init__(self, refresh_seconds: float, rebuild_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self.lock = asyncio.Lock()
+        self.watermark: Any = None
+        self._built_at: Optional[float] = None
+        self._refreshed_at = 0.0
+        self._choices: List[Optional[str]] = []
+        self._records: List[Optional[Dict[str, Any]]] = []
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._postings: Dict[str, Set[int]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._built_at is not None
+
+    def needs_rebuild(self) -> bool:
+        return not self.loaded or time.monotonic() - self._built_at > self.rebuild_seconds
+
+    def needs_refresh(self) -> bool:
+        return time.monotonic() - self._refreshed_at > self.refresh_seconds
+
+    # ------------------------
+    # WRITE OPERATIONS
+    # ------------------------
+
+    def blank(self) -> "FuzzyNameIndex":
+        """
+        An empty index with the same settings, to be filled with `extend` chunk by
+        chunk while searches keep reading this one; `install` it once complete.
+        """
+        return FuzzyNameIndex(self.refresh_seconds, self.rebuild_seconds)
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Add (or rename) `records`, dicts carrying at least inventory_id and name"""
+        for record in records:
+            self.remove(record['inventory_id'])
+            self._put(record)
+
+    def install(self, fresh: "FuzzyNameIndex", watermark: Any = None) -> None:
+        """Swap in the names of a `blank` index filled by `extend`, marking this index built and refreshed"""
+        self._choices, self._records, self._slots, self._free, self._postings = (
+            fresh._choices, fresh._records, fresh._slots, fresh._free, fresh._postings
+        )
+        self.watermark = watermark
+        self._built_at = self._refreshed_at = time.monotonic()
+        logger.info(f"Installed fuzzy name index over {len(self._slots)} names")
+
+    def refreshed(self, watermark: Any) -> None:
+        """Mark rows changed since the last refresh as applied (via `extend`) and advance the watermark"""
+        if watermark is not None:
+            self.watermark = max(watermark, self.watermark) if self.watermark is not None else watermark
+        self._refreshed_at = time.monotonic()
+
+    def upsert(self, record: Dict[str, Any]) -> None:
+        """Add or rename one entry (ignored until the index is first built)"""
+        if self.loaded:
+            self.extend([record])
+
+    def remove(self, inventory_id: str) -> None:
+        slot = self._slots.pop(inventory_id, None)
+        if slot is None:
+            return
+        for gram in _trigrams(self._choices[slot]):
+            postings = self._postings.get(gram)
+            if postings:
+                postings.discard(slot)
+                if not postings:
+                    del self._postings[gram]
+        self._choices[slot] = None
+        self._records[slot] = None
+        self._free.append(slot)
+
+    def _put(self, record: Dict[str, Any]) -> None:
+        choice = default_process(record.get('name') or '')
+        if not choice:
+            return
+        if self._free:
+            slot = self._free.pop()
+            self._choices[slot], self._records[slot] = choice, record
+        else:
+            slot = len(self._choices)
+            self._choices.append(choice)
+            self._records.append(record)
+        self._slots[record['inventory_id']] = slot
+        for gram in _trigrams(choice):
+            self._postings.setdefault(gram, set()).add(slot)
+
+    # ------------------------
+    # READ OPERATIONS
+    # ------------------------
+
+    def search(self, query: str, limit: int, score_cutoff: float = 0) -> List[Tuple[Dict[str, Any], float]]:
+        """Top `limit` (record, score) pairs for `query`, best first"""
+        query = default_process(query or '')
+        if not query or not self._slots:
+            return []
+
+        choices = self._choices
+        if len(self._slots) > MAX_SCORED_NAMES:
+            choices = {slot: self._choices[slot] for slot in self._candidates(query)}
+
+        matches = process.extract(
+            query, choices, scorer=fuzz.WRatio, processor=None, limit=None, score_cutoff=score_cutoff
+        )
+        if len(matches) > limit:
+            # WRatio scores partial matches in coarse steps, so ties are common: order
+            # everything tied with the last kept match by whole-string similarity as well
+            floor = matches[limit - 1][1]
+            tied = [match for match in matches if match[1] >= floor]
+            tied.sort(key=lambda match: (match[1], fuzz.ratio(query, match[0])), reverse=True)
+            matches = tied[:limit]
+        return [(self._records[slot], score) for _, score, slot in matches]
+
+    def _candidates(self, query: str) -> List[int]:
+        """Slots of the (at most MAX_SCORED_NAMES) names sharing the most trigrams with `query`"""
+        shared = Counter()
+        for gram in _trigrams(query):
+            shared.update(self._postings.get(gram, ()))
+        if len(shared) <= MAX_SCORED_NAMES:
+            return list(shared)
+
+        # Lowest shared count that still fills MAX_SCORED_NAMES, found from a histogram instead of a sort
+        histogram = Counter(shared.values())
+        threshold, kept = 0, 0
+        for threshold in sorted(histogram, reverse=True):
+            kept += histogram[threshold]
+            if kept >= MAX_SCORED_NAMES:
+                break
+        # Everything above the threshold fits; only slots tied at it are cut to fill the remaining room
+        above = [slot for slot, count in shared.items() if count > threshold]
+        tied = [slot for slot, count in shared.items() if count == threshold]
+        return above + tied[:MAX_SCORED_NAMES - len(above)]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "names": len(self._slots),
+            "trigrams": len(self._postings),
+            "watermark": self.watermark,
+        }
+
+
+# Item names of entry_inventory, shared by the entry service in this worker
+fuzzy_name_index = FuzzyNameIndex(config.FUZZY_INDEX_REFRESH_SECONDS, config.FUZZY_INDEX_REBUILD_SECONDS)
@@ -0,0 +1,24 @@
+# backend/app/utils/pagination.py
+
+import base64
+import json
+from typing import Any, Tuple
+
+
+def encode_cursor(**fields: Any) -> str:
+    """Encode the sort key of the last row on a page into an opaque, URL-safe cursor"""
+    payload = json.dumps(fields, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *fields: str) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by `encode_cursor` and return the requested fields in order.
+    Raises ValueError for malformed or foreign cursors.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return tuple(payload[field] for field in fields)
+    except Exception as e:
+        raise ValueError(f"Invalid pagination cursor: {e}")